@@ -5,11 +5,14 @@ Spec: spec/api/file-content.md
 """
 
 import os
-from fastapi import APIRouter, HTTPException, status, Depends
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Request, Response, status, Depends
+from fastapi.responses import FileResponse, JSONResponse
 from sqlalchemy.orm import Session
 from app.db.database import get_db
+from app.utils.http_cache import CACHE_CONTROL, file_etag, is_not_modified, not_modified_response, set_etag_headers
 
+from app.services.allowed_roots import allowed_roots
+from app.services.content_cache import content_cache
 from app.services.folder_service import FolderService
 from app.repositories.folder_repository import FolderRepository
 
@@ -20,91 +23,169 @@ router = APIRouter()
     "",
     responses={
         200: {"description": "파일 내용 반환"},
+        304: {"description": "변경 없음 (If-None-Match 일치)"},
         400: {"description": "잘못된 요청"},
         403: {"description": "접근 권한 없음"},
         404: {"description": "파일 없음"},
     }
 )
-async def get_file_content(path: str = None, db: Session = Depends(get_db)):
+async def get_file_content(
+    request: Request,
+    response: Response,
+    path: str = None,
+    db: Session = Depends(get_db),
+):
     """
     파일 내용 조회 API
     
     파일 절대 경로를 받아 해당 파일의 내용을 반환합니다.
     경로는 반드시 등록된 폴더 하위에 있어야 합니다.
+    (inode, mtime, size) 기반 ETag를 제공하며, If-None-Match 일치 시 304를 반환합니다.
+    """
+    # 1~5. 파라미터 / 접근 권한 / 파일 검사
+    real_path, error = _validate_file_path(path, db)
+    if error is not None:
+        return error
+
+    # 6. 변경 여부 확인 (ETag) - 읽기 전에 stat하여 ETag가 내용보다 새로워지지 않도록 함
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"error": "file not found", "code": "NOT_FOUND"}
+        )
+    etag = file_etag(stat_result)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+
+    # 7. 파일 읽기 (stat 검증된 내용 캐시 우선)
+    try:
+        content = content_cache.get(real_path, stat_result)
+        if content is None:
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+            content_cache.put(real_path, stat_result, content)
+            
+        set_etag_headers(response, etag)
+        return {"content": content}
+    except Exception as e:
+        # 예기치 못한 파일 읽기 에러
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={"error": "file read error", "code": "INTERNAL_SERVER_ERROR"}
+        )
+
+
+def _validate_file_path(path: str | None, db: Session) -> tuple[str | None, JSONResponse | None]:
+    """
+    파일 경로 검사 (GET /api/files, GET /api/files/raw 공통)
+
+    Returns:
+        (실제 경로, 에러 응답) - 검사 통과 시 에러 응답은 None
     """
     # 1. 파라미터 체크
     if not path:
-        return JSONResponse(
+        return None, JSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content={"error": "path is required", "code": "BAD_REQUEST"}
         )
 
     # 2. 허용된 폴더 경로인지 확인 (보안)
-    repository = FolderRepository(db)
-    from app.services.file_watcher import file_watcher
-    from app.core.config import settings
-    service = FolderService(repository, file_watcher, settings)
-    registered_folders = service.list_folders()
-    
+    # 등록 폴더 실제 경로 트라이로 검사 (DB 조회 없이 realpath 1회 + O(depth))
+    if not allowed_roots.loaded:
+        # 시작 시 초기화가 실패한 경우에만 DB 기준으로 구성
+        repository = FolderRepository(db)
+        from app.services.file_watcher import file_watcher
+        from app.core.config import settings
+        service = FolderService(repository, file_watcher, settings, allowed_roots)
+        allowed_roots.replace(folder.path for folder in service.list_folders())
+
     # 실제 경로로 정규화
+    # 구성요소 단위 비교이므로 /tmp/foo 등록 시 /tmp/foobar 는 허용되지 않음
     real_path = os.path.realpath(path)
-    
-    is_allowed = False
-    for folder in registered_folders:
-        # 폴더 경로 정규화
-        folder_real = os.path.realpath(folder.path)
-        
-        # 파일 경로가 폴더 경로로 시작하는지 확인
-        # os.sep을 붙여서 정확한 하위 경로인지 확인 (/tmp/foo vs /tmp/foobar)
-        if real_path.startswith(folder_real + os.sep) or real_path == folder_real:
-             # 폴더 루트 자체는 파일이 아니므로 startswith(folder + sep) 만으로 충분하지만
-             # 혹시 모를 에러 방지를 위해 방어적으로 작성. 
-             # 실제 파일은 하위에 있으므로 startswith가 맞음.
-             is_allowed = True
-             break
-    
+    is_allowed = allowed_roots.is_allowed(real_path)
+
     if not is_allowed:
-         return JSONResponse(
+         return None, JSONResponse(
             status_code=status.HTTP_403_FORBIDDEN,
             content={"error": "access denied", "code": "FORBIDDEN"}
         )
 
     # 3. 심볼릭 링크 체크 (보안 - Spec Edge Case)
     if os.path.islink(path):
-        return JSONResponse(
+        return None, JSONResponse(
             status_code=status.HTTP_403_FORBIDDEN,
             content={"error": "access denied", "code": "FORBIDDEN"}
         )
 
     # 4. 파일 확인 (존재 여부, 디렉토리 여부)
     if not os.path.exists(path):
-        return JSONResponse(
+        return None, JSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"error": "file not found", "code": "NOT_FOUND"}
         )
         
     if os.path.isdir(path):
-        return JSONResponse(
+        return None, JSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content={"error": "path is not a file", "code": "BAD_REQUEST"}
         )
 
     # 5. 마크다운 확장자 체크 (Spec Req)
     if not path.endswith(".md"):
-        return JSONResponse(
+        return None, JSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content={"error": "only markdown files allowed", "code": "BAD_REQUEST"}
         )
-            
-    # 6. 파일 읽기
+
+    return real_path, None
+
+
+@router.get(
+    "/raw",
+    response_class=FileResponse,
+    responses={
+        200: {"description": "파일 원본 (text/markdown)"},
+        206: {"description": "부분 내용 (Range 요청)"},
+        304: {"description": "변경 없음 (If-None-Match 일치)"},
+        400: {"description": "잘못된 요청"},
+        403: {"description": "접근 권한 없음"},
+        404: {"description": "파일 없음"},
+        416: {"description": "범위 오류"},
+    }
+)
+async def get_file_raw(
+    request: Request,
+    path: str = None,
+    db: Session = Depends(get_db),
+):
+    """
+    파일 원본 스트리밍 API
+
+    GET /api/files 와 동일한 검사를 거친 뒤 파일을 JSON 변환 없이 그대로 전송합니다.
+    Content-Length / Range(206) 를 지원하며, 서버가 pathsend 확장을 지원하면
+    sendfile로 전송하므로 파일 크기와 무관하게 메모리 사용량이 일정합니다.
+    """
+    _, error = _validate_file_path(path, db)
+    if error is not None:
+        return error
+
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            content = f.read()
-            
-        return {"content": content}
-    except Exception as e:
-        # 예기치 못한 파일 읽기 에러
+        stat_result = os.stat(path)
+    except OSError:
         return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={"error": "file read error", "code": "INTERNAL_SERVER_ERROR"}
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"error": "file not found", "code": "NOT_FOUND"}
         )
+    etag = file_etag(stat_result)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+
+    # stat_result를 넘겨 FileResponse가 다시 stat하지 않도록 함 (ETag와 Content-Length 일치)
+    return FileResponse(
+        path,
+        media_type="text/markdown; charset=utf-8",
+        stat_result=stat_result,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
@@ -4,7 +4,7 @@
 Spec: spec/api/folder-register.md
 """
 
-from fastapi import APIRouter, HTTPException, Request, status, Depends
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status, Depends
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
@@ -19,7 +19,11 @@ from app.services.folder_service import (
     PathDeniedError,
 )
 from app.repositories.folder_repository import FolderRepository
+from app.services.allowed_roots import allowed_roots
 from app.services.file_watcher import file_watcher
+from app.services.search_indexer import search_indexer
+from app.services.tree_cache import tree_cache
+from app.utils.http_cache import is_not_modified, make_etag, not_modified_response, set_etag_headers
 from app.core.config import settings
 
 router = APIRouter()
@@ -42,7 +46,7 @@ async def register_folder(folder_data: FolderCreate, db: Session = Depends(get_d
     # DB 세션 및 서비스 호출
     try:
         repository = FolderRepository(db)
-        service = FolderService(repository, file_watcher, settings)
+        service = FolderService(repository, file_watcher, settings, allowed_roots, search_indexer)
         return service.register_folder(folder_data)
     except PathNotExistsError:
         raise HTTPException(
@@ -76,7 +80,7 @@ async def register_folder(folder_data: FolderCreate, db: Session = Depends(get_d
 async def list_folders(db: Session = Depends(get_db)):
     """폴더 목록 조회 API"""
     repository = FolderRepository(db)
-    service = FolderService(repository, file_watcher, settings)
+    service = FolderService(repository, file_watcher, settings, allowed_roots)
     folders = service.list_folders()
     return FolderListResponse(
         folders=[
@@ -96,21 +100,35 @@ async def list_folders(db: Session = Depends(get_db)):
     response_model=None,
     responses={
         200: {"description": "트리 구조 반환"},
+        304: {"description": "변경 없음 (If-None-Match 일치)"},
+        400: {"description": "잘못된 하위 경로"},
         404: {"description": "폴더 없음"},
     },
 )
-async def get_folder_tree(folder_id: int, md_only: bool = True, db: Session = Depends(get_db)):
+async def get_folder_tree(
+    request: Request,
+    folder_id: int,
+    md_only: bool = True,
+    depth: int | None = Query(default=None, ge=1),
+    subpath: str = "",
+    db: Session = Depends(get_db),
+):
     """
     폴더 트리 조회 API
 
     Spec: spec/api/folder-tree.md
+
+    - depth: 지정 시 subpath 기준 N단계까지만 반환, 경계 폴더는 has_children만 표시
+    - subpath: 폴더 기준 상대 경로 (펼친 하위 폴더만 조회)
+    - 감시 중인 폴더는 트리 generation 기반 ETag 제공 (If-None-Match 일치 시 304)
+    - null 필드는 생략 (파일의 children, 폴더의 path, depth 경계가 아닌 폴더의 has_children)
     """
     import os
-    from app.utils.tree_builder import build_tree
+    from app.utils.tree_builder import build_tree, normalize_subpath
     from app.schemas.folder import FolderTreeResponse
 
     repository = FolderRepository(db)
-    service = FolderService(repository, file_watcher, settings)
+    service = FolderService(repository, file_watcher, settings, allowed_roots)
 
     # 폴더 조회
     folder = service.get_folder_by_id(folder_id)
@@ -127,15 +145,48 @@ async def get_folder_tree(folder_id: int, md_only: bool = True, db: Session = De
             detail="folder path does not exist"
         )
 
-    # 트리 구조 생성
-    tree = build_tree(folder.path, md_only)
+    # 하위 경로 검증 (폴더 밖 접근 및 트리 제외 경로 차단)
+    rel_path = normalize_subpath(subpath)
+    if rel_path is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="invalid subpath"
+        )
+
+    # 트리 구조 생성 (감시 중인 폴더는 이벤트로 갱신되는 캐시 사용)
+    # 폴링 감시는 .md 파일만 추적하므로 전체 파일 트리는 매번 탐색
+    etag = None
+    if file_watcher.is_watching(folder.id) and (md_only or file_watcher.tracks_all_files):
+        # generation은 트리 조회 전에 읽어야 ETag가 실제 내용보다 새로워지지 않음
+        etag = make_etag("tree", tree_cache.epoch, folder.id, tree_cache.generation(folder.id))
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        tree = tree_cache.get_tree(folder.id, folder.path, md_only, rel_path, depth)
+    else:
+        target_path = os.path.join(folder.path, rel_path) if rel_path else folder.path
+        # 심볼릭 링크를 거치는 하위 경로는 트리에 없으므로 제외
+        is_tree_dir = os.path.isdir(target_path) and os.path.realpath(target_path) == os.path.join(
+            os.path.realpath(folder.path), rel_path
+        ).rstrip(os.sep)
+        tree = build_tree(target_path, md_only, settings.TREE_SCAN_WORKERS, depth) if is_tree_dir else None
+
+    if tree is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="subpath not found"
+        )
 
-    return FolderTreeResponse(
+    result = FolderTreeResponse(
         id=folder.id,
         name=folder.name,
         path=folder.path,
         tree=tree,
     )
+    # response_model=None(304 응답 지원)이라 직접 직렬화 (jsonable_encoder 경유보다 빠름)
+    response = Response(content=result.model_dump_json(exclude_none=True), media_type="application/json")
+    if etag is not None:
+        set_etag_headers(response, etag)
+    return response
 
 
 @router.delete(
@@ -159,7 +210,7 @@ async def delete_folder(folder_id: int, db: Session = Depends(get_db)):
         )
 
     repository = FolderRepository(db)
-    service = FolderService(repository, file_watcher, settings)
+    service = FolderService(repository, file_watcher, settings, allowed_roots, search_indexer)
     
     # 존재 확인
     folder = service.get_folder_by_id(folder_id)
@@ -0,0 +1,45 @@
+"""
+빠른 열기 API 라우터
+
+감시 중인 폴더 전체 마크다운 경로 퍼지 검색 (Ctrl+P)
+"""
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.schemas.quick_open import QuickOpenResponse, QuickOpenResult
+from app.services.quick_open import quick_open_index
+from app.utils.fuzzy_index import normalize_query
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    response_model=QuickOpenResponse,
+    responses={
+        200: {"description": "점수 순 경로 목록"},
+        400: {"description": "검색어 없음"},
+    },
+)
+async def quick_open(
+    q: str = Query("", max_length=200, description="검색어 (부분 수열 일치, 대소문자/공백 무시)"),
+    limit: int = Query(20, ge=1, le=100, description="최대 결과 수"),
+    folder_id: int | None = Query(None, description="지정 시 해당 폴더만 검색"),
+) -> QuickOpenResponse:
+    """
+    빠른 열기 API
+
+    - 메모리 인덱스 검색 (파일 시스템/DB 접근 없음, 키 입력마다 호출 가능)
+    - 파일 이름 시작, 단어 경계, 연속 일치에 가산점
+    - 폴더 등록 직후에는 탐색 완료 전까지 결과가 일부만 나올 수 있음
+    """
+    if not normalize_query(q):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="q is required"
+        )
+
+    return QuickOpenResponse(
+        query=q,
+        results=[QuickOpenResult(**result) for result in quick_open_index.search(q, limit, folder_id)],
+    )
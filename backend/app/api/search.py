@@ -0,0 +1,60 @@
+"""
+검색 API 라우터
+
+등록 폴더 전체 마크다운 전문 검색 (SQLite FTS5)
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.db.database import get_db
+from app.repositories.search_repository import SearchRepository
+from app.schemas.search import SearchResponse, SearchResult
+from app.utils.search_query import build_match_query, split_highlight
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    response_model=SearchResponse,
+    responses={
+        200: {"description": "관련도 순 검색 결과"},
+        400: {"description": "검색어 없음"},
+    },
+)
+async def search(
+    q: str = Query("", max_length=200, description="검색어 (단어별 접두어 일치, AND)"),
+    limit: int = Query(20, ge=1, le=100, description="최대 결과 수"),
+    folder_id: int | None = Query(None, description="지정 시 해당 폴더만 검색"),
+    db: Session = Depends(get_db),
+) -> SearchResponse:
+    """
+    전문 검색 API
+
+    - 백그라운드 인덱서가 색인한 문서 대상 (등록 직후에는 색인 완료 전까지 결과가 일부만 나올 수 있음)
+    - 제목 일치에 가중치를 둔 bm25 순위
+    - title/snippet은 일치 구간이 표시된 구간 목록 (HTML 없이 렌더링)
+    """
+    match_query = build_match_query(q)
+    if match_query is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="q is required"
+        )
+
+    rows = SearchRepository(db).search(match_query, limit, folder_id)
+    return SearchResponse(
+        query=q,
+        results=[
+            SearchResult(
+                folder_id=row["folder_id"],
+                path=row["path"],
+                title=split_highlight(row["title"]),
+                snippet=split_highlight(row["snippet"]),
+                # bm25는 낮을수록 관련도가 높으므로 부호 반전
+                score=-row["score"],
+            )
+            for row in rows
+        ],
+    )
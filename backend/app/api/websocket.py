@@ -3,31 +3,148 @@ WebSocket 엔드포인트
 
 Spec: spec/api/file-watch-websocket.md - 섹션 4
 파일 변경 이벤트를 클라이언트에 실시간 전달
+
+클라이언트 메시지 (JSON 텍스트)
+- {"type": "subscribe", "folder_ids": [1, 2]}: 폴더 이벤트 구독
+- {"type": "unsubscribe", "folder_ids": [1]}: 폴더 이벤트 구독 해제
+- 응답: {"type": "subscriptions", "folder_ids": [...]} (현재 구독 목록)
+- {"type": "view_file", "path": "..."}: 열람 파일 변경분 수신 (옵트인)
+  응답: {"type": "file_version", "path": "...", "hash": "<sha256>"} (서버 기준 버전)
+  수정 시: {"type": "file_delta", "path", "base_hash", "hash", "ops": [[시작 줄, 끝 줄, 텍스트]]}
+  (변경분이 더 크면 ops 대신 "content")
+- {"type": "unview_file", "path": "..."}: 열람 해제
+- 그 외 텍스트(ping 등)는 keep-alive로 무시
+
+재연결: /ws/watch?since=<seq>&folder_ids=1,2
+- 마지막으로 받은 이벤트 seq 이후의 이벤트만 재전송
+- folder_ids가 있으면 해당 폴더를 구독한 상태로 연결 (다른 폴더 이벤트는 재전송하지 않음)
+- 재전송할 수 없으면 {"type": "resync_required", "seq": <현재 seq>} 전송
 """
 
+import json
+from typing import Any
+
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from loguru import logger
+from starlette.websockets import WebSocketState
 
 from app.services.connection_manager import manager
+from app.services.content_delta import content_deltas
 from app.services.file_watcher import file_watcher
 
 
 router = APIRouter()
 
 
+def _parse_folder_ids(value: Any) -> list[int] | None:
+    """folder_ids 검증 (정수 목록이 아니면 None)"""
+    if not isinstance(value, list):
+        return None
+    if not all(isinstance(item, int) and not isinstance(item, bool) for item in value):
+        return None
+    return value
+
+
+def _parse_folder_ids_query(value: str | None) -> list[int] | None:
+    """folder_ids 쿼리 파라미터 (쉼표 구분, 빈 문자열은 빈 목록) 검증 (정수 목록이 아니면 None)"""
+    if value is None:
+        return None
+    try:
+        return [int(item) for item in value.split(",") if item]
+    except ValueError:
+        return None
+
+
+async def _handle_client_message(websocket: WebSocket, text: str) -> None:
+    """
+    클라이언트 메시지 처리 (구독/구독 해제)
+
+    Args:
+        websocket: 메시지를 보낸 클라이언트
+        text: 수신한 텍스트
+    """
+    try:
+        message = json.loads(text)
+    except ValueError:
+        return  # JSON이 아닌 keep-alive 텍스트
+    if not isinstance(message, dict):
+        return
+    if message.get("type") in ("view_file", "unview_file"):
+        await _handle_view_message(websocket, message)
+        return
+    if message.get("type") not in ("subscribe", "unsubscribe"):
+        return
+
+    folder_ids = _parse_folder_ids(message.get("folder_ids"))
+    if folder_ids is None:
+        await manager.send(websocket, {
+            "type": "error",
+            "error": "folder_ids는 정수 목록이어야 합니다",
+            "code": "INVALID_SUBSCRIPTION",
+        })
+        return
+
+    if message["type"] == "subscribe":
+        current = await manager.subscribe(websocket, folder_ids)
+    else:
+        current = await manager.unsubscribe(websocket, folder_ids)
+    _sync_poll_activity()
+    await manager.send(websocket, {"type": "subscriptions", "folder_ids": sorted(current)})
+
+
+async def _handle_view_message(websocket: WebSocket, message: dict[str, Any]) -> None:
+    """열람 파일 등록/해제 처리 (변경분 전송 옵트인)"""
+    path = message.get("path")
+    if not isinstance(path, str) or not path:
+        await manager.send(websocket, {
+            "type": "error",
+            "error": "path는 문자열이어야 합니다",
+            "code": "INVALID_VIEW",
+        })
+        return
+
+    if message["type"] == "unview_file":
+        await content_deltas.unview(websocket, path)
+        return
+
+    digest = await content_deltas.view(websocket, path)
+    if digest is None:
+        await manager.send(websocket, {
+            "type": "error",
+            "error": "변경분을 받을 수 없는 파일입니다",
+            "code": "INVALID_VIEW",
+            "path": path,
+        })
+        return
+    await manager.send(websocket, {"type": "file_version", "path": path, "hash": digest})
+
+
+def _sync_poll_activity() -> None:
+    """구독 상태를 폴링 감시에 반영 (구독자가 있는 폴더만 짧은 주기 유지)"""
+    file_watcher.set_active_folders(manager.active_folder_ids)
+
+
 @router.websocket("/ws/watch")
-async def websocket_endpoint(websocket: WebSocket) -> None:
+async def websocket_endpoint(
+    websocket: WebSocket, since: int | None = None, folder_ids: str | None = None
+) -> None:
     """
     파일 변경 감시 WebSocket 엔드포인트
     
     연결 시:
     - ConnectionManager에 클라이언트 등록
+    - since가 있으면 놓친 이벤트 재전송 (folder_ids가 있으면 구독 폴더 이벤트만)
     - 현재 감시 중인 폴더 수 로깅
+    - 폴링 감시를 최소 주기로 복귀 (구독 전에는 전체 폴더, 구독 후에는 구독 폴더만)
+    - 구독 메시지 수신 시 해당 폴더 이벤트만 전달
     
     연결 해제 시:
     - ConnectionManager에서 클라이언트 제거
+    - 열람 파일(변경분 전송) 정보 제거
+    - 구독자가 없어진 폴더는 폴링 주기 상한 해제
     """
-    await manager.connect(websocket)
+    await manager.connect(websocket, since=since, folder_ids=_parse_folder_ids_query(folder_ids))
+    _sync_poll_activity()
     
     logger.info(
         f"WebSocket 클라이언트 연결 - "
@@ -37,12 +154,22 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     
     try:
         while True:
-            # 클라이언트로부터 메시지 수신 대기 (keep-alive)
-            # 클라이언트는 ping을 보내거나 단순히 연결 유지
-            await websocket.receive_text()
+            # 클라이언트로부터 메시지 수신 대기 (구독 메시지 또는 keep-alive)
+            text = await websocket.receive_text()
+            await _handle_client_message(websocket, text)
     except WebSocketDisconnect:
         await manager.disconnect(websocket)
         logger.info(f"WebSocket 클라이언트 연결 해제 - 남은 연결: {manager.connection_count}")
+    except RuntimeError as e:
+        # 송신 task가 느린/전송 실패 클라이언트를 끊고 소켓을 닫은 뒤의 수신 오류 (정상 종료 경로)
+        await manager.disconnect(websocket)
+        if websocket.application_state == WebSocketState.DISCONNECTED:
+            logger.debug(f"WebSocket 송신 측에서 종료된 연결: {e}")
+        else:
+            logger.exception(f"WebSocket 오류: {e}")
     except Exception as e:
         logger.exception(f"WebSocket 오류: {e}")
         await manager.disconnect(websocket)
+    finally:
+        await content_deltas.forget(websocket)
+        _sync_poll_activity()
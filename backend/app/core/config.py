@@ -16,9 +16,38 @@ class Settings(BaseSettings):
     WATCHDOG_USE_POLLING: bool = False
     DEBUG: bool = False
 
+    # 트리 탐색 스레드 수 (1이면 순차 탐색, 네트워크/바인드 마운트는 4~8 권장)
+    TREE_SCAN_WORKERS: int = 1
+
+    # 파일 내용 캐시 바이트 예산 (0이면 캐싱 안 함)
+    CONTENT_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+
+    # WebSocket 변경분 전송 대상 파일 최대 크기 (view_file 옵트인, 0이면 비활성)
+    CONTENT_DELTA_MAX_BYTES: int = 8 * 1024 * 1024
+
+    # 검색 색인 본문 최대 크기 (초과 파일은 제목만 색인)
+    SEARCH_INDEX_MAX_FILE_BYTES: int = 2 * 1024 * 1024
+
+    # 폴링 감시 주기 (초, WATCHDOG_USE_POLLING=true일 때)
+    # 변경이 없으면 MIN부터 2배씩 MAX까지 늘리고, 변경 감지 시 MIN으로 복귀
+    # WebSocket 클라이언트가 연결되어 있는 동안은 ACTIVE_MAX가 상한
+    WATCH_POLL_MIN_INTERVAL: float = 1.0
+    WATCH_POLL_MAX_INTERVAL: float = 30.0
+    WATCH_POLL_ACTIVE_MAX_INTERVAL: float = 2.0
+
+    # WebSocket 클라이언트별 전송 제한 시간 (초, 초과 시 연결 해제)
+    WS_SEND_TIMEOUT: float = 5.0
+
+    # WebSocket 클라이언트별 송신 대기 메시지 최대 개수 (초과 시 합치거나 resync로 대체)
+    WS_QUEUE_SIZE: int = 256
+
+    # 재연결 클라이언트에 다시 보낼 수 있는 최근 이벤트 수 (?since=<seq>)
+    WS_HISTORY_SIZE: int = 1024
+
     IGNORED_DIRS: frozenset[str] = frozenset({
         'node_modules', '__pycache__', 'venv', '.venv', 'env', '.env', 
-        'dist', 'build', 'coverage', '.git', '.vscode', '.idea', '.next'
+        'dist', 'build', 'coverage', '.git', '.vscode', '.idea', '.next',
+        'target', 'out'
     })
     
     DENY_LIST: frozenset[str] = frozenset({
@@ -7,7 +7,7 @@ ORM 엔진, 세션, Base 클래스 정의
 from pathlib import Path
 from collections.abc import Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from app.core.config import settings
@@ -35,6 +35,19 @@ def get_engine():
     )
 
 
+# 전문 검색 가상 테이블 (rowid = search_documents.id)
+# unicode61 토크나이저는 한글도 공백 기준 단어로 분리 (검색어는 접두어 일치로 조회)
+SEARCH_FTS_TABLE = "search_fts"
+SEARCH_FTS_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_FTS_TABLE} "
+    "USING fts5(title, body, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+)
+# 기본 순위 함수 설정 (bm25 가중치 title 10 : body 1, ORDER BY rank로 사용)
+SEARCH_FTS_RANK_DDL = (
+    f"INSERT INTO {SEARCH_FTS_TABLE} ({SEARCH_FTS_TABLE}, rank) VALUES ('rank', 'bm25(10.0, 1.0)')"
+)
+
+
 # 전역 엔진 및 세션 팩토리
 engine = None
 SessionLocal = None
@@ -48,9 +61,39 @@ def init_db() -> None:
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
     # 모델 임포트 (테이블 생성 전에 필요)
-    from app.models import folder  # noqa: F401
+    from app.models import folder, folder_tree_snapshot, search_document  # noqa: F401
 
+    _drop_legacy_search_tables()
     Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(text(SEARCH_FTS_DDL))
+        connection.execute(text(SEARCH_FTS_RANK_DDL))
+
+
+def _drop_legacy_search_tables() -> None:
+    """
+    경로 단독 unique였던 이전 검색 색인 테이블 삭제
+
+    검색 색인은 디스크에서 다시 만들 수 있으므로 마이그레이션 대신 삭제 (시작 시 폴더 동기화로 재색인)
+    """
+    inspector = inspect(engine)
+    if "search_documents" not in inspector.get_table_names():
+        return
+    if not any(
+        constraint["column_names"] == ["path"]
+        for constraint in inspector.get_unique_constraints("search_documents")
+    ):
+        return
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE search_documents"))
+        connection.execute(text(f"DROP TABLE IF EXISTS {SEARCH_FTS_TABLE}"))
+
+
+def get_session_factory() -> sessionmaker:
+    """현재 세션 팩토리 반환 (백그라운드 작업용, 초기화 전이면 초기화)"""
+    if SessionLocal is None:
+        init_db()
+    return SessionLocal
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -1,5 +1,7 @@
 """Models Package"""
 
 from app.models.folder import Folder
+from app.models.folder_tree_snapshot import FolderTreeSnapshot
+from app.models.search_document import SearchDocument
 
-__all__ = ["Folder"]
+__all__ = ["Folder", "FolderTreeSnapshot", "SearchDocument"]
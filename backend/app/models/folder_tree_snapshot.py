@@ -0,0 +1,31 @@
+"""
+FolderTreeSnapshot ORM 모델
+
+폴더 트리 인덱스의 마지막 상태 (재시작 후 첫 트리 조회를 탐색 없이 응답)
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, Integer, LargeBinary, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.database import Base
+
+
+class FolderTreeSnapshot(Base):
+    """폴더 트리 스냅샷 테이블 모델"""
+
+    __tablename__ = "folder_tree_snapshots"
+    __table_args__ = (UniqueConstraint("folder_id", "md_only"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    folder_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    md_only: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    root: Mapped[str] = mapped_column(String(500), nullable=False)  # 저장 시점 폴더 경로 (경로가 바뀌면 무시)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)  # zlib 압축 JSON
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<FolderTreeSnapshot(folder_id={self.folder_id}, md_only={self.md_only})>"
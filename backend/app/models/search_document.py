@@ -0,0 +1,29 @@
+"""
+SearchDocument ORM 모델
+
+전문 검색 인덱스(FTS5)에 들어간 마크다운 파일 메타데이터
+본문은 search_fts 가상 테이블에 같은 rowid로 저장
+중첩 등록 폴더의 파일은 폴더별로 1행씩 (한 폴더 삭제/동기화가 다른 폴더 문서에 영향 없음)
+"""
+
+from sqlalchemy import BigInteger, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.database import Base
+
+
+class SearchDocument(Base):
+    """검색 문서 테이블 모델"""
+
+    __tablename__ = "search_documents"
+    # path 선행 인덱스: 경로 조회와 (folder_id, path) 중복 방지에 함께 사용
+    __table_args__ = (UniqueConstraint("path", "folder_id"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    folder_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    path: Mapped[str] = mapped_column(String(1000), nullable=False)
+    mtime_ns: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<SearchDocument(id={self.id}, folder_id={self.folder_id}, path='{self.path}')>"
@@ -1,5 +1,7 @@
 """Repositories Package"""
 
 from app.repositories.folder_repository import FolderRepository
+from app.repositories.search_repository import SearchRepository
+from app.repositories.tree_snapshot_repository import TreeSnapshotRepository
 
-__all__ = ["FolderRepository"]
+__all__ = ["FolderRepository", "SearchRepository", "TreeSnapshotRepository"]
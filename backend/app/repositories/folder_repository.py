@@ -9,6 +9,7 @@ from typing import Optional
 from sqlalchemy.orm import Session
 
 from app.models.folder import Folder
+from app.models.folder_tree_snapshot import FolderTreeSnapshot
 
 
 class FolderRepository:
@@ -38,9 +39,10 @@ class FolderRepository:
         return self._db.query(Folder).order_by(Folder.created_at.desc()).all()
 
     def delete(self, folder_id: int) -> bool:
-        """폴더 삭제"""
+        """폴더 삭제 (트리 스냅샷 포함)"""
         folder = self.find_by_id(folder_id)
         if folder:
+            self._db.query(FolderTreeSnapshot).filter(FolderTreeSnapshot.folder_id == folder_id).delete()
             self._db.delete(folder)
             self._db.commit()
             return True
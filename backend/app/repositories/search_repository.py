@@ -0,0 +1,179 @@
+"""
+검색 인덱스 리포지토리
+
+search_documents(메타데이터) + search_fts(FTS5 본문) 데이터 접근
+문서는 (folder_id, path)로 구분 (중첩 등록 폴더의 파일은 폴더별로 색인)
+대량 색인을 한 트랜잭션으로 묶을 수 있도록 변경 메서드는 commit하지 않음 (commit()으로 확정)
+"""
+
+import os
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import bindparam, delete, select, text
+from sqlalchemy.orm import Session
+
+from app.db.database import SEARCH_FTS_TABLE
+from app.models.search_document import SearchDocument
+from app.utils.search_query import MATCH_END, MATCH_START
+
+# 경로 목록 삭제 시 한 번에 바인드하는 개수
+_DELETE_CHUNK = 500
+
+
+class SearchRepository:
+    """검색 인덱스 데이터 접근 레이어"""
+
+    def __init__(self, db: Session) -> None:
+        self._db = db
+
+    def upsert(
+        self, folder_id: int, path: str, title: str, body: str, mtime_ns: int, size: int
+    ) -> None:
+        """폴더 문서 추가 또는 갱신"""
+        document = self._db.scalar(
+            select(SearchDocument).where(SearchDocument.path == path, SearchDocument.folder_id == folder_id)
+        )
+        if document is None:
+            document = SearchDocument(folder_id=folder_id, path=path, mtime_ns=mtime_ns, size=size)
+            self._db.add(document)
+            self._db.flush()
+        else:
+            document.mtime_ns = mtime_ns
+            document.size = size
+            self._db.execute(
+                text(f"DELETE FROM {SEARCH_FTS_TABLE} WHERE rowid = :id"), {"id": document.id}
+            )
+        self._db.execute(
+            text(f"INSERT INTO {SEARCH_FTS_TABLE} (rowid, title, body) VALUES (:id, :title, :body)"),
+            {"id": document.id, "title": title, "body": body},
+        )
+
+    def delete_paths(self, folder_id: int, paths: Iterable[str]) -> int:
+        """폴더 문서 중 경로 목록의 문서 삭제 (삭제 건수 반환)"""
+        paths = list(paths)
+        deleted = 0
+        # SQLite 바인드 변수 개수 제한을 넘지 않도록 나누어 삭제
+        for start in range(0, len(paths), _DELETE_CHUNK):
+            ids = self._db.scalars(
+                select(SearchDocument.id).where(
+                    SearchDocument.folder_id == folder_id,
+                    SearchDocument.path.in_(paths[start:start + _DELETE_CHUNK]),
+                )
+            ).all()
+            if not ids:
+                continue
+            self._db.execute(
+                text(f"DELETE FROM {SEARCH_FTS_TABLE} WHERE rowid IN :ids").bindparams(
+                    bindparam("ids", expanding=True)
+                ),
+                {"ids": ids},
+            )
+            self._db.execute(delete(SearchDocument).where(SearchDocument.id.in_(ids)))
+            deleted += len(ids)
+        return deleted
+
+    def delete_folder(self, folder_id: int) -> int:
+        """폴더의 모든 문서 삭제 (삭제 건수 반환)"""
+        self._db.execute(
+            text(
+                f"DELETE FROM {SEARCH_FTS_TABLE} WHERE rowid IN "
+                "(SELECT id FROM search_documents WHERE folder_id = :folder_id)"
+            ),
+            {"folder_id": folder_id},
+        )
+        result = self._db.execute(delete(SearchDocument).where(SearchDocument.folder_id == folder_id))
+        return result.rowcount
+
+    def stats_by_folder(self, folder_id: int) -> dict[str, tuple[int, int]]:
+        """폴더에 색인된 문서의 경로 -> (mtime_ns, size)"""
+        rows = self._db.execute(
+            select(SearchDocument.path, SearchDocument.mtime_ns, SearchDocument.size)
+            .where(SearchDocument.folder_id == folder_id)
+        )
+        return {path: (mtime_ns, size) for path, mtime_ns, size in rows}
+
+    def stats_for_paths(self, folder_id: int, paths: Iterable[str]) -> dict[str, tuple[int, int]]:
+        """경로 목록 중 폴더에 색인된 문서의 경로 -> (mtime_ns, size)"""
+        paths = list(paths)
+        stats: dict[str, tuple[int, int]] = {}
+        for start in range(0, len(paths), _DELETE_CHUNK):
+            rows = self._db.execute(
+                select(SearchDocument.path, SearchDocument.mtime_ns, SearchDocument.size)
+                .where(
+                    SearchDocument.folder_id == folder_id,
+                    SearchDocument.path.in_(paths[start:start + _DELETE_CHUNK]),
+                )
+            )
+            stats.update((path, (mtime_ns, size)) for path, mtime_ns, size in rows)
+        return stats
+
+    def stats_under(self, folder_id: int, directory: str) -> dict[str, tuple[int, int]]:
+        """디렉토리 하위에 폴더 문서로 색인된 경로 -> (mtime_ns, size)"""
+        prefix = os.path.join(directory, "")
+        # LIKE 대신 범위 조건 (경로의 와일드카드 문자 이스케이프 불필요, path 인덱스 사용)
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        rows = self._db.execute(
+            select(SearchDocument.path, SearchDocument.mtime_ns, SearchDocument.size)
+            .where(
+                SearchDocument.path >= prefix,
+                SearchDocument.path < upper,
+                SearchDocument.folder_id == folder_id,
+            )
+        )
+        return {path: (mtime_ns, size) for path, mtime_ns, size in rows}
+
+    def search(self, match_query: str, limit: int, folder_id: int | None = None) -> list[dict[str, Any]]:
+        """
+        전문 검색 (bm25 순위 - 제목 가중치 우선, 일치 구간은 MATCH_START/MATCH_END로 표시)
+
+        폴더를 지정하지 않으면 중첩 폴더에 함께 색인된 파일은 가장 먼저 색인된 문서 1건만 반환
+
+        Args:
+            match_query: FTS5 MATCH 식
+            limit: 최대 결과 수
+            folder_id: 지정 시 해당 폴더 문서만 검색
+
+        Returns:
+            folder_id, path, title, snippet, score 딕셔너리 목록 (관련도 순, score는 낮을수록 관련도 높음)
+        """
+        if folder_id is not None:
+            folder_filter = "AND d.folder_id = :folder_id"
+        else:
+            folder_filter = "AND d.id = (SELECT MIN(id) FROM search_documents WHERE path = d.path)"
+        # ORDER BY rank LIMIT은 FTS5가 상위 limit건만 유지하므로 highlight/snippet도 limit건만 계산
+        rows = self._db.execute(
+            text(
+                f"""
+                SELECT d.folder_id, d.path,
+                       highlight({SEARCH_FTS_TABLE}, 0, :start, :end) AS title,
+                       snippet({SEARCH_FTS_TABLE}, 1, :start, :end, '…', 16) AS snippet,
+                       rank AS score
+                FROM {SEARCH_FTS_TABLE}
+                JOIN search_documents AS d ON d.id = {SEARCH_FTS_TABLE}.rowid
+                WHERE {SEARCH_FTS_TABLE} MATCH :query {folder_filter}
+                ORDER BY rank
+                LIMIT :limit
+                """
+            ),
+            {
+                "query": match_query,
+                "start": MATCH_START,
+                "end": MATCH_END,
+                "limit": limit,
+                "folder_id": folder_id,
+            },
+        )
+        return [dict(row._mapping) for row in rows]
+
+    def count(self) -> int:
+        """색인된 문서 수"""
+        return self._db.query(SearchDocument).count()
+
+    def commit(self) -> None:
+        """변경 확정"""
+        self._db.commit()
+
+    def rollback(self) -> None:
+        """변경 취소"""
+        self._db.rollback()
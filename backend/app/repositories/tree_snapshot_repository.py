@@ -0,0 +1,38 @@
+"""
+폴더 트리 스냅샷 리포지토리
+
+SQLAlchemy ORM 기반 데이터 접근
+"""
+
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.folder_tree_snapshot import FolderTreeSnapshot
+
+
+class TreeSnapshotRepository:
+    """폴더 트리 스냅샷 데이터 접근 레이어"""
+
+    def __init__(self, db: Session) -> None:
+        self._db = db
+
+    def find(self, folder_id: int, md_only: bool) -> Optional[FolderTreeSnapshot]:
+        """폴더 스냅샷 조회"""
+        return self._db.scalar(
+            select(FolderTreeSnapshot).where(
+                FolderTreeSnapshot.folder_id == folder_id, FolderTreeSnapshot.md_only == md_only
+            )
+        )
+
+    def save(self, folder_id: int, md_only: bool, root: str, data: bytes) -> None:
+        """스냅샷 저장 (있으면 교체)"""
+        snapshot = self.find(folder_id, md_only)
+        if snapshot is None:
+            snapshot = FolderTreeSnapshot(folder_id=folder_id, md_only=md_only, root=root, data=data)
+            self._db.add(snapshot)
+        else:
+            snapshot.root = root
+            snapshot.data = data
+        self._db.commit()
@@ -53,7 +53,13 @@ class TreeNode(BaseModel):
     children: list["TreeNode"] | None = Field(
         default=None, description="하위 항목 (directory만)"
     )
-
+    has_children: bool | None = Field(
+        default=None,
+        description=(
+            "depth 제한으로 children을 생략한 directory의 하위 항목 존재 여부 "
+            "(경계 폴더에만 응답에 포함, 확인하지 못한 경우 생략 - 펼칠 때 조회)"
+        ),
+    )
 
 class FolderTreeResponse(BaseModel):
     """폴더 트리 응답 스키마"""
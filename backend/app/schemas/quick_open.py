@@ -0,0 +1,22 @@
+"""
+빠른 열기 관련 Pydantic 스키마
+"""
+
+from pydantic import BaseModel, Field
+
+
+class QuickOpenResult(BaseModel):
+    """빠른 열기 결과 항목"""
+
+    folder_id: int = Field(..., description="폴더 ID")
+    path: str = Field(..., description="파일 절대 경로")
+    relative_path: str = Field(..., description="폴더 기준 상대 경로 (/ 구분)")
+    matches: list[int] = Field(..., description="relative_path에서 검색어와 일치한 문자 위치")
+    score: int = Field(..., description="일치 점수 (높을수록 우선)")
+
+
+class QuickOpenResponse(BaseModel):
+    """빠른 열기 응답 스키마"""
+
+    query: str = Field(..., description="검색어")
+    results: list[QuickOpenResult] = Field(..., description="점수 순 결과")
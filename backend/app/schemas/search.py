@@ -0,0 +1,29 @@
+"""
+검색 관련 Pydantic 스키마
+"""
+
+from pydantic import BaseModel, Field
+
+
+class HighlightSegment(BaseModel):
+    """하이라이트 구간"""
+
+    text: str = Field(..., description="구간 텍스트")
+    match: bool = Field(..., description="검색어 일치 구간 여부")
+
+
+class SearchResult(BaseModel):
+    """검색 결과 항목"""
+
+    folder_id: int = Field(..., description="폴더 ID")
+    path: str = Field(..., description="파일 절대 경로")
+    title: list[HighlightSegment] = Field(..., description="문서 제목 (# 제목 또는 파일 이름)")
+    snippet: list[HighlightSegment] = Field(..., description="본문 일치 부분 발췌")
+    score: float = Field(..., description="관련도 (높을수록 관련도 높음)")
+
+
+class SearchResponse(BaseModel):
+    """검색 응답 스키마"""
+
+    query: str = Field(..., description="검색어")
+    results: list[SearchResult] = Field(..., description="관련도 순 결과")
@@ -0,0 +1,115 @@
+"""
+허용 폴더 루트 인덱스
+
+Spec: spec/api/file-content.md - 보안
+등록된 폴더의 실제 경로(realpath)를 경로 구성요소 트라이로 유지하여
+파일 접근 검사를 DB 조회 없이 O(depth)로 수행한다.
+
+- 폴더 등록/삭제 시 FolderService가 갱신
+- 서버 시작 시 initialize_watchers에서 전체 재구성
+"""
+
+import os
+import threading
+from collections.abc import Iterable
+
+
+class _TrieNode:
+    """경로 구성요소 트라이 노드"""
+
+    __slots__ = ("children", "root_count")
+
+    def __init__(self) -> None:
+        self.children: dict[str, "_TrieNode"] = {}
+        self.root_count = 0  # 이 경로로 해석되는 등록 폴더 수 (심볼릭 링크로 중복 가능)
+
+
+class AllowedRootIndex:
+    """허용 폴더 루트 트라이 (Thread-safe)"""
+
+    def __init__(self) -> None:
+        self._root = _TrieNode()
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """DB 기준으로 한 번 이상 구성되었는지 여부"""
+        return self._loaded
+
+    def replace(self, folder_paths: Iterable[str]) -> None:
+        """
+        전체 재구성
+
+        Args:
+            folder_paths: 등록된 폴더 경로 목록
+        """
+        root = _TrieNode()
+        for folder_path in folder_paths:
+            self._insert(root, os.path.realpath(folder_path))
+        with self._lock:
+            self._root = root
+            self._loaded = True
+
+    def add(self, folder_path: str) -> None:
+        """등록 폴더 추가"""
+        real_path = os.path.realpath(folder_path)
+        with self._lock:
+            self._insert(self._root, real_path)
+
+    def remove(self, folder_path: str) -> None:
+        """등록 폴더 제거"""
+        real_path = os.path.realpath(folder_path)
+        with self._lock:
+            nodes = [self._root]
+            for part in self._split(real_path):
+                child = nodes[-1].children.get(part)
+                if child is None:
+                    return
+                nodes.append(child)
+            if nodes[-1].root_count == 0:
+                return
+            nodes[-1].root_count -= 1
+
+            # 더 이상 쓰이지 않는 가지 정리
+            for parent, part, node in zip(
+                reversed(nodes[:-1]), reversed(self._split(real_path)), reversed(nodes[1:])
+            ):
+                if node.root_count or node.children:
+                    break
+                del parent.children[part]
+
+    def is_allowed(self, real_path: str) -> bool:
+        """
+        실제 경로가 등록 폴더 자체이거나 그 하위인지 확인
+
+        Args:
+            real_path: os.path.realpath로 정규화된 경로
+
+        Returns:
+            허용 경로면 True
+        """
+        with self._lock:
+            node = self._root
+            for part in self._split(real_path):
+                node = node.children.get(part)
+                if node is None:
+                    return False
+                if node.root_count:
+                    return True
+        return False
+
+    @staticmethod
+    def _split(real_path: str) -> list[str]:
+        # 구성요소 단위 비교이므로 /tmp/foo 가 /tmp/foobar 를 허용하지 않음
+        return [part for part in real_path.split(os.sep) if part]
+
+    def _insert(self, root: _TrieNode, real_path: str) -> None:
+        node = root
+        for part in self._split(real_path):
+            node = node.children.setdefault(part, _TrieNode())
+        node.root_count += 1
+
+
+# 전역 AllowedRootIndex 인스턴스
+allowed_roots = AllowedRootIndex()
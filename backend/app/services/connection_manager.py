@@ -8,73 +8,368 @@ Audit Fix: Issue #3 - Race Condition in broadcast()
 - list → set (중복 방지, O(1) 삭제)
 - asyncio.Lock() 추가 (Thread-safe)
 - disconnect() → async 변경
+
+클라이언트마다 크기 제한 송신 큐와 전용 writer task를 두어 broadcast는 대기하지 않음
+- 메시지는 broadcast당 한 번만 직렬화 (orjson 설치 시 사용)
+- 전송 제한 시간을 넘긴 클라이언트는 연결 해제
+- 큐가 가득 차면 같은 경로의 대기 이벤트를 빼고 최신 이벤트를 끝에 추가 (seq 순서 유지),
+  불가능하면 resync 메시지로 대체
+
+폴더 구독 (subscribe/unsubscribe)
+- 구독 메시지를 보낸 클라이언트는 구독한 folder_id의 이벤트만 수신
+- 구독 메시지를 보낸 적 없는 클라이언트는 하위 호환을 위해 모든 이벤트 수신
+- folder_id가 없는 메시지(resync 등)는 모든 클라이언트에 전송
+
+이벤트 순번 (seq) 및 재전송 버퍼
+- broadcast 메시지마다 단조 증가 seq를 붙이고 최근 이벤트를 크기 제한 버퍼에 보관
+- 재연결 클라이언트가 ?since=<seq>로 접속하면 놓친 이벤트만 재전송
+  (?folder_ids=로 구독 폴더를 함께 보내면 해당 폴더 이벤트만 재전송)
+- seq는 전체 폴더 공통이므로 버퍼에서 밀려난 이벤트의 마지막 seq를 폴더별로 기록하고,
+  클라이언트가 받을 폴더의 이벤트가 밀려난 경우에만 재전송 불가로 판단
+- 재전송할 수 없거나 서버가 재시작된 경우 resync_required 전송
 """
 
 import asyncio
+import time
+from collections import deque
+from collections.abc import Hashable, Iterable
+from itertools import islice
 from typing import Any
 
 from fastapi import WebSocket
 from loguru import logger
 
+from app.core.config import settings
+from app.utils.json_codec import dumps
+
+
+# 큐 초과로 메시지를 버린 클라이언트에 보내는 전체 재동기화 요청
+RESYNC_MESSAGE = {"type": "resync"}
+
+# 재연결 시 놓친 이벤트를 재전송할 수 없는 경우의 전체 재조회 요청 타입
+RESYNC_REQUIRED_TYPE = "resync_required"
+
+
+class ClientChannel:
+    """클라이언트별 송신 큐 (크기 제한, 단일 writer task에서 소비)"""
+
+    def __init__(self, websocket: WebSocket, max_size: int) -> None:
+        """
+        Args:
+            websocket: 클라이언트 WebSocket
+            max_size: 대기 메시지 최대 개수
+        """
+        self.websocket = websocket
+        self.max_size = max(1, max_size)
+        self.writer: asyncio.Task | None = None
+        self.folder_ids: set[int] | None = None  # 구독 폴더 (None이면 전체 수신)
+        self.dropped = 0  # resync로 대체되어 버려진 메시지 수
+        self._queue: deque[list] = deque()  # [coalesce 키, 직렬화된 메시지]
+        self._latest: dict[Hashable, list] = {}  # coalesce 키 -> 가장 최근 큐 항목
+        self._ready = asyncio.Event()
+
+    def offer(self, payload: str, key: Hashable | None = None) -> None:
+        """
+        메시지 추가 (대기하지 않음)
+
+        Args:
+            payload: 직렬화된 메시지
+            key: 같은 대상(경로)의 이벤트를 합칠 수 있는 키 (None이면 합치지 않음)
+        """
+        if len(self._queue) >= self.max_size:
+            entry = self._latest.get(key) if key is not None else None
+            if entry is not None:
+                # 같은 경로의 대기 이벤트를 빼고 최신 이벤트를 끝에 추가
+                # (제자리 교체 시 seq가 더 큰 메시지가 먼저 나가 재연결 재전송에서 누락될 수 있음)
+                self._discard(entry)
+            else:
+                # 합칠 수 없으면 대기 메시지를 모두 버리고 resync 1건으로 대체
+                # (클라이언트가 resync 수신 후 다시 조회하므로 현재 메시지도 포함됨)
+                self.dropped += len(self._queue) + 1
+                self._queue.clear()
+                self._latest.clear()
+                payload, key = dumps(RESYNC_MESSAGE), None
+
+        entry = [key, payload]
+        self._queue.append(entry)
+        if key is not None:
+            self._latest[key] = entry
+        self._ready.set()
+
+    async def next(self) -> str:
+        """다음 메시지 (없으면 대기)"""
+        while not self._queue:
+            self._ready.clear()
+            await self._ready.wait()
+        entry = self._queue.popleft()
+        key, payload = entry
+        if key is not None and self._latest.get(key) is entry:
+            del self._latest[key]
+        return payload
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def _discard(self, entry: list) -> None:
+        """큐 항목 제거 (같은 값의 다른 항목이 아닌 해당 항목)"""
+        for i, queued in enumerate(self._queue):
+            if queued is entry:
+                del self._queue[i]
+                break
+
 
 class ConnectionManager:
     """WebSocket 연결 관리 (Thread-safe)"""
 
-    def __init__(self) -> None:
-        self._connections: set[WebSocket] = set()  # list → set (중복 방지, O(1) 삭제)
+    def __init__(
+        self,
+        send_timeout: float | None = None,
+        queue_size: int = 256,
+        history_size: int = 1024,
+    ) -> None:
+        """
+        Args:
+            send_timeout: 클라이언트별 전송 제한 시간 (초, None이면 제한 없음)
+            queue_size: 클라이언트별 대기 메시지 최대 개수
+            history_size: 재전송용으로 보관할 최근 이벤트 수
+        """
+        self.send_timeout = send_timeout
+        self.queue_size = queue_size
+        # 프로세스 시작 시각(ms)에서 시작하므로 서버 재시작 후의 seq는 이전 프로세스보다 큼
+        self._first_seq = int(time.time() * 1000)
+        self._seq = self._first_seq
+        # (seq, folder_id, 직렬화된 메시지)
+        self._history: deque[tuple[int, int | None, str]] = deque(maxlen=max(0, history_size))
+        self._evicted: dict[int | None, int] = {}  # folder_id -> 버퍼에서 밀려난 마지막 이벤트 seq
+        self._connections: dict[WebSocket, ClientChannel] = {}  # WebSocket -> 송신 큐
+        self._subscribers: dict[int, set[WebSocket]] = {}  # folder_id -> 구독 클라이언트
+        self._unscoped: set[WebSocket] = set()  # 구독 전 클라이언트 (전체 수신)
         self._lock = asyncio.Lock()
 
-    async def connect(self, websocket: WebSocket) -> None:
+    async def connect(
+        self,
+        websocket: WebSocket,
+        since: int | None = None,
+        folder_ids: Iterable[int] | None = None,
+    ) -> None:
         """
         클라이언트 연결 수락 및 등록
-        
+
         Args:
             websocket: 연결할 WebSocket 객체
+            since: 재연결 시 클라이언트가 마지막으로 받은 seq (놓친 이벤트 재전송)
+            folder_ids: 연결 시점의 구독 폴더 (None이면 구독 전 클라이언트)
         """
         await websocket.accept()
+        channel = ClientChannel(websocket, self.queue_size)
+        channel.writer = asyncio.create_task(self._write_loop(channel))
         async with self._lock:
-            self._connections.add(websocket)
+            self._connections[websocket] = channel
+            if folder_ids is None:
+                self._unscoped.add(websocket)
+            else:
+                channel.folder_ids = set(folder_ids)
+                for folder_id in channel.folder_ids:
+                    self._subscribers.setdefault(folder_id, set()).add(websocket)
+            # lock 안에서 재전송해야 이후 broadcast와 순서가 섞이거나 누락되지 않음
+            if since is not None:
+                self._replay(channel, since)
         logger.info(f"WebSocket 연결: 현재 {self.connection_count}개 활성 연결")
 
     async def disconnect(self, websocket: WebSocket) -> None:
         """
         클라이언트 연결 해제 (async로 변경하여 lock 사용 가능)
-        
+
         Args:
             websocket: 해제할 WebSocket 객체
         """
         async with self._lock:
-            self._connections.discard(websocket)  # remove → discard (없어도 에러 없음)
+            channel = self._connections.pop(websocket, None)  # 없어도 에러 없음
+            self._unscoped.discard(websocket)
+            if channel is not None and channel.folder_ids:
+                self._remove_subscriptions(websocket, channel.folder_ids)
+        if channel is not None and channel.writer is not asyncio.current_task():
+            channel.writer.cancel()
         logger.info(f"WebSocket 연결 해제: 현재 {self.connection_count}개 활성 연결")
 
+    async def subscribe(self, websocket: WebSocket, folder_ids: Iterable[int]) -> set[int]:
+        """
+        폴더 이벤트 구독 추가 (이후 구독한 폴더 이벤트만 수신)
+
+        Args:
+            websocket: 구독할 클라이언트
+            folder_ids: 구독할 폴더 ID 목록 (빈 목록이면 구독 모드 전환만)
+
+        Returns:
+            현재 구독 중인 폴더 ID 집합
+        """
+        async with self._lock:
+            channel = self._scope(websocket)
+            if channel is None:
+                return set()
+            added = set(folder_ids) - channel.folder_ids
+            channel.folder_ids |= added
+            for folder_id in added:
+                self._subscribers.setdefault(folder_id, set()).add(websocket)
+            return set(channel.folder_ids)
+
+    async def unsubscribe(self, websocket: WebSocket, folder_ids: Iterable[int]) -> set[int]:
+        """
+        폴더 이벤트 구독 해제
+
+        Args:
+            websocket: 구독 해제할 클라이언트
+            folder_ids: 구독 해제할 폴더 ID 목록
+
+        Returns:
+            현재 구독 중인 폴더 ID 집합
+        """
+        async with self._lock:
+            channel = self._scope(websocket)
+            if channel is None:
+                return set()
+            removed = channel.folder_ids & set(folder_ids)
+            channel.folder_ids -= removed
+            self._remove_subscriptions(websocket, removed)
+            return set(channel.folder_ids)
+
+    def _scope(self, websocket: WebSocket) -> ClientChannel | None:
+        """구독 모드로 전환 (lock 보유 상태에서 호출, 미연결이면 None)"""
+        channel = self._connections.get(websocket)
+        if channel is not None and channel.folder_ids is None:
+            channel.folder_ids = set()
+            self._unscoped.discard(websocket)
+        return channel
+
+    def _remove_subscriptions(self, websocket: WebSocket, folder_ids: Iterable[int]) -> None:
+        """구독 색인에서 제거 (lock 보유 상태에서 호출)"""
+        for folder_id in folder_ids:
+            subscribers = self._subscribers.get(folder_id)
+            if subscribers is None:
+                continue
+            subscribers.discard(websocket)
+            if not subscribers:
+                del self._subscribers[folder_id]
+
+    async def send(self, websocket: WebSocket, message: dict[str, Any]) -> None:
+        """
+        단일 클라이언트 송신 큐에 메시지 추가 (broadcast와 같은 순서로 전송)
+
+        Args:
+            websocket: 대상 클라이언트
+            message: 전송할 메시지 딕셔너리
+        """
+        async with self._lock:
+            channel = self._connections.get(websocket)
+        if channel is not None:
+            channel.offer(dumps(message))
+
     async def broadcast(self, message: dict[str, Any]) -> None:
         """
-        모든 클라이언트에 메시지 전송
-        
+        메시지를 받을 클라이언트 송신 큐에 메시지 추가
+
+        folder_id가 있는 메시지는 해당 폴더 구독자와 구독 전 클라이언트에만 전달한다.
+        전송은 클라이언트별 writer task가 수행하므로 느린 클라이언트가 있어도 대기하지 않는다.
+
         Args:
             message: 전송할 메시지 딕셔너리
         """
-        # 스냅샷 복사로 iteration 중 수정 방지
         async with self._lock:
-            connections = set(self._connections)
-        
-        disconnected = []
-        for connection in connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.warning(f"메시지 전송 실패: {e}")
-                disconnected.append(connection)
-        
-        # 실패한 연결 비동기 정리
-        for conn in disconnected:
-            await self.disconnect(conn)
+            # 연결된 클라이언트가 없어도 재연결 시 재전송할 수 있도록 순번을 붙여 보관
+            # 클라이언트마다 json.dumps 하지 않도록 한 번만 직렬화
+            self._seq += 1
+            payload = dumps({**message, "seq": self._seq})
+            folder_id = message.get("folder_id")
+            if self._history.maxlen == 0:
+                self._evicted[folder_id] = self._seq
+            else:
+                if len(self._history) == self._history.maxlen:
+                    evicted_seq, evicted_folder_id, _ = self._history[0]
+                    self._evicted[evicted_folder_id] = evicted_seq
+                self._history.append((self._seq, folder_id, payload))
+            # 스냅샷 복사로 iteration 중 수정 방지
+            channels = self._recipients(folder_id)
+        if not channels:
+            return
+
+        key = self._coalesce_key(message)
+        for channel in channels:
+            channel.offer(payload, key)
+
+    def _replay(self, channel: ClientChannel, since: int) -> None:
+        """since 이후 클라이언트가 받을 이벤트 재전송 (lock 보유 상태에서 호출)"""
+        missed = self._seq - since
+        # 이전 프로세스의 seq, 알 수 없는 미래 seq, 받을 폴더의 이벤트가 버퍼에서 밀려난 구간은 재전송 불가
+        if since < self._first_seq or missed < 0 or self._evicted_after(channel.folder_ids, since):
+            channel.offer(dumps({"type": RESYNC_REQUIRED_TYPE, "seq": self._seq}))
+            return
+        # seq는 연속이므로 버퍼 끝에서 missed개가 놓친 이벤트
+        start = max(0, len(self._history) - missed)
+        for _, folder_id, payload in islice(self._history, start, None):
+            if channel.folder_ids is None or folder_id is None or folder_id in channel.folder_ids:
+                channel.offer(payload)
+
+    def _evicted_after(self, folder_ids: set[int] | None, since: int) -> bool:
+        """받을 폴더(None이면 전체)의 since 이후 이벤트가 버퍼에서 밀려났는지 (lock 보유 상태에서 호출)"""
+        if folder_ids is None:
+            return any(seq > since for seq in self._evicted.values())
+        return any(self._evicted.get(folder_id, 0) > since for folder_id in (None, *folder_ids))
+
+    def _recipients(self, folder_id: int | None) -> list[ClientChannel]:
+        """메시지 수신 대상 (lock 보유 상태에서 호출)"""
+        if folder_id is None:
+            return list(self._connections.values())
+        targets = self._unscoped | self._subscribers.get(folder_id, set())
+        return [self._connections[websocket] for websocket in targets]
+
+    @staticmethod
+    def _coalesce_key(message: dict[str, Any]) -> Hashable | None:
+        """큐 초과 시 합칠 수 있는 메시지의 키 (단일 파일 변경만 대상)"""
+        if message.get("type") == "file_change":
+            return (message.get("folder_id"), message.get("path"))
+        return None
+
+    async def _write_loop(self, channel: ClientChannel) -> None:
+        """클라이언트 송신 큐 소비 (전송 실패 시 연결 해제)"""
+        while True:
+            payload = await channel.next()
+            if not await self._send(channel.websocket, payload):
+                await self.disconnect(channel.websocket)
+                return
+
+    async def _send(self, connection: WebSocket, payload: str) -> bool:
+        """단일 클라이언트 전송 (직렬화된 텍스트 프레임, 성공 여부 반환)"""
+        try:
+            await asyncio.wait_for(connection.send_text(payload), timeout=self.send_timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"메시지 전송 시간 초과 ({self.send_timeout}s): 연결 해제")
+        except Exception as e:
+            logger.warning(f"메시지 전송 실패: {e}")
+        # 전송 중단된 소켓은 프레임이 깨졌을 수 있으므로 닫음 (수신 루프도 종료됨)
+        try:
+            await asyncio.wait_for(connection.close(), timeout=self.send_timeout)
+        except Exception:
+            pass
+        return False
 
     @property
     def connection_count(self) -> int:
         """현재 연결된 클라이언트 수"""
         return len(self._connections)
 
+    @property
+    def active_folder_ids(self) -> set[int] | None:
+        """이벤트를 받는 클라이언트가 있는 폴더 ID (구독 전 클라이언트가 있으면 None = 전체)"""
+        if self._unscoped:
+            return None
+        return set(self._subscribers)
+
+    @property
+    def last_seq(self) -> int:
+        """마지막으로 broadcast한 이벤트 seq"""
+        return self._seq
+
     @property
     def active_connections(self) -> list[WebSocket]:
         """하위 호환성 유지를 위한 프로퍼티"""
@@ -82,4 +377,8 @@ class ConnectionManager:
 
 
 # 전역 ConnectionManager 인스턴스
-manager = ConnectionManager()
+manager = ConnectionManager(
+    send_timeout=settings.WS_SEND_TIMEOUT,
+    queue_size=settings.WS_QUEUE_SIZE,
+    history_size=settings.WS_HISTORY_SIZE,
+)
@@ -0,0 +1,100 @@
+"""
+파일 내용 캐시 서비스
+
+Spec: spec/api/file-content.md
+GET /api/files 결과를 실제 경로(realpath) 기준으로 LRU 캐싱
+
+- 바이트 예산(Settings.CONTENT_CACHE_MAX_BYTES) 초과 시 오래된 항목부터 제거
+- 조회 시 stat (mtime_ns, size)으로 검증하여 이벤트 누락 시에도 stale 응답 방지
+- FileWatcher 수정/삭제 이벤트로 선제적 제거
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+from app.core.config import settings
+
+
+class ContentCache:
+    """파일 내용 LRU 캐시 (Thread-safe)"""
+
+    def __init__(self, max_bytes: int) -> None:
+        """
+        Args:
+            max_bytes: 캐시 전체 바이트 예산 (0이면 캐싱 안 함)
+        """
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[int, int, str]] = OrderedDict()  # realpath -> (mtime_ns, size, 내용)
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, real_path: str, stat_result: os.stat_result) -> str | None:
+        """
+        캐시된 내용 조회 (stat이 달라졌으면 제거 후 None)
+
+        Args:
+            real_path: 파일 실제 경로
+            stat_result: 현재 파일 stat
+
+        Returns:
+            캐시된 내용, 없거나 변경되었으면 None
+        """
+        with self._lock:
+            entry = self._entries.get(real_path)
+            if entry is None:
+                return None
+            mtime_ns, size, content = entry
+            if mtime_ns != stat_result.st_mtime_ns or size != stat_result.st_size:
+                self._pop(real_path)
+                return None
+            self._entries.move_to_end(real_path)
+            return content
+
+    def put(self, real_path: str, stat_result: os.stat_result, content: str) -> None:
+        """
+        내용 저장 (예산 초과 시 LRU 제거)
+
+        Args:
+            real_path: 파일 실제 경로
+            stat_result: 읽기 전에 조회한 파일 stat
+            content: 파일 내용
+        """
+        size = stat_result.st_size
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._pop(real_path)
+            self._entries[real_path] = (stat_result.st_mtime_ns, size, content)
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def evict(self, path: str) -> None:
+        """파일 변경/삭제 시 캐시 제거"""
+        real_path = os.path.realpath(path)
+        with self._lock:
+            self._pop(real_path)
+
+    def clear(self) -> None:
+        """전체 캐시 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        """현재 캐시된 바이트 수 (파일 크기 기준)"""
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _pop(self, real_path: str) -> None:
+        entry = self._entries.pop(real_path, None)
+        if entry is not None:
+            self._total_bytes -= entry[1]
+
+
+# 전역 ContentCache 인스턴스
+content_cache = ContentCache(max_bytes=settings.CONTENT_CACHE_MAX_BYTES)
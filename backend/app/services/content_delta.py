@@ -0,0 +1,220 @@
+"""
+열람 파일 변경분 전송 서비스
+
+Spec: spec/api/file-watch-websocket.md
+view_file 메시지로 옵트인한 클라이언트에 수정된 파일의 줄 단위 변경분을 전송
+
+- 클라이언트별로 마지막으로 전송한 내용(기준 버전)을 보관
+- 같은 기준 버전을 가진 클라이언트끼리는 변경분을 한 번만 계산
+- 변경분이 전체 내용보다 크면 전체 내용을 전송
+- 클라이언트는 base_hash가 다르거나 적용 결과 hash가 다르면 GET /api/files로 재조회
+"""
+
+import asyncio
+import os
+import stat
+from typing import Any
+
+from fastapi import WebSocket
+from loguru import logger
+
+from app.core.config import settings
+from app.services.allowed_roots import AllowedRootIndex, allowed_roots
+from app.services.connection_manager import ConnectionManager, manager
+from app.services.content_cache import ContentCache, content_cache
+from app.utils.line_delta import content_hash, delta_size, line_delta
+
+
+class _FileVersion:
+    """클라이언트에 마지막으로 전송한 파일 버전"""
+
+    __slots__ = ("path", "hash", "content")
+
+    def __init__(self, path: str, digest: str, content: str) -> None:
+        self.path = path  # 클라이언트가 요청한 경로 (응답 메시지에 그대로 사용)
+        self.hash = digest
+        self.content = content
+
+
+class ContentDeltaService:
+    """열람 중인 파일의 변경분 전송 (이벤트 루프에서만 사용)"""
+
+    DELTA_EVENT_TYPES = frozenset({"created", "modified"})
+
+    def __init__(
+        self,
+        connection_manager: ConnectionManager,
+        max_bytes: int,
+        max_files_per_client: int = 4,
+        roots: AllowedRootIndex | None = None,
+        cache: ContentCache | None = None,
+    ) -> None:
+        """
+        Args:
+            connection_manager: 변경분을 보낼 ConnectionManager
+            max_bytes: 변경분 전송 대상 파일 최대 크기 (초과 시 view 거부)
+            max_files_per_client: 클라이언트별 동시 열람 파일 수 (초과 시 오래된 파일부터 해제)
+            roots: 접근 허용 폴더 인덱스 (None이면 전역 인덱스)
+            cache: 파일 내용 캐시 (None이면 캐시 사용 안 함)
+        """
+        self.manager = connection_manager
+        self.max_bytes = max_bytes
+        self.max_files_per_client = max(1, max_files_per_client)
+        self.roots = roots if roots is not None else allowed_roots
+        self.cache = cache
+        self._views: dict[str, dict[WebSocket, _FileVersion]] = {}  # realpath -> 클라이언트 -> 기준 버전
+        # 클라이언트 -> 열람 중인 realpath (순서 있는 집합, 오래된 순)
+        self._clients: dict[WebSocket, dict[str, None]] = {}
+        self._lock = asyncio.Lock()
+
+    async def view(self, websocket: WebSocket, path: str) -> str | None:
+        """
+        파일 열람 등록 (현재 내용을 기준 버전으로 보관)
+
+        Args:
+            websocket: 클라이언트
+            path: 파일 경로
+
+        Returns:
+            기준 버전 hash, 열람할 수 없는 파일(허용 경로 아님, 크기 초과 등)이면 None
+        """
+        real_path = os.path.realpath(path)
+        if not self._is_viewable(path, real_path):
+            return None
+        loaded = await asyncio.to_thread(self._load, path, real_path)
+        if loaded is None:
+            return None
+        content, digest = loaded
+
+        async with self._lock:
+            views = self._clients.setdefault(websocket, {})
+            views.pop(real_path, None)
+            views[real_path] = None
+            self._views.setdefault(real_path, {})[websocket] = _FileVersion(path, digest, content)
+            while len(views) > self.max_files_per_client:
+                oldest = next(iter(views))
+                del views[oldest]
+                self._drop(websocket, oldest)
+        return digest
+
+    async def unview(self, websocket: WebSocket, path: str) -> None:
+        """파일 열람 해제"""
+        real_path = os.path.realpath(path)
+        async with self._lock:
+            views = self._clients.get(websocket)
+            if views and real_path in views:
+                del views[real_path]
+                self._drop(websocket, real_path)
+
+    async def forget(self, websocket: WebSocket) -> None:
+        """연결 해제된 클라이언트의 열람 정보 제거"""
+        async with self._lock:
+            for real_path in self._clients.pop(websocket, []):
+                self._drop(websocket, real_path)
+
+    async def publish(self, message: dict[str, Any]) -> None:
+        """
+        파일 변경 메시지 처리 (열람 중인 클라이언트에 변경분 전송)
+
+        Args:
+            message: file_change / file_changes 메시지
+        """
+        if not self._views:
+            return
+        if message.get("type") == "file_change":
+            changes = [(message.get("path"), message.get("event"))]
+        elif message.get("type") == "file_changes":
+            changes = [(change.get("path"), change.get("event")) for change in message.get("changes", [])]
+        else:
+            return
+
+        async with self._lock:
+            for path, event_type in changes:
+                if not path:
+                    continue
+                real_path = os.path.realpath(path)
+                viewers = self._views.get(real_path)
+                if not viewers:
+                    continue
+                if event_type not in self.DELTA_EVENT_TYPES:
+                    # 삭제/이동된 파일은 열람 해제 (클라이언트는 file_change로 인지)
+                    for websocket in list(viewers):
+                        self._clients.get(websocket, {}).pop(real_path, None)
+                        self._drop(websocket, real_path)
+                    continue
+                await self._push(real_path, viewers)
+
+    async def _push(self, real_path: str, viewers: dict[WebSocket, _FileVersion]) -> None:
+        """기준 버전별로 변경분을 한 번씩 계산하여 전송 (lock 보유 상태에서 호출)"""
+        loaded = await asyncio.to_thread(self._load, real_path, real_path)
+        if loaded is None:
+            return
+        content, digest = loaded
+
+        groups: dict[str, list[WebSocket]] = {}
+        for websocket, version in viewers.items():
+            if version.hash != digest:
+                groups.setdefault(version.hash, []).append(websocket)
+
+        for base_hash, websockets in groups.items():
+            base = viewers[websockets[0]].content
+            ops = await asyncio.to_thread(line_delta, base, content)
+            delta: dict[str, Any] = {"type": "file_delta", "base_hash": base_hash, "hash": digest}
+            if delta_size(ops) < len(content):
+                delta["ops"] = ops
+            else:
+                delta["content"] = content
+            for websocket in websockets:
+                version = viewers[websocket]
+                await self.manager.send(websocket, {**delta, "path": version.path})
+                viewers[websocket] = _FileVersion(version.path, digest, content)
+
+        logger.debug(f"변경분 전송: {real_path} - 기준 버전 {len(groups)}개")
+
+    def _is_viewable(self, path: str, real_path: str) -> bool:
+        """GET /api/files와 같은 접근 조건 (허용 폴더 하위, 심볼릭 링크 아님, .md)"""
+        return (
+            self.max_bytes > 0
+            and path.endswith(".md")
+            and self.roots.is_allowed(real_path)
+            and not os.path.islink(path)
+        )
+
+    def _load(self, path: str, real_path: str) -> tuple[str, str] | None:
+        """파일 내용과 hash 읽기 (스레드에서 호출, 없거나 크기 초과면 None)"""
+        try:
+            stat_result = os.stat(path)
+            if stat_result.st_size > self.max_bytes or not stat.S_ISREG(stat_result.st_mode):
+                return None
+            content = self.cache.get(real_path, stat_result) if self.cache is not None else None
+            if content is None:
+                with open(path, "r", encoding="utf-8") as f:
+                    content = f.read()
+                if self.cache is not None:
+                    self.cache.put(real_path, stat_result, content)
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"열람 파일 읽기 실패: {path} - {e}")
+            return None
+        return content, content_hash(content)
+
+    def _drop(self, websocket: WebSocket, real_path: str) -> None:
+        """열람 색인에서 제거 (lock 보유 상태에서 호출)"""
+        viewers = self._views.get(real_path)
+        if viewers is None:
+            return
+        viewers.pop(websocket, None)
+        if not viewers:
+            del self._views[real_path]
+
+    @property
+    def viewed_count(self) -> int:
+        """열람 중인 파일 수 (클라이언트 무관)"""
+        return len(self._views)
+
+
+# 전역 ContentDeltaService 인스턴스
+content_deltas = ContentDeltaService(
+    manager,
+    max_bytes=settings.CONTENT_DELTA_MAX_BYTES,
+    cache=content_cache,
+)
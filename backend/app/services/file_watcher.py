@@ -7,21 +7,32 @@ watchdog을 사용한 .md 파일 변경 감지 및 이벤트 전달
 Audit Fix:
 - Issue #2: asyncio.run() 이벤트 루프 충돌 방지
 - Issue #6: 타이머 정리 로직 추가 (메모리 누수 방지)
+
+debounce는 FileWatcherService당 1개의 DebounceScheduler 스레드에서 처리
+(이벤트마다 threading.Timer 스레드를 만들지 않음)
+모든 폴더는 하나의 Observer에 스케줄되고 FolderEventRouter가 폴더 핸들러로 분배
 """
 
 import asyncio
 import os
 import threading
-import time
 from app.core.config import settings
-from app.utils.tree_builder import build_tree
-from pathlib import Path
-from typing import Any, Callable
+from app.services.content_cache import ContentCache, content_cache
+from app.services.markdown_polling import MarkdownPollingObserver
+from app.services.quick_open import QuickOpenIndex, quick_open_index
+from app.services.search_indexer import SearchIndexer, search_indexer
+from app.services.tree_cache import TreeCache, tree_cache
+from app.utils.debounce_scheduler import DebounceScheduler
+from app.utils.tree_builder import is_excluded_path
+from typing import Any, Callable, Iterable
 
 from loguru import logger
-from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.events import (
+    DirCreatedEvent, DirDeletedEvent, FileCreatedEvent, FileDeletedEvent,
+    FileSystemEvent, FileSystemEventHandler,
+)
 from watchdog.observers import Observer
-from watchdog.observers.polling import PollingObserver
+from watchdog.observers.api import BaseObserver, ObservedWatch
 
 
 # =============================================================================
@@ -55,24 +66,25 @@ def is_hidden_file(path: str) -> bool:
     return filename.startswith('.')
 
 
-def is_ignored_path(path: str) -> bool:
+def is_ignored_path(path: str, root: str | None = None) -> bool:
     """
     무시할 경로인지 확인 (숨김 폴더 및 node_modules 등)
-    
+
+    트리/검색 대조와 같은 is_excluded_path 규칙을 감시 폴더 기준 상대 경로에 적용
+    (감시 폴더 자체가 out/ 등의 하위에 있어도 무시하지 않음)
+
     Args:
         path: 파일 경로
-        
+        root: 감시 폴더 경로 (None이면 경로 전체를 검사)
+
     Returns:
         무시 대상이면 True
     """
-    parts = Path(path).parts
-    for part in parts:
-        # 숨김 폴더 (.으로 시작) 또는 일반적인 제외 폴더
-        if part.startswith('.') and part not in ('.', '..'):
-            return True
-        if part in settings.IGNORED_DIRS:
-            return True
-    return False
+    if root is not None:
+        rel_path = os.path.relpath(path, root)
+    else:
+        rel_path = os.path.normpath(path).lstrip(os.sep)
+    return is_excluded_path(rel_path)
 
 
 # =============================================================================
@@ -85,39 +97,83 @@ class MarkdownEventHandler(FileSystemEventHandler):
     
     - .md 파일만 필터링
     - 숨김 파일/폴더 제외
-    - 300ms debounce 적용
+    - 300ms debounce 적용 (공유 DebounceScheduler)
+    - 같은 시점에 기한이 지난 변경은 file_changes 메시지 1개로 묶어 전달
+    - 구조 변경(생성/삭제/이동) 시 트리 인덱스와 빠른 열기 인덱스 즉시 패치
+    - 수정/삭제/이동 시 파일 내용 캐시 즉시 제거
+    - 변경된 파일(또는 이동/삭제된 디렉토리) 검색 재색인 예약
     """
 
     DEBOUNCE_SECONDS = 0.3  # 300ms
+    STRUCTURAL_EVENT_TYPES = frozenset({"created", "deleted", "moved"})
+    CONTENT_EVENT_TYPES = frozenset({"modified", "deleted", "moved"})
 
     def __init__(
         self,
         folder_id: int,
         callback: Callable[[dict[str, Any]], Any],
-        loop: asyncio.AbstractEventLoop | None = None
+        loop: asyncio.AbstractEventLoop | None = None,
+        tree_cache: TreeCache | None = None,
+        content_cache: ContentCache | None = None,
+        scheduler: DebounceScheduler | None = None,
+        search_indexer: SearchIndexer | None = None,
+        quick_open: QuickOpenIndex | None = None,
+        root: str | None = None
     ) -> None:
         """
         Args:
             folder_id: 감시 중인 폴더 ID
             callback: 이벤트 발생 시 호출할 콜백 (async)
             loop: 이벤트 루프 (None이면 실행 시점에 가져옴)
+            tree_cache: 구조 변경을 반영할 트리 캐시 (None이면 반영 안 함)
+            content_cache: 변경 시 제거할 파일 내용 캐시 (None이면 제거 안 함)
+            scheduler: debounce 스케줄러 (None이면 핸들러 전용 스케줄러 생성)
+            search_indexer: 변경 경로를 재색인할 검색 인덱서 (None이면 재색인 안 함)
+            quick_open: 구조 변경을 반영할 빠른 열기 인덱스 (None이면 반영 안 함)
+            root: 감시 폴더 경로 (무시 경로 판정 기준, None이면 경로 전체를 검사)
         """
         super().__init__()
         self.folder_id = folder_id
         self.callback = callback
         self.loop = loop
-        self._debounce_cache: dict[str, float] = {}
-        self._debounce_timers: dict[str, threading.Timer] = {}
-        self._lock = threading.Lock()
+        self.tree_cache = tree_cache
+        self.content_cache = content_cache
+        self.scheduler = scheduler if scheduler is not None else DebounceScheduler()
+        self.search_indexer = search_indexer
+        self.quick_open = quick_open
+        self.root = root
 
     def on_any_event(self, event: FileSystemEvent) -> None:
         """모든 파일 시스템 이벤트 처리"""
+        # 트리 인덱스 패치 (디렉토리/비 마크다운 포함, debounce 없이 즉시)
+        # 알림보다 먼저 반영되어야 클라이언트 재조회 시 최신 트리를 받음
+        if self.tree_cache is not None and event.event_type in self.STRUCTURAL_EVENT_TYPES:
+            self.tree_cache.apply_change(self.folder_id, event.src_path)
+            dest_path = getattr(event, "dest_path", "")
+            if dest_path:
+                self.tree_cache.apply_change(self.folder_id, dest_path)
+        if self.quick_open is not None and event.event_type in self.STRUCTURAL_EVENT_TYPES:
+            for changed_path in (event.src_path, getattr(event, "dest_path", "")):
+                if changed_path:
+                    self.quick_open.apply_change(self.folder_id, changed_path, event.is_directory)
+
+        # 검색 재색인 예약 (인덱서가 경로별 debounce, 이동은 양쪽 경로 모두)
+        if self.search_indexer is not None:
+            self._schedule_index(event)
+
         # 디렉토리 이벤트 무시
         if event.is_directory:
             return
         
         src_path = event.src_path
         
+        # 파일 내용 캐시 선제 제거 (조회 시 stat 검증도 하지만 메모리를 빨리 반환)
+        # 에디터의 원자적 저장(임시 파일 → .md 이름 변경)도 처리하도록 dest_path 포함
+        if self.content_cache is not None and event.event_type in self.CONTENT_EVENT_TYPES:
+            for changed_path in (src_path, getattr(event, "dest_path", "")):
+                if changed_path and is_markdown_file(changed_path):
+                    self.content_cache.evict(changed_path)
+
         # .md 파일만 처리
         if not is_markdown_file(src_path):
             return
@@ -127,43 +183,73 @@ class MarkdownEventHandler(FileSystemEventHandler):
             return
         
         # 무시 대상 폴더 내 파일 무시
-        if is_ignored_path(src_path):
+        if is_ignored_path(src_path, self.root):
             return
         
         # debounce 적용
         self._schedule_callback(src_path, event.event_type)
 
+    def _schedule_index(self, event: FileSystemEvent) -> None:
+        """
+        검색 재색인 예약
+
+        파일은 .md만, 디렉토리는 생성/삭제/이동만 예약 (하위 문서를 디스크와 동기화)
+        """
+        if event.is_directory and event.event_type not in self.STRUCTURAL_EVENT_TYPES:
+            return
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if not path or is_hidden_file(path) or is_ignored_path(path, self.root):
+                continue
+            if event.is_directory:
+                self.search_indexer.schedule_path(self.folder_id, path, is_directory=True)
+            elif is_markdown_file(path):
+                self.search_indexer.schedule_path(self.folder_id, path)
+
+    def notify_change(self, path: str, event_type: str) -> None:
+        """
+        감시 밖에서 발견된 파일 변경을 감시 이벤트와 같은 debounce 경로로 전달
+
+        Args:
+            path: 파일 절대 경로
+            event_type: 이벤트 종류 (created, modified, deleted 등)
+        """
+        self._schedule_callback(path, event_type)
+
     def _schedule_callback(self, path: str, event_type: str) -> None:
-        """debounce 적용하여 콜백 스케줄링"""
-        with self._lock:
-            # 기존 타이머 취소
-            if path in self._debounce_timers:
-                self._debounce_timers[path].cancel()
-            
-            # 새 타이머 설정
-            timer = threading.Timer(
-                self.DEBOUNCE_SECONDS,
-                self._execute_callback,
-                args=[path, event_type]
-            )
-            self._debounce_timers[path] = timer
-            timer.start()
+        """debounce 적용하여 콜백 스케줄링 (같은 경로는 deadline 갱신, 마지막 이벤트 유지)"""
+        self.scheduler.schedule(
+            self._dispatch_batch, path, (path, event_type), self.DEBOUNCE_SECONDS
+        )
+
+    def _dispatch_batch(self, changes: list[tuple[str, str]]) -> None:
+        """
+        기한이 지난 변경 목록 전달 (스케줄러 스레드에서 호출)
 
-    def _execute_callback(self, path: str, event_type: str) -> None:
+        1건이면 file_change, 여러 건이면 file_changes 메시지 1개로 묶어 전달
+        """
+        if len(changes) == 1:
+            path, event_type = changes[0]
+            message = {
+                "type": "file_change",
+                "event": event_type,
+                "path": path,
+                "folder_id": self.folder_id
+            }
+            logger.debug(f"파일 변경 감지: {event_type} - {path}")
+        else:
+            message = {
+                "type": "file_changes",
+                "folder_id": self.folder_id,
+                "changes": [
+                    {"event": event_type, "path": path} for path, event_type in changes
+                ]
+            }
+            logger.debug(f"파일 변경 감지: {self.folder_id} - {len(changes)}건")
+
+        self._execute_callback(message)
+
+    def _execute_callback(self, message: dict[str, Any]) -> None:
         """콜백 실행 (Audit Fix: Issue #2 - 안전한 이벤트 루프 처리)"""
-        with self._lock:
-            if path in self._debounce_timers:
-                del self._debounce_timers[path]
-        
-        message = {
-            "type": "file_change",
-            "event": event_type,
-            "path": path,
-            "folder_id": self.folder_id
-        }
-        
-        logger.debug(f"파일 변경 감지: {event_type} - {path}")
-        
         # 비동기 콜백 실행 (개선: 이벤트 루프 충돌 방지)
         try:
             if self.loop and self.loop.is_running():
@@ -185,11 +271,100 @@ class MarkdownEventHandler(FileSystemEventHandler):
         
         Handler 삭제 전 호출하여 고아 타이머 방지
         """
+        self.scheduler.cancel_all(self._dispatch_batch)
+        logger.debug(f"폴더 {self.folder_id}의 모든 타이머 취소됨")
+
+    @property
+    def pending_count(self) -> int:
+        """debounce 대기 중인 경로 수"""
+        return self.scheduler.pending_count(self._dispatch_batch)
+
+
+# =============================================================================
+# FolderEventRouter
+# =============================================================================
+
+class FolderEventRouter(FileSystemEventHandler):
+    """
+    공유 Observer 이벤트를 폴더별 핸들러로 분배
+
+    - 이벤트 경로의 상위 경로를 따라 올라가며 등록 루트 조회 (O(depth))
+    - 중첩 등록 폴더는 상위 폴더의 감시에 포함되며, 이벤트는 두 폴더 핸들러 모두에 전달
+    - 폴더 경계를 넘는 이동은 폴더별 감시 때와 같이 삭제/생성 이벤트로 변환
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._routes: dict[str, list[MarkdownEventHandler]] = {}  # 루트 경로 -> 핸들러 목록
+        self._lock = threading.Lock()
+
+    def add(self, root: str, handler: MarkdownEventHandler) -> None:
+        """루트 경로에 핸들러 등록"""
+        with self._lock:
+            self._routes.setdefault(root, []).append(handler)
+
+    def remove(self, root: str, handler: MarkdownEventHandler) -> None:
+        """루트 경로에서 핸들러 제거"""
+        with self._lock:
+            handlers = self._routes.get(root)
+            if handlers is None or handler not in handlers:
+                return
+            handlers.remove(handler)
+            if not handlers:
+                del self._routes[root]
+
+    def watch_roots(self) -> set[str]:
+        """
+        Observer에 스케줄해야 하는 루트 목록
+
+        다른 등록 루트 하위에 있는 루트는 상위 감시로 이벤트를 받으므로 제외
+        """
         with self._lock:
-            for timer in self._debounce_timers.values():
-                timer.cancel()
-            self._debounce_timers.clear()
-            logger.debug(f"폴더 {self.folder_id}의 모든 타이머 취소됨")
+            roots = set(self._routes)
+        return {
+            root for root in roots
+            if not any(ancestor in roots for ancestor in self._ancestors(root, include_self=False))
+        }
+
+    def handlers_for(self, path: str) -> list[MarkdownEventHandler]:
+        """경로를 포함하는 모든 폴더 핸들러"""
+        with self._lock:
+            return [
+                handler
+                for root in self._ancestors(path)
+                for handler in self._routes.get(root, ())
+            ]
+
+    def dispatch(self, event: FileSystemEvent) -> None:
+        """이벤트를 해당 폴더 핸들러로 전달"""
+        src_handlers = self.handlers_for(event.src_path)
+        dest_path = getattr(event, "dest_path", "")
+        if event.event_type != "moved" or not dest_path:
+            for handler in src_handlers:
+                handler.dispatch(event)
+            return
+
+        dest_handlers = self.handlers_for(dest_path)
+        for handler in src_handlers:
+            if handler in dest_handlers:
+                handler.dispatch(event)
+            else:
+                deleted_class = DirDeletedEvent if event.is_directory else FileDeletedEvent
+                handler.dispatch(deleted_class(event.src_path))
+        for handler in dest_handlers:
+            if handler not in src_handlers:
+                created_class = DirCreatedEvent if event.is_directory else FileCreatedEvent
+                handler.dispatch(created_class(dest_path))
+
+    @staticmethod
+    def _ancestors(path: str, include_self: bool = True):
+        current = path if include_self else os.path.dirname(path)
+        while True:
+            yield current
+            parent = os.path.dirname(current)
+            if parent == current:
+                return
+            current = parent
 
 
 # =============================================================================
@@ -202,19 +377,51 @@ class FileWatcherService:
     
     - 여러 폴더를 동시에 감시
     - 폴더 추가/제거 지원
-    - Docker 환경을 위한 PollingObserver 사용
+    - Docker 환경을 위한 폴링 감시 (MarkdownPollingObserver: .md 파일과 폴더 mtime만 추적)
+    - 모든 폴더가 하나의 Observer와 debounce 스케줄러 스레드를 공유
+      (중첩 폴더는 상위 폴더 감시를 재사용하여 emitter 수도 줄임)
     """
 
-    def __init__(self, use_polling: bool = True) -> None:
+    def __init__(
+        self,
+        use_polling: bool = True,
+        tree_cache: TreeCache | None = None,
+        content_cache: ContentCache | None = None,
+        search_indexer: SearchIndexer | None = None,
+        quick_open: QuickOpenIndex | None = None,
+        poll_min_interval: float = 1.0,
+        poll_max_interval: float = 30.0,
+        poll_active_max_interval: float = 2.0
+    ) -> None:
         """
         Args:
-            use_polling: True면 PollingObserver 사용 (Docker 호환)
+            use_polling: True면 MarkdownPollingObserver 사용 (Docker 호환)
+            tree_cache: 파일 변경을 반영할 트리 캐시
+            content_cache: 파일 변경 시 제거할 내용 캐시
+            search_indexer: 파일 변경 시 재색인할 검색 인덱서
+            quick_open: 감시 폴더 경로를 유지할 빠른 열기 인덱스
+            poll_min_interval: 폴링 최소 주기 (초, 변경 감지 직후)
+            poll_max_interval: 폴링 최대 주기 (초, 변경 없는 폴더)
+            poll_active_max_interval: 구독 클라이언트가 있는 폴더의 폴링 최대 주기 (초)
         """
         self.use_polling = use_polling
-        self._observers: dict[int, Observer] = {}  # folder_id -> Observer
+        self.poll_min_interval = poll_min_interval
+        self.poll_max_interval = poll_max_interval
+        self.poll_active_max_interval = poll_active_max_interval
+        self.tree_cache = tree_cache
+        self.content_cache = content_cache
+        self.search_indexer = search_indexer
+        self.quick_open = quick_open
+        self._observer: BaseObserver | None = None  # 공유 Observer (감시 폴더가 있을 때만 실행)
+        self._router = FolderEventRouter()
+        self._watches: dict[str, ObservedWatch] = {}  # 루트 경로 -> Observer 감시
         self._handlers: dict[int, MarkdownEventHandler] = {}  # folder_id -> Handler
+        self._roots: dict[int, str] = {}  # folder_id -> 루트 경로
         self._loop: asyncio.AbstractEventLoop | None = None
         self._broadcast_callback: Callable[[dict[str, Any]], Any] | None = None
+        self._scheduler = DebounceScheduler(name="file-watcher-debounce")
+        self._active_folders: set[int] | None = set()  # 구독 클라이언트가 있는 폴더 (None이면 전체)
+        self._lock = threading.RLock()
 
     def set_event_loop(self, loop: asyncio.AbstractEventLoop) -> None:
         """이벤트 루프 설정"""
@@ -235,7 +442,7 @@ class FileWatcherService:
         Returns:
             성공 여부
         """
-        if folder_id in self._observers:
+        if folder_id in self._handlers:
             logger.warning(f"폴더 {folder_id}는 이미 감시 중")
             return False
         
@@ -247,31 +454,38 @@ class FileWatcherService:
             logger.error(f"디렉토리가 아님: {path}")
             return False
         
-        try:
-            # Observer 생성
-            observer_class = PollingObserver if self.use_polling else Observer
-            observer = observer_class()
-            
+        root = os.path.abspath(path)
+        with self._lock:
             # Handler 생성
             handler = MarkdownEventHandler(
                 folder_id=folder_id,
                 callback=self._on_file_change,
-                loop=self._loop
+                loop=self._loop,
+                tree_cache=self.tree_cache,
+                content_cache=self.content_cache,
+                scheduler=self._scheduler,
+                search_indexer=self.search_indexer,
+                quick_open=self.quick_open,
+                root=root
             )
-            
-            # 감시 시작
-            observer.schedule(handler, path, recursive=True)
-            observer.start()
-            
-            self._observers[folder_id] = observer
+            self._router.add(root, handler)
+
+            try:
+                # 감시 시작 (공유 Observer에 루트 스케줄)
+                self._sync_watches()
+            except Exception as e:
+                self._router.remove(root, handler)
+                logger.exception(f"폴더 감시 시작 실패: {e}")
+                return False
+
             self._handlers[folder_id] = handler
-            
-            logger.info(f"폴더 감시 시작: {folder_id} - {path}")
-            return True
-            
-        except Exception as e:
-            logger.exception(f"폴더 감시 시작 실패: {e}")
-            return False
+            self._roots[folder_id] = root
+            self._apply_active_roots()
+            if self.quick_open is not None:
+                self.quick_open.add_folder(folder_id, root)
+
+        logger.info(f"폴더 감시 시작: {folder_id} - {path}")
+        return True
 
     def remove_folder(self, folder_id: int) -> bool:
         """
@@ -283,29 +497,111 @@ class FileWatcherService:
         Returns:
             성공 여부
         """
-        if folder_id not in self._observers:
-            logger.warning(f"폴더 {folder_id}는 감시 중이 아님")
-            return False
-        
-        try:
-            # 타이머 정리 추가 (Audit Fix)
-            handler = self._handlers.get(folder_id)
-            if handler:
+        with self._lock:
+            if folder_id not in self._handlers:
+                logger.warning(f"폴더 {folder_id}는 감시 중이 아님")
+                return False
+
+            try:
+                # 타이머 정리 추가 (Audit Fix)
+                handler = self._handlers.pop(folder_id)
+                root = self._roots.pop(folder_id)
                 handler.cancel_all_timers()
-            
-            observer = self._observers[folder_id]
-            observer.stop()
-            observer.join(timeout=1.0)
-            
-            del self._observers[folder_id]
-            del self._handlers[folder_id]
-            
-            logger.info(f"폴더 감시 중지: {folder_id}")
-            return True
-            
-        except Exception as e:
-            logger.exception(f"폴더 감시 중지 실패: {e}")
-            return False
+
+                # 라우팅 제거 후 Observer 감시 재구성 (하위 등록 폴더는 개별 감시로 전환)
+                self._router.remove(root, handler)
+                self._sync_watches()
+                self._apply_active_roots()
+
+                # 더 이상 이벤트로 갱신할 수 없으므로 캐시 제거
+                if self.tree_cache is not None:
+                    self.tree_cache.remove_folder(folder_id)
+                if self.quick_open is not None:
+                    self.quick_open.remove_folder(folder_id)
+
+                logger.info(f"폴더 감시 중지: {folder_id}")
+                return True
+
+            except Exception as e:
+                logger.exception(f"폴더 감시 중지 실패: {e}")
+                return False
+
+    def _sync_watches(self) -> None:
+        """라우터의 루트 목록에 맞춰 공유 Observer 감시 추가/제거 (_lock 보유 상태에서 호출)"""
+        desired = self._router.watch_roots()
+
+        # 새 감시를 먼저 추가하여 전환 중 이벤트 누락 방지 (중복은 debounce로 흡수)
+        for root in sorted(desired - self._watches.keys()):
+            if self._observer is None:
+                self._observer = self._create_observer()
+                self._observer.start()
+            self._watches[root] = self._observer.schedule(self._router, root, recursive=True)
+
+        for root in list(self._watches.keys() - desired):
+            watch = self._watches.pop(root)
+            try:
+                self._observer.unschedule(watch)
+            except Exception as e:
+                # 외부에서 삭제된 폴더 등
+                logger.warning(f"감시 해제 실패: {root} - {e}")
+
+        if not self._watches and self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=1.0)
+            self._observer = None
+
+    def _create_observer(self) -> BaseObserver:
+        """공유 Observer 생성 (폴링 모드는 적응형 주기)"""
+        if not self.use_polling:
+            return Observer()
+        observer = MarkdownPollingObserver(
+            timeout=self.poll_min_interval,
+            max_interval=self.poll_max_interval,
+            active_max_interval=self.poll_active_max_interval,
+        )
+        return observer
+
+    def set_active_folders(self, folder_ids: Iterable[int] | None) -> None:
+        """
+        WebSocket 구독 클라이언트가 있는 폴더 설정 (None이면 전체 - 구독 전 클라이언트 연결 중)
+
+        폴링 모드에서 새로 구독된 폴더의 감시만 최소 주기로 즉시 복귀시키고,
+        구독 중인 폴더는 poll_active_max_interval 이상으로 주기를 늘리지 않는다.
+        """
+        with self._lock:
+            self._active_folders = None if folder_ids is None else set(folder_ids)
+            self._apply_active_roots()
+
+    def _apply_active_roots(self) -> None:
+        """활성 폴더를 포함하는 Observer 감시 루트를 폴링 Observer에 전달 (_lock 보유 상태에서 호출)"""
+        if not isinstance(self._observer, MarkdownPollingObserver):
+            return
+        if self._active_folders is None:
+            roots = set(self._roots.values())
+        else:
+            roots = {self._roots[folder_id] for folder_id in self._active_folders if folder_id in self._roots}
+        # 중첩 폴더는 상위 폴더 감시를 공유하므로 해당 감시 루트를 활성화
+        self._observer.set_active_roots(
+            watch_root for watch_root in self._watches
+            if any(root == watch_root or root.startswith(os.path.join(watch_root, "")) for root in roots)
+        )
+
+    def notify_changes(self, folder_id: int, changes: list[tuple[str, str]]) -> None:
+        """
+        감시 밖에서 발견된 변경을 감시 이벤트와 같은 경로로 클라이언트에 전달
+
+        재시작 후 트리 스냅샷 대조에서 찾은 차이 등 (캐시는 호출 측에서 이미 반영)
+
+        Args:
+            folder_id: 폴더 ID
+            changes: (절대 경로, 이벤트 종류) 목록
+        """
+        with self._lock:
+            handler = self._handlers.get(folder_id)
+        if handler is None:
+            return
+        for path, event_type in changes:
+            handler.notify_change(path, event_type)
 
     async def _on_file_change(self, message: dict[str, Any]) -> None:
         """파일 변경 이벤트 처리"""
@@ -314,18 +610,41 @@ class FileWatcherService:
 
     def stop_all(self) -> None:
         """모든 폴더 감시 중지"""
-        folder_ids = list(self._observers.keys())
+        folder_ids = list(self._handlers.keys())
         for folder_id in folder_ids:
             self.remove_folder(folder_id)
+        self._scheduler.stop()
         logger.info("모든 폴더 감시 중지 완료")
 
+    @property
+    def tracks_all_files(self) -> bool:
+        """
+        비 마크다운 파일 변경도 이벤트로 받는지 여부
+
+        폴링 모드는 .md 파일만 추적하므로 전체 파일 트리(md_only=False)는 캐시로 갱신할 수 없음
+        """
+        return not self.use_polling
+
+    def is_watching(self, folder_id: int) -> bool:
+        """폴더 감시 여부 확인"""
+        return folder_id in self._handlers
+
     @property
     def watching_count(self) -> int:
         """현재 감시 중인 폴더 수"""
-        return len(self._observers)
+        return len(self._handlers)
 
 
 # 전역 FileWatcherService 인스턴스
 # 로컬 실행(Native) vs Docker(Polling) 자동 전환
 # settings.WATCHDOG_USE_POLLING 값 사용 (기본값 False)
-file_watcher = FileWatcherService(use_polling=settings.WATCHDOG_USE_POLLING)
+file_watcher = FileWatcherService(
+    use_polling=settings.WATCHDOG_USE_POLLING,
+    tree_cache=tree_cache,
+    content_cache=content_cache,
+    search_indexer=search_indexer,
+    quick_open=quick_open_index,
+    poll_min_interval=settings.WATCH_POLL_MIN_INTERVAL,
+    poll_max_interval=settings.WATCH_POLL_MAX_INTERVAL,
+    poll_active_max_interval=settings.WATCH_POLL_ACTIVE_MAX_INTERVAL,
+)
@@ -11,7 +11,9 @@ from sqlalchemy.orm import Session
 
 from pathlib import Path
 from loguru import logger
+from app.services.allowed_roots import AllowedRootIndex
 from app.services.file_watcher import FileWatcherService
+from app.services.search_indexer import SearchIndexer
 from app.core.config import Settings
 from app.models.folder import Folder
 from app.repositories.folder_repository import FolderRepository
@@ -25,11 +27,15 @@ class FolderService:
         self, 
         repository: FolderRepository, 
         file_watcher: FileWatcherService,
-        settings: Settings
+        settings: Settings,
+        allowed_roots: AllowedRootIndex | None = None,
+        search_indexer: SearchIndexer | None = None
     ) -> None:
         self._repository = repository
         self._file_watcher = file_watcher
         self._settings = settings
+        self._allowed_roots = allowed_roots
+        self._search_indexer = search_indexer
 
     def register_folder(self, data: FolderCreate) -> FolderResponse:
         """
@@ -41,7 +47,8 @@ class FolderService:
         3. 디렉토리 여부 확인
         4. 중복 경로 확인
         5. DB 저장
-        6. Watcher 추가
+        6. Watcher 추가 및 허용 루트 인덱스 갱신
+        7. 검색 색인 작업 추가 (백그라운드)
         """
         # 1. 경로 정규화 및 보안 검사
         path = data.path
@@ -68,8 +75,14 @@ class FolderService:
         # 5. DB 저장
         folder: Folder = self._repository.create(name=data.name, path=path)
 
-        # 6. Watcher 추가
+        # 6. Watcher 추가 및 허용 루트 인덱스 갱신
         self._file_watcher.add_folder(folder.id, folder.path)
+        if self._allowed_roots is not None:
+            self._allowed_roots.add(folder.path)
+
+        # 7. 검색 색인 작업 추가 (백그라운드)
+        if self._search_indexer is not None:
+            self._search_indexer.enqueue_folder(folder.id, folder.path)
 
         return FolderResponse(
             id=folder.id,
@@ -84,9 +97,14 @@ class FolderService:
         
         - DB에 있는 모든 폴더를 조회하여 Watcher에 등록
         - 실제 존재하지 않는 폴더는 경고 로그 출력 후 스킵
+        - 허용 루트 인덱스를 DB 기준으로 재구성
+        - 검색 색인 동기화 (백그라운드, 저장된 mtime/size와 다른 파일만 재색인)
         """
         folders = self._repository.find_all()
         logger.info(f"기존 폴더 {len(folders)}개 감시 초기화 시작")
+
+        if self._allowed_roots is not None:
+            self._allowed_roots.replace(folder.path for folder in folders)
         
         for folder in folders:
             if not os.path.exists(folder.path):
@@ -94,6 +112,8 @@ class FolderService:
                 continue
                 
             self._file_watcher.add_folder(folder.id, folder.path)
+            if self._search_indexer is not None:
+                self._search_indexer.enqueue_folder(folder.id, folder.path)
 
     def get_folder_by_id(self, folder_id: int) -> Folder | None:
         """ID로 폴더 조회"""
@@ -105,9 +125,14 @@ class FolderService:
 
     def delete_folder(self, folder_id: int) -> bool:
         """폴더 삭제"""
+        folder = self._repository.find_by_id(folder_id) if self._allowed_roots is not None else None
         result = self._repository.delete(folder_id)
         if result:
             self._file_watcher.remove_folder(folder_id)
+            if folder is not None:
+                self._allowed_roots.remove(folder.path)
+            if self._search_indexer is not None:
+                self._search_indexer.remove_folder(folder_id)
         return result
 
 
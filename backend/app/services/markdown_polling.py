@@ -0,0 +1,356 @@
+"""
+마크다운 전용 폴링 감시
+
+Spec: spec/api/file-watch-websocket.md - 섹션 5, 8
+Docker 환경(WATCHDOG_USE_POLLING=true)용 watchdog PollingObserver 대체 구현
+
+watchdog PollingObserver는 주기마다 폴더 전체(node_modules, .git 포함)를 다시 stat하지만,
+MarkdownPollingObserver는 다음만 추적한다.
+- 숨김 폴더 / IGNORED_DIRS는 탐색 단계에서 제외 (트리, 검색 대조와 같은 is_excluded_dir 규칙)
+- 폴더: mtime이 바뀐 경우에만 다시 나열 (scandir)
+- 파일: .md 파일만 stat 하여 수정 여부 확인
+
+비 마크다운 파일의 생성/삭제 이벤트는 발생하지 않는다 (FileWatcherService.tracks_all_files).
+
+폴링 주기는 폴더(감시 루트)별로 적응형:
+- 변경이 없으면 최소 주기부터 2배씩 최대 주기까지 증가
+- 변경 감지 또는 클라이언트 구독 시작(set_active_roots) 시 최소 주기로 복귀
+- 구독 클라이언트가 있는 감시 루트만 active 상한 적용 (구독자 없는 폴더는 최대 주기까지 증가)
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from functools import partial
+
+from watchdog.events import (
+    DirCreatedEvent, DirDeletedEvent, DirMovedEvent,
+    FileCreatedEvent, FileDeletedEvent, FileModifiedEvent, FileMovedEvent,
+    FileSystemEvent,
+)
+from watchdog.observers.api import DEFAULT_EMITTER_TIMEOUT, DEFAULT_OBSERVER_TIMEOUT, BaseObserver, EventEmitter
+
+from app.utils.tree_builder import is_excluded_dir
+
+
+# mtime 해상도가 낮은 파일 시스템 대비: 직전 스캔 시점과 가까운 mtime의 폴더는 다시 나열
+RACY_SECONDS = 2.0
+
+
+class _DirState:
+    """폴더 스냅샷 (하위 폴더 이름, .md 파일 stat)"""
+
+    __slots__ = ("ino", "mtime_ns", "dirs", "files")
+
+    def __init__(self, ino: int, mtime_ns: int) -> None:
+        self.ino = ino
+        self.mtime_ns = mtime_ns
+        self.dirs: set[str] = set()
+        self.files: dict[str, tuple[int, int, int]] = {}  # 파일명 -> (inode, mtime_ns, size)
+
+
+class _Changes:
+    """한 번의 poll에서 수집한 변경 (이동 판별 전)"""
+
+    def __init__(self) -> None:
+        self.files_created: dict[str, int] = {}  # 경로 -> inode
+        self.files_deleted: dict[str, int] = {}
+        self.files_modified: list[str] = []
+        self.dirs_created: dict[str, int] = {}
+        self.dirs_deleted: dict[str, int] = {}
+
+
+class MarkdownSnapshot:
+    """마크다운 전용 증분 폴더 스냅샷"""
+
+    def __init__(self, root: str, recursive: bool = True) -> None:
+        """
+        Args:
+            root: 감시 폴더 경로
+            recursive: 하위 폴더 포함 여부
+        """
+        self.root = root
+        self.recursive = recursive
+        self._dirs: dict[str, _DirState] = {}  # 폴더 경로 -> 스냅샷
+        self._scan_time = 0.0
+
+    def scan(self) -> None:
+        """전체 스냅샷 생성 (이벤트 없음)"""
+        self._dirs.clear()
+        self.poll()
+
+    def poll(self) -> list[FileSystemEvent]:
+        """
+        직전 스냅샷 이후 변경 이벤트 계산 및 스냅샷 갱신
+
+        Returns:
+            watchdog 이벤트 목록 (삭제 → 생성 → 수정 → 이동 순)
+
+        Raises:
+            OSError: 감시 폴더 자체에 접근할 수 없는 경우
+        """
+        initial = not self._dirs
+        racy_ns = int((self._scan_time - RACY_SECONDS) * 1_000_000_000)
+        self._scan_time = time.time()
+        changes = _Changes()
+
+        stack = [self.root]
+        while stack:
+            path = stack.pop()
+            try:
+                stat_result = os.stat(path)
+            except OSError:
+                if path == self.root:
+                    raise
+                self._drop(path, changes)
+                continue
+
+            state = self._dirs.get(path)
+            if (
+                state is None
+                or state.ino != stat_result.st_ino
+                or state.mtime_ns != stat_result.st_mtime_ns
+                or stat_result.st_mtime_ns >= racy_ns
+            ):
+                state = self._relist(path, stat_result, state, changes, initial)
+            else:
+                self._check_files(path, state, changes)
+
+            if self.recursive:
+                stack.extend(os.path.join(path, name) for name in state.dirs)
+
+        return [] if initial else self._to_events(changes)
+
+    def _relist(
+        self,
+        path: str,
+        stat_result: os.stat_result,
+        old: _DirState | None,
+        changes: _Changes,
+        initial: bool,
+    ) -> _DirState:
+        state = _DirState(stat_result.st_ino, stat_result.st_mtime_ns)
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("."):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not is_excluded_dir(name):
+                                state.dirs.add(name)
+                        elif entry.is_file(follow_symlinks=False) and name.lower().endswith(".md"):
+                            entry_stat = entry.stat(follow_symlinks=False)
+                            state.files[name] = (
+                                entry_stat.st_ino, entry_stat.st_mtime_ns, entry_stat.st_size
+                            )
+                    except OSError:
+                        continue
+        except OSError:
+            if path == self.root:
+                raise
+            # 권한 등으로 나열 불가: 이전 상태 유지
+            return old if old is not None else state
+
+        self._dirs[path] = state
+
+        if initial:
+            return state
+        if old is None:
+            # 새로 생긴 폴더 (루트는 최초 스캔에서 등록됨)
+            changes.dirs_created[path] = stat_result.st_ino
+            for name, (ino, _, _) in state.files.items():
+                changes.files_created[os.path.join(path, name)] = ino
+            return state
+
+        for name, file_state in state.files.items():
+            file_path = os.path.join(path, name)
+            old_file = old.files.get(name)
+            if old_file is None:
+                changes.files_created[file_path] = file_state[0]
+            elif old_file != file_state:
+                # inode 변경(원자적 저장)도 같은 경로의 수정으로 처리
+                changes.files_modified.append(file_path)
+        for name, (ino, _, _) in old.files.items():
+            if name not in state.files:
+                changes.files_deleted[os.path.join(path, name)] = ino
+        for name in old.dirs - state.dirs:
+            self._drop(os.path.join(path, name), changes)
+        return state
+
+    def _check_files(self, path: str, state: _DirState, changes: _Changes) -> None:
+        # 폴더 목록이 그대로인 경우: 추적 중인 .md 파일만 stat
+        for name, file_state in list(state.files.items()):
+            file_path = os.path.join(path, name)
+            try:
+                file_stat = os.stat(file_path, follow_symlinks=False)
+            except OSError:
+                del state.files[name]
+                changes.files_deleted[file_path] = file_state[0]
+                continue
+            current = (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+            if current != file_state:
+                state.files[name] = current
+                changes.files_modified.append(file_path)
+
+    def _drop(self, path: str, changes: _Changes) -> None:
+        # 사라진 폴더와 하위 항목을 삭제로 기록
+        state = self._dirs.pop(path, None)
+        if state is None:
+            return
+        changes.dirs_deleted[path] = state.ino
+        for name, (ino, _, _) in state.files.items():
+            changes.files_deleted[os.path.join(path, name)] = ino
+        for name in state.dirs:
+            self._drop(os.path.join(path, name), changes)
+
+    @staticmethod
+    def _pair_moves(deleted: dict[str, int], created: dict[str, int]) -> list[tuple[str, str]]:
+        # 같은 inode가 삭제/생성되었으면 이동으로 판단
+        created_by_ino = {ino: path for path, ino in created.items()}
+        moves = []
+        for src_path, ino in list(deleted.items()):
+            dest_path = created_by_ino.get(ino)
+            if dest_path is not None and dest_path in created:
+                moves.append((src_path, dest_path))
+                del deleted[src_path]
+                del created[dest_path]
+        return moves
+
+    def _to_events(self, changes: _Changes) -> list[FileSystemEvent]:
+        dir_moves = self._pair_moves(changes.dirs_deleted, changes.dirs_created)
+        file_moves = self._pair_moves(changes.files_deleted, changes.files_created)
+
+        events: list[FileSystemEvent] = []
+        events.extend(FileDeletedEvent(path) for path in changes.files_deleted)
+        events.extend(DirDeletedEvent(path) for path in changes.dirs_deleted)
+        events.extend(DirCreatedEvent(path) for path in changes.dirs_created)
+        events.extend(FileCreatedEvent(path) for path in changes.files_created)
+        events.extend(FileModifiedEvent(path) for path in changes.files_modified)
+        events.extend(DirMovedEvent(src, dest) for src, dest in dir_moves)
+        events.extend(FileMovedEvent(src, dest) for src, dest in file_moves)
+        return events
+
+
+class MarkdownPollingEmitter(EventEmitter):
+    """MarkdownSnapshot 기반 폴링 emitter (적응형 주기)"""
+
+    BACKOFF_FACTOR = 2.0
+
+    def __init__(
+        self,
+        event_queue,
+        watch,
+        timeout=DEFAULT_EMITTER_TIMEOUT,
+        max_interval: float | None = None,
+        active_max_interval: float | None = None,
+        is_active: Callable[[str], bool] | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        Args:
+            timeout: 최소 폴링 주기 (초)
+            max_interval: 변경이 없을 때 최대 폴링 주기 (None이면 고정 주기)
+            active_max_interval: is_active(감시 경로)가 True일 때 최대 폴링 주기
+            is_active: 감시 경로의 구독 클라이언트 여부 조회 함수
+        """
+        super().__init__(event_queue, watch, timeout, **kwargs)
+        self.min_interval = timeout
+        self.max_interval = max(max_interval or timeout, timeout)
+        self.active_max_interval = max(active_max_interval or self.max_interval, timeout)
+        self.interval = timeout
+        self._is_active = is_active or (lambda path: False)
+        self._snapshot = MarkdownSnapshot(watch.path, watch.is_recursive)
+        self._lock = threading.Lock()
+        self._wake_event = threading.Event()
+
+    def wake(self) -> None:
+        """최소 주기로 복귀하고 즉시 다음 poll 수행"""
+        self.interval = self.min_interval
+        self._wake_event.set()
+
+    def on_thread_start(self) -> None:
+        try:
+            self._snapshot.scan()
+        except OSError:
+            pass  # 첫 poll에서 삭제 이벤트로 처리
+
+    def on_thread_stop(self) -> None:
+        self._wake_event.set()
+
+    def queue_events(self, timeout: float) -> None:
+        # 폴링 emitter에서 timeout 대신 적응형 주기만큼 대기 (wake/stop 시 즉시 깨어남)
+        self._wake_event.wait(self.interval)
+        self._wake_event.clear()
+
+        with self._lock:
+            if not self.should_keep_running():
+                return
+            try:
+                events = self._snapshot.poll()
+            except OSError:
+                self.queue_event(DirDeletedEvent(self.watch.path))
+                self.stop()
+                return
+            for event in events:
+                self.queue_event(event)
+            self._adjust_interval(bool(events))
+
+    def _adjust_interval(self, changed: bool) -> None:
+        if changed:
+            self.interval = self.min_interval
+            return
+        ceiling = self.active_max_interval if self._is_active(self.watch.path) else self.max_interval
+        self.interval = min(self.interval * self.BACKOFF_FACTOR, ceiling)
+
+
+class MarkdownPollingObserver(BaseObserver):
+    """마크다운 전용 폴링 Observer (PollingObserver 대체)"""
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_OBSERVER_TIMEOUT,
+        max_interval: float | None = None,
+        active_max_interval: float | None = None,
+    ) -> None:
+        """
+        Args:
+            timeout: 최소 폴링 주기 (초)
+            max_interval: 변경이 없을 때 최대 폴링 주기 (None이면 고정 주기)
+            active_max_interval: 구독 클라이언트가 있는 감시 루트의 최대 폴링 주기
+        """
+        self._active_roots: frozenset[str] = frozenset()
+        emitter_class = partial(
+            MarkdownPollingEmitter,
+            max_interval=max_interval,
+            active_max_interval=active_max_interval,
+            is_active=self.is_active_root,
+        )
+        super().__init__(emitter_class, timeout=timeout)
+
+    def is_active_root(self, path: str) -> bool:
+        """감시 루트의 구독 클라이언트 여부"""
+        return path in self._active_roots
+
+    def set_active_roots(self, roots: Iterable[str]) -> None:
+        """
+        구독 클라이언트가 있는 감시 루트 설정
+
+        새로 활성화된 루트의 emitter만 최소 주기로 복귀 (다른 폴더는 깨우지 않음)
+        """
+        roots = frozenset(roots)
+        added = roots - self._active_roots
+        self._active_roots = roots
+        if added:
+            self.wake(added)
+
+    def wake(self, roots: Iterable[str] | None = None) -> None:
+        """emitter를 최소 주기로 복귀 (roots 지정 시 해당 감시 루트만)"""
+        roots = None if roots is None else set(roots)
+        for emitter in list(self.emitters):
+            if not isinstance(emitter, MarkdownPollingEmitter):
+                continue
+            if roots is None or emitter.watch.path in roots:
+                emitter.wake()
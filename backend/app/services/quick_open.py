@@ -0,0 +1,210 @@
+"""
+빠른 열기(Ctrl+P) 경로 인덱스 서비스
+
+감시 중인 폴더의 마크다운 상대 경로를 FuzzyPathIndex로 메모리에 유지
+FileWatcherService가 폴더 추가/제거와 구조 변경 이벤트를 전달한다.
+
+- 폴더 추가 시 백그라운드 스레드 1개에서 경로 목록을 만들어 일괄 추가 (요청 처리를 막지 않음)
+  트리 캐시가 있으면 트리 인덱스(스냅샷 + 디스크 대조 결과)를 재사용하여 폴더를 다시 탐색하지 않음
+- 탐색 도중 들어온 변경은 기록해 두었다가 탐색 완료 후 디스크 기준으로 다시 반영
+- 삭제가 많이 쌓이면 같은 스레드에서 인덱스 재구성
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from loguru import logger
+
+from app.core.config import settings
+from app.services.tree_cache import TreeCache, tree_cache
+from app.utils.fuzzy_index import FuzzyPathIndex
+from app.utils.tree_builder import is_excluded_path, scan_tree
+
+
+class QuickOpenIndex:
+    """빠른 열기 경로 인덱스 (Thread-safe)"""
+
+    def __init__(self, scan_workers: int = 1, tree_cache: TreeCache | None = None) -> None:
+        """
+        Args:
+            scan_workers: 폴더 탐색 스레드 수
+            tree_cache: 경로 목록을 가져올 트리 캐시 (None이면 직접 탐색)
+        """
+        self.scan_workers = max(1, scan_workers)
+        self.tree_cache = tree_cache
+        self._index = FuzzyPathIndex()
+        self._roots: dict[int, str] = {}  # folder_id -> 폴더 절대 경로
+        self._generations: dict[int, int] = {}  # folder_id -> 추가/제거 카운터 (늦게 끝난 탐색 무시)
+        self._building: dict[int, set[tuple[str, bool]]] = {}  # folder_id -> 탐색 중 변경된 (경로, 디렉토리 여부)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quick-open")
+        self._compaction_pending = False
+        self._lock = threading.Lock()
+
+    def add_folder(self, folder_id: int, path: str) -> None:
+        """폴더 경로 색인 시작 (백그라운드)"""
+        root = os.path.abspath(path)
+        with self._lock:
+            self._roots[folder_id] = root
+            generation = self._generations.get(folder_id, 0) + 1
+            self._generations[folder_id] = generation
+            self._building[folder_id] = set()
+        self._executor.submit(self._build, folder_id, root, generation)
+
+    def remove_folder(self, folder_id: int) -> None:
+        """폴더 경로 제거"""
+        with self._lock:
+            self._roots.pop(folder_id, None)
+            self._generations[folder_id] = self._generations.get(folder_id, 0) + 1
+            self._building.pop(folder_id, None)
+        self._index.remove_folder(folder_id)
+        self._schedule_compaction()
+
+    def apply_change(self, folder_id: int, path: str, is_directory: bool = False) -> None:
+        """
+        구조 변경(생성/삭제/이동)된 경로를 디스크 기준으로 반영
+
+        Args:
+            folder_id: 폴더 ID
+            path: 변경된 파일/디렉토리 절대 경로
+            is_directory: 디렉토리 이벤트 여부 (삭제 시 하위 경로도 제거)
+        """
+        with self._lock:
+            root = self._roots.get(folder_id)
+            if root is None:
+                return
+            building = self._building.get(folder_id)
+            if building is not None:
+                building.add((path, is_directory))
+        self._sync(folder_id, root, path, is_directory)
+
+    def search(self, query: str, limit: int = 20, folder_id: int | None = None) -> list[dict[str, Any]]:
+        """
+        퍼지 검색
+
+        Args:
+            query: 검색어
+            limit: 최대 결과 수
+            folder_id: 지정 시 해당 폴더만 검색
+
+        Returns:
+            folder_id, path(절대 경로), relative_path, matches(relative_path 내 일치 위치), score 딕셔너리 목록
+        """
+        with self._lock:
+            roots = dict(self._roots)
+        results = []
+        for result_folder_id, rel_path, score, positions in self._index.search(query, limit, folder_id):
+            root = roots.get(result_folder_id)
+            if root is None:
+                continue
+            results.append({
+                "folder_id": result_folder_id,
+                "path": os.path.join(root, rel_path),
+                "relative_path": rel_path,
+                "matches": positions,
+                "score": score,
+            })
+        return results
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """대기 중인 탐색 작업이 끝날 때까지 대기 (완료 여부 반환)"""
+        try:
+            self._executor.submit(lambda: None).result(timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    @property
+    def path_count(self) -> int:
+        """색인된 경로 수"""
+        return len(self._index)
+
+    def _build(self, folder_id: int, root: str, generation: int) -> None:
+        """폴더 경로 목록 일괄 추가 (executor 스레드)"""
+        with self._lock:
+            if self._generations.get(folder_id) != generation:
+                return  # 시작 전에 폴더가 제거됨
+        try:
+            if self.tree_cache is not None:
+                paths = self._index_paths(self.tree_cache.get_scans(folder_id, root, md_only=True))
+            else:
+                paths = self._relative_paths(root, scan_tree(root, md_only=True, max_workers=self.scan_workers))
+            added = self._index.add_many(folder_id, paths)
+        except Exception as e:
+            logger.exception(f"빠른 열기 색인 오류: {folder_id} - {e}")
+            added = 0
+
+        with self._lock:
+            if self._generations.get(folder_id) != generation:
+                # 탐색 도중 폴더가 제거됨 (재추가된 경우 다음 탐색이 다시 채움)
+                stale = True
+                changes: set[tuple[str, bool]] = set()
+            else:
+                stale = False
+                changes = self._building.pop(folder_id, set())
+        if stale:
+            self._index.remove_folder(folder_id)
+            return
+
+        for path, is_directory in changes:
+            self._sync(folder_id, root, path, is_directory)
+        logger.info(f"빠른 열기 색인 완료: 폴더 {folder_id} - 경로 {added}개")
+
+    def _sync(self, folder_id: int, root: str, path: str, is_directory: bool) -> None:
+        """경로 1개를 디스크와 동기화"""
+        rel_path = os.path.relpath(path, root)
+        if rel_path == os.curdir or rel_path.startswith(os.pardir) or is_excluded_path(rel_path):
+            return
+        rel_path = rel_path.replace(os.sep, "/")
+
+        if os.path.isdir(path):
+            scans = scan_tree(path, md_only=True, max_workers=1)
+            self._index.add_many(folder_id, self._relative_paths(root, scans))
+        elif os.path.isfile(path):
+            if path.lower().endswith(".md"):
+                self._index.add(folder_id, rel_path)
+        else:
+            self._index.remove(folder_id, rel_path)
+            if is_directory:
+                self._index.remove_prefix(folder_id, rel_path)
+            self._schedule_compaction()
+
+    def _schedule_compaction(self) -> None:
+        if not self._index.needs_compaction:
+            return
+        with self._lock:
+            if self._compaction_pending:
+                return
+            self._compaction_pending = True
+        self._executor.submit(self._compact)
+
+    def _compact(self) -> None:
+        """인덱스 재구성 (executor 스레드)"""
+        with self._lock:
+            self._compaction_pending = False
+        if self._index.compact():
+            logger.debug(f"빠른 열기 인덱스 재구성: 경로 {len(self._index)}개")
+
+    @staticmethod
+    def _index_paths(scans: dict[str, tuple[list[str], list[str]]]) -> list[str]:
+        """트리 인덱스 탐색 결과(상대 폴더 경로 키) → 폴더 기준 상대 경로 ("/" 구분)"""
+        paths = []
+        for rel_dir, (_, files) in scans.items():
+            prefix = rel_dir.replace(os.sep, "/") + "/" if rel_dir else ""
+            paths.extend(prefix + name for name in files)
+        return paths
+
+    @staticmethod
+    def _relative_paths(root: str, scans: dict[str, tuple[list[str], list[str]]]) -> list[str]:
+        """탐색 결과 → 폴더 기준 상대 경로 ("/" 구분)"""
+        paths = []
+        for dir_path, (_, files) in scans.items():
+            rel_dir = os.path.relpath(dir_path, root).replace(os.sep, "/")
+            prefix = "" if rel_dir == os.curdir else rel_dir + "/"
+            paths.extend(prefix + name for name in files)
+        return paths
+
+
+# 전역 QuickOpenIndex 인스턴스
+quick_open_index = QuickOpenIndex(scan_workers=settings.TREE_SCAN_WORKERS, tree_cache=tree_cache)
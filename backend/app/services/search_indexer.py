@@ -0,0 +1,315 @@
+"""
+검색 인덱서
+
+등록 폴더의 마크다운 파일을 SQLite FTS5 검색 인덱스에 색인 (백그라운드 스레드 1개)
+
+- 폴더 등록 / 서버 시작 시 폴더 단위 동기화 작업을 큐에 추가 (같은 폴더 작업은 하나로 합침)
+- 폴더 동기화는 저장된 (mtime, size)와 디스크를 비교하여 바뀐 파일만 다시 읽음
+- 파일 감시 이벤트는 경로별 debounce 후 해당 파일(또는 디렉토리 하위)만 재색인/삭제
+- 배치 단위로 commit하여 API 요청과 DB 쓰기 잠금 경쟁을 짧게 유지
+- 폴더 삭제 시 해당 폴더 문서 제거 (중첩 등록 폴더의 같은 파일은 폴더별 문서라 유지)
+- 작업은 추가 시점의 세션 팩토리(DB)를 사용
+"""
+
+import os
+import stat
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db import database
+from app.repositories.search_repository import SearchRepository
+from app.utils.debounce_scheduler import DebounceScheduler
+from app.utils.search_query import extract_title
+from app.utils.tree_builder import scan_tree
+
+
+SessionFactory = Callable[[], Session]
+
+# 경로 단위 재색인 작업 키 (대기 중인 경로는 _dirty에 모아 한 작업으로 처리)
+_PATHS_JOB = "paths"
+
+
+class SearchIndexer:
+    """검색 인덱스 백그라운드 색인 (Thread-safe)"""
+
+    def __init__(
+        self,
+        max_file_bytes: int,
+        batch_size: int = 200,
+        scan_workers: int = 1,
+        debounce_seconds: float = 1.0,
+        scheduler: DebounceScheduler | None = None,
+    ) -> None:
+        """
+        Args:
+            max_file_bytes: 본문 색인 최대 파일 크기 (초과 시 제목만 색인)
+            batch_size: 한 트랜잭션에 기록할 문서 수
+            scan_workers: 폴더 탐색 스레드 수
+            debounce_seconds: 파일 변경 후 재색인까지 대기 시간 (연속 저장은 1회만 재색인)
+            scheduler: debounce 스케줄러 (None이면 인덱서 전용 스케줄러 생성)
+        """
+        self.max_file_bytes = max_file_bytes
+        self.batch_size = max(1, batch_size)
+        self.scan_workers = max(1, scan_workers)
+        self.debounce_seconds = debounce_seconds
+        self.scheduler = scheduler if scheduler is not None else DebounceScheduler(name="search-index-debounce")
+        # 작업 키 -> (작업 함수, 인자) - 같은 키의 대기 작업은 마지막 것만 유지
+        self._pending: OrderedDict[Hashable, tuple[Callable[..., None], tuple]] = OrderedDict()
+        # 재색인 대기 (folder_id, 경로) -> (디렉토리 여부, 세션 팩토리)
+        self._dirty: dict[tuple[int, str], tuple[bool, SessionFactory]] = {}
+        # 삭제된 폴더 (삭제 후 늦게 도착한 감시 이벤트 무시, 재등록 시 해제)
+        self._removed_folders: set[int] = set()
+        self._busy = False
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+    def enqueue_folder(self, folder_id: int, path: str) -> None:
+        """폴더 동기화 작업 추가 (바뀐 파일만 재색인, 없어진 파일 삭제)"""
+        session_factory = database.get_session_factory()
+        with self._condition:
+            self._removed_folders.discard(folder_id)
+            self._submit(("folder", folder_id), self._index_folder, (session_factory, folder_id, path))
+
+    def remove_folder(self, folder_id: int) -> None:
+        """폴더 문서 삭제 작업 추가 (대기 중인 색인 작업은 취소)"""
+        session_factory = database.get_session_factory()
+        with self._condition:
+            self._removed_folders.add(folder_id)
+            for key in [key for key in self._dirty if key[0] == folder_id]:
+                del self._dirty[key]
+            self._submit(("folder", folder_id), self._delete_folder, (session_factory, folder_id))
+
+    def schedule_path(self, folder_id: int, path: str, is_directory: bool = False) -> None:
+        """
+        파일 감시 이벤트로 경로 재색인 예약 (경로별 debounce)
+
+        Args:
+            folder_id: 경로가 속한 폴더 ID
+            path: 생성/수정/삭제/이동된 파일 또는 디렉토리 경로
+            is_directory: 디렉토리면 하위 문서 전체를 디스크와 동기화
+        """
+        self.scheduler.schedule(
+            self._on_paths_due, (folder_id, path), (folder_id, path, is_directory), self.debounce_seconds
+        )
+
+    def enqueue_paths(self, items: Iterable[tuple[int, str, bool]]) -> None:
+        """경로 재색인 작업 추가 ((folder_id, 경로, 디렉토리 여부) 목록)"""
+        session_factory = database.get_session_factory()
+        with self._condition:
+            for folder_id, path, is_directory in items:
+                if folder_id in self._removed_folders:
+                    continue
+                self._dirty[(folder_id, path)] = (is_directory, session_factory)
+            if self._dirty and _PATHS_JOB not in self._pending:
+                self._submit(_PATHS_JOB, self._index_paths, ())
+
+    def _on_paths_due(self, items: list[tuple[int, str, bool]]) -> None:
+        """debounce 기한이 지난 경로 (스케줄러 스레드에서 호출)"""
+        self.enqueue_paths(items)
+
+    def _submit(self, key: Hashable, job: Callable[..., None], args: tuple) -> None:
+        with self._condition:
+            self._pending.pop(key, None)
+            self._pending[key] = (job, args)
+            if self._thread is None or not self._thread.is_alive():
+                self._stop_event = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._stop_event,), name="search-indexer", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """대기 작업이 모두 끝날 때까지 대기 (완료 여부 반환, debounce 대기 중인 경로는 제외)"""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """대기 작업 취소 후 스레드 종료 (진행 중인 폴더 색인은 다음 배치에서 중단)"""
+        self.scheduler.cancel_all(self._on_paths_due)
+        with self._condition:
+            self._pending.clear()
+            self._dirty.clear()
+            self._stop_event.set()
+            thread = self._thread
+            self._thread = None
+            self._condition.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    @property
+    def pending_count(self) -> int:
+        """대기 중인 작업 수"""
+        with self._condition:
+            return len(self._pending)
+
+    def _run(self, stop_event: threading.Event) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not stop_event.is_set():
+                    self._condition.wait()
+                if stop_event.is_set():
+                    return
+                _, (job, args) = self._pending.popitem(last=False)
+                self._busy = True
+            try:
+                job(stop_event, *args)
+            except Exception as e:
+                logger.exception(f"검색 색인 오류: {e}")
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _index_folder(
+        self, stop_event: threading.Event, session_factory: SessionFactory, folder_id: int, path: str
+    ) -> None:
+        """폴더 동기화 (저장된 mtime/size와 다른 파일만 재색인, 없어진 파일 문서 삭제)"""
+        scans = scan_tree(path, md_only=True, max_workers=self.scan_workers)
+        db = session_factory()
+        try:
+            repository = SearchRepository(db)
+            stored = repository.stats_by_folder(folder_id)
+            stale = set(stored)
+            total = changed = 0
+            for dir_path, (_, files) in scans.items():
+                for name in files:
+                    file_path = os.path.join(dir_path, name)
+                    stale.discard(file_path)
+                    total += 1
+                    if not self._sync_path(repository, folder_id, file_path, stored.get(file_path)):
+                        continue
+                    changed += 1
+                    if changed % self.batch_size == 0:
+                        if stop_event.is_set():
+                            repository.rollback()
+                            return
+                        repository.commit()
+            repository.delete_paths(folder_id, stale)
+            repository.commit()
+            logger.info(
+                f"검색 색인 동기화: 폴더 {folder_id} - 파일 {total}개 중 변경 {changed}개, 삭제 {len(stale)}개"
+            )
+        finally:
+            db.close()
+
+    def _index_paths(self, stop_event: threading.Event) -> None:
+        """감시 이벤트로 예약된 경로 재색인 (세션 팩토리, 폴더별로 묶어 처리)"""
+        with self._condition:
+            dirty, self._dirty = self._dirty, {}
+        groups: dict[SessionFactory, dict[int, list[tuple[str, bool]]]] = {}
+        for (folder_id, path), (is_directory, session_factory) in dirty.items():
+            groups.setdefault(session_factory, {}).setdefault(folder_id, []).append((path, is_directory))
+
+        for session_factory, folders in groups.items():
+            if stop_event.is_set():
+                return
+            db = session_factory()
+            try:
+                repository = SearchRepository(db)
+                changed = 0
+                for folder_id, entries in folders.items():
+                    stored = repository.stats_for_paths(
+                        folder_id, (path for path, is_directory in entries if not is_directory)
+                    )
+                    for path, is_directory in entries:
+                        if is_directory:
+                            changed += self._sync_directory(repository, folder_id, path)
+                        elif self._sync_path(repository, folder_id, path, stored.get(path)):
+                            changed += 1
+                repository.commit()
+                logger.debug(
+                    f"검색 색인 갱신: 경로 {sum(map(len, folders.values()))}개 - 변경 {changed}개"
+                )
+            finally:
+                db.close()
+
+    def _sync_directory(self, repository: SearchRepository, folder_id: int, path: str) -> int:
+        """디렉토리 하위 문서를 디스크와 동기화 (이동/삭제된 디렉토리 포함, 변경 문서 수 반환)"""
+        stored = repository.stats_under(folder_id, path)
+        scans = scan_tree(path, md_only=True, max_workers=self.scan_workers) if os.path.isdir(path) else {}
+        stale = set(stored)
+        changed = 0
+        for dir_path, (_, files) in scans.items():
+            for name in files:
+                file_path = os.path.join(dir_path, name)
+                stale.discard(file_path)
+                if self._sync_path(repository, folder_id, file_path, stored.get(file_path)):
+                    changed += 1
+        return changed + repository.delete_paths(folder_id, stale)
+
+    def _sync_path(
+        self,
+        repository: SearchRepository,
+        folder_id: int,
+        path: str,
+        stored_stat: tuple[int, int] | None,
+    ) -> bool:
+        """
+        파일 1개를 디스크와 동기화 (commit하지 않음)
+
+        Args:
+            repository: 검색 인덱스 리포지토리
+            folder_id: 파일이 속한 폴더 ID
+            path: 파일 경로
+            stored_stat: 색인된 (mtime_ns, size), 색인되지 않았으면 None
+
+        Returns:
+            색인을 변경했으면 True (mtime/size가 같으면 파일을 읽지 않고 False)
+        """
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            stat_result = None
+        if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+            return stored_stat is not None and repository.delete_paths(folder_id, [path]) > 0
+        if stored_stat == (stat_result.st_mtime_ns, stat_result.st_size):
+            return False
+        document = self._read_document(path)
+        if document is None:
+            return False
+        repository.upsert(folder_id, path, *document)
+        return True
+
+    def _delete_folder(
+        self, stop_event: threading.Event, session_factory: SessionFactory, folder_id: int
+    ) -> None:
+        """폴더 문서 삭제"""
+        db = session_factory()
+        try:
+            repository = SearchRepository(db)
+            deleted = repository.delete_folder(folder_id)
+            repository.commit()
+            logger.info(f"검색 색인 삭제: 폴더 {folder_id} - 문서 {deleted}개")
+        finally:
+            db.close()
+
+    def _read_document(self, path: str) -> tuple[str, str, int, int] | None:
+        """
+        파일 → (제목, 본문, mtime_ns, size)
+
+        크기 제한을 넘는 파일은 제목(파일 이름)만 색인하고, 읽을 수 없으면 None
+        """
+        try:
+            stat_result = os.stat(path)
+            if stat_result.st_size > self.max_file_bytes:
+                return extract_title("", path), "", stat_result.st_mtime_ns, stat_result.st_size
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                body = f.read()
+        except OSError as e:
+            logger.warning(f"검색 색인 파일 읽기 실패: {path} - {e}")
+            return None
+        return extract_title(body, path), body, stat_result.st_mtime_ns, stat_result.st_size
+
+
+# 전역 SearchIndexer 인스턴스
+search_indexer = SearchIndexer(
+    max_file_bytes=settings.SEARCH_INDEX_MAX_FILE_BYTES,
+    scan_workers=settings.TREE_SCAN_WORKERS,
+)
@@ -0,0 +1,303 @@
+"""
+폴더 트리 캐시 서비스
+
+Spec: spec/api/folder-tree.md
+GET /api/folders/{id}/tree 결과를 (folder_id, md_only) 단위의 TreeIndex로 메모리에 유지하고
+FileWatcher 이벤트로 변경된 경로만 패치한다.
+
+- 감시 중인 폴더만 캐싱 (이벤트로 갱신을 보장할 수 있는 경우)
+- 빌드(스냅샷 복원) 도중 들어온 변경 경로는 기록해 두었다가 빌드 결과에 반영 후 캐시
+  (변경이 잦은 폴더에서도 빌드 결과를 버리지 않음, 무효화된 경우에만 버림)
+- generation은 트리 ETag로도 사용 (프로세스별 epoch 포함, 재시작 시 충돌 방지)
+- 스냅샷 저장소가 있으면 첫 조회는 저장된 인덱스로 바로 응답하고 백그라운드에서 디스크와 대조
+  (차이는 감시 이벤트와 같은 경로로 패치 후 drift 콜백으로 알림), 변경된 인덱스는 저장 예약
+"""
+
+import os
+import threading
+import uuid
+from typing import Callable
+
+from loguru import logger
+
+from app.core.config import settings
+from app.schemas.folder import TreeNode
+from app.services.tree_snapshots import TreeSnapshotStore, tree_snapshots
+from app.utils.tree_builder import is_excluded_path
+from app.utils.tree_index import TreeIndex
+
+
+# 스냅샷 대조로 찾은 차이 중 알림으로 보낼 최대 파일 수 (폴더 트리 재조회에는 1건이면 충분)
+DRIFT_EVENT_LIMIT = 100
+
+
+def _flatten(scans: dict[str, tuple[list[str], list[str]]]) -> tuple[set[str], set[str]]:
+    """상대 경로 탐색 결과 → (폴더 상대 경로 집합, 파일 상대 경로 집합)"""
+    dirs: set[str] = set()
+    files: set[str] = set()
+    for rel_dir, (dir_names, file_names) in scans.items():
+        for name in dir_names:
+            dirs.add(os.path.join(rel_dir, name) if rel_dir else name)
+        for name in file_names:
+            files.add(os.path.join(rel_dir, name) if rel_dir else name)
+    return dirs, files
+
+
+class TreeCache:
+    """폴더 트리 캐시 (Thread-safe)"""
+
+    def __init__(self, scan_workers: int = 1, snapshot_store: TreeSnapshotStore | None = None) -> None:
+        """
+        Args:
+            scan_workers: 인덱스 최초 빌드 시 탐색 스레드 수
+            snapshot_store: 인덱스 스냅샷 저장소 (None이면 매번 탐색하여 빌드)
+        """
+        self.scan_workers = scan_workers
+        self.snapshot_store = snapshot_store
+        self._drift_callback: Callable[[int, list[tuple[str, str]]], None] | None = None
+        self._reconciles: dict[tuple[int, bool], threading.Thread] = {}  # 스냅샷 대조 중인 인덱스
+        self.epoch = uuid.uuid4().hex[:8]  # 프로세스 재시작 구분용
+        self._indexes: dict[tuple[int, bool], TreeIndex] = {}  # (folder_id, md_only) -> TreeIndex
+        self._roots: dict[int, str] = {}  # folder_id -> 폴더 경로
+        self._generations: dict[int, int] = {}  # folder_id -> 변경 카운터
+        self._build_logs: dict[int, list[list[str]]] = {}  # folder_id -> 진행 중인 빌드별 변경 경로 기록
+        self._lock = threading.Lock()
+
+    def get_tree(
+        self,
+        folder_id: int,
+        path: str,
+        md_only: bool = True,
+        subpath: str = "",
+        depth: int | None = None,
+    ) -> TreeNode | None:
+        """
+        캐시된 트리 반환 (없으면 인덱스 빌드 후 저장)
+
+        Args:
+            folder_id: 폴더 ID
+            path: 폴더 절대 경로
+            md_only: True면 .md 파일만 포함
+            subpath: 폴더 기준 하위 경로 ("" = 루트, normalize_subpath로 정규화된 값)
+            depth: 포함할 단계 수 (None이면 전체)
+
+        Returns:
+            TreeNode: 트리 구조, subpath 폴더가 없으면 None
+        """
+        return self._get_index(folder_id, path, md_only).to_tree(subpath, depth)
+
+    def get_scans(self, folder_id: int, path: str, md_only: bool = True) -> dict[str, tuple[list[str], list[str]]]:
+        """
+        캐시된 인덱스의 상대 경로 탐색 결과 (다른 인덱스가 폴더를 다시 탐색하지 않도록 공유)
+
+        스냅샷으로 복원한 인덱스는 디스크 대조가 끝난 뒤의 결과를 반환 (대조 중이면 대기)
+
+        Returns:
+            루트 기준 상대 폴더 경로("" = 루트) -> (하위 폴더 이름 목록, 파일 이름 목록)
+        """
+        index = self._get_index(folder_id, path, md_only)
+        with self._lock:
+            thread = self._reconciles.get((folder_id, md_only))
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        return index.to_scans()
+
+    def set_drift_callback(self, callback: Callable[[int, list[tuple[str, str]]], None]) -> None:
+        """스냅샷과 디스크 차이 알림 콜백 설정 (folder_id, [(파일 절대 경로, created/deleted)])"""
+        self._drift_callback = callback
+
+    def apply_change(self, folder_id: int, path: str) -> None:
+        """
+        변경된 경로를 캐시된 인덱스에 반영 (O(depth))
+
+        Args:
+            folder_id: 폴더 ID
+            path: 변경된 파일/폴더 절대 경로
+        """
+        with self._lock:
+            root = self._roots.get(folder_id)
+            if root is not None:
+                rel_path = os.path.relpath(path, root)
+                if rel_path.startswith(os.pardir) or is_excluded_path(rel_path):
+                    return
+            self._generations[folder_id] = self._generations.get(folder_id, 0) + 1
+            for log in self._build_logs.get(folder_id, ()):
+                log.append(path)
+            indexes = [
+                (md_only, index) for (index_folder_id, md_only), index in self._indexes.items()
+                if index_folder_id == folder_id
+            ]
+
+        for md_only, index in indexes:
+            if index.sync_path(path):
+                logger.debug(f"트리 인덱스 갱신: {folder_id} - {path}")
+                if self.snapshot_store is not None:
+                    self.snapshot_store.schedule_save(folder_id, root, md_only, index)
+
+        # 반영 완료 후 한 번 더 증가: 반영 도중 조회된 generation(ETag)은 재사용되지 않음
+        with self._lock:
+            self._generations[folder_id] += 1
+
+    def generation(self, folder_id: int) -> int:
+        """
+        폴더 트리 변경 카운터 조회
+
+        트리 조회 전에 읽은 값은 조회 결과보다 새롭지 않으므로 ETag로 안전하게 사용할 수 있다.
+        """
+        with self._lock:
+            return self._generations.get(folder_id, 0)
+
+    def invalidate(self, folder_id: int) -> None:
+        """폴더의 모든 캐시 인덱스 제거"""
+        with self._lock:
+            self._generations[folder_id] = self._generations.get(folder_id, 0) + 1
+            self._indexes.pop((folder_id, True), None)
+            self._indexes.pop((folder_id, False), None)
+            # 진행 중인 빌드 결과는 저장하지 않음
+            self._build_logs.pop(folder_id, None)
+
+    def remove_folder(self, folder_id: int) -> None:
+        """폴더 캐시 및 메타데이터 제거 (폴더 삭제 시, 대기 중인 스냅샷 저장 취소)"""
+        self.invalidate(folder_id)
+        with self._lock:
+            self._roots.pop(folder_id, None)
+        if self.snapshot_store is not None:
+            self.snapshot_store.cancel(folder_id)
+
+    def wait_reconciled(self, timeout: float | None = None) -> bool:
+        """진행 중인 스냅샷 대조가 끝날 때까지 대기 (완료 여부 반환)"""
+        with self._lock:
+            threads = list(self._reconciles.values())
+        for thread in threads:
+            thread.join(timeout)
+        return not any(thread.is_alive() for thread in threads)
+
+    def clear(self) -> None:
+        """전체 캐시 초기화"""
+        with self._lock:
+            for folder_id in list(self._generations):
+                self._generations[folder_id] += 1
+            self._indexes.clear()
+            self._roots.clear()
+            self._build_logs.clear()
+
+    def _get_index(self, folder_id: int, path: str, md_only: bool) -> TreeIndex:
+        key = (folder_id, md_only)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                return index
+            self._roots[folder_id] = path
+            log: list[str] = []
+            self._build_logs.setdefault(folder_id, []).append(log)
+
+        try:
+            # 저장된 스냅샷으로 바로 응답 (디스크 대조는 백그라운드)
+            if self.snapshot_store is not None:
+                index = self.snapshot_store.load(folder_id, path, md_only)
+                if index is not None:
+                    if self._store_built(key, log, index):
+                        with self._lock:
+                            if self._indexes.get(key) is index:
+                                self._start_reconcile(folder_id, path, md_only, index)
+                        return index
+                    with self._lock:
+                        cached = self._indexes.get(key)
+                        if cached is not None:
+                            return cached
+                        # 복원 도중 무효화: 탐색으로 대체
+                        log = []
+                        self._build_logs.setdefault(folder_id, []).append(log)
+
+            index = TreeIndex.build(path, md_only, self.scan_workers)
+        except BaseException:
+            with self._lock:
+                self._discard_log(folder_id, log)
+            raise
+
+        if self._store_built(key, log, index) and self.snapshot_store is not None:
+            self.snapshot_store.schedule_save(folder_id, path, md_only, index, delay=0)
+        return self._indexes.get(key, index)
+
+    def _store_built(self, key: tuple[int, bool], log: list[str], index: TreeIndex) -> bool:
+        """
+        빌드 도중 기록된 변경 경로를 인덱스에 반영한 뒤 캐시에 저장
+
+        반영하는 동안 들어온 변경도 기록되므로 기록이 빌 때까지 반복한다.
+
+        Returns:
+            저장 여부 (빌드 도중 무효화되었거나 다른 빌드가 먼저 저장했으면 False)
+        """
+        folder_id = key[0]
+        while True:
+            with self._lock:
+                if not any(entry is log for entry in self._build_logs.get(folder_id, ())):
+                    return False  # 빌드 도중 무효화
+                if not log:
+                    self._discard_log(folder_id, log)
+                    if key in self._indexes:
+                        return False
+                    self._indexes[key] = index
+                    return True
+                paths = list(dict.fromkeys(log))
+                log.clear()
+            for path in paths:
+                index.sync_path(path)
+
+    def _discard_log(self, folder_id: int, log: list[str]) -> None:
+        """빌드 변경 기록 해제 (_lock 보유 상태에서 호출)"""
+        logs = self._build_logs.get(folder_id)
+        if logs is None:
+            return
+        logs[:] = [entry for entry in logs if entry is not log]
+        if not logs:
+            del self._build_logs[folder_id]
+
+    def _start_reconcile(self, folder_id: int, path: str, md_only: bool, index: TreeIndex) -> None:
+        """스냅샷 대조 스레드 시작 (_lock 보유 상태에서 호출)"""
+        thread = threading.Thread(
+            target=self._reconcile, args=(folder_id, path, md_only, index),
+            name="tree-reconcile", daemon=True,
+        )
+        self._reconciles[(folder_id, md_only)] = thread
+        thread.start()
+
+    def _reconcile(self, folder_id: int, path: str, md_only: bool, index: TreeIndex) -> None:
+        """
+        스냅샷으로 복원한 인덱스를 디스크와 대조 (백그라운드 스레드)
+
+        다른 경로만 apply_change로 패치하므로 대조 도중 들어온 감시 이벤트와 충돌하지 않는다.
+        """
+        key = (folder_id, md_only)
+        try:
+            fresh_dirs, fresh_files = _flatten(TreeIndex.build(path, md_only, self.scan_workers).to_scans())
+            with self._lock:
+                if self._indexes.get(key) is not index:
+                    return  # 대조 도중 폴더 제거/무효화
+            dirs, files = _flatten(index.to_scans())
+
+            changed = (dirs ^ fresh_dirs) | (files ^ fresh_files)
+            # 상위 폴더부터 반영 (하위 경로는 상위 폴더 탐색으로 이미 반영되면 변경 없음)
+            for rel_path in sorted(changed, key=lambda rel: rel.count(os.sep)):
+                self.apply_change(folder_id, os.path.join(path, rel_path))
+            if self.snapshot_store is not None:
+                self.snapshot_store.schedule_save(folder_id, path, md_only, index, delay=0)
+
+            drift = [
+                (os.path.join(path, rel_path), "created" if rel_path in fresh_files else "deleted")
+                for rel_path in sorted(files ^ fresh_files)
+                if rel_path.lower().endswith(".md")
+            ]
+            if drift and self._drift_callback is not None:
+                self._drift_callback(folder_id, drift[:DRIFT_EVENT_LIMIT])
+            logger.info(f"트리 스냅샷 대조 완료: {folder_id} - 변경 {len(changed)}개")
+        except Exception as e:
+            logger.exception(f"트리 스냅샷 대조 실패: {folder_id} - {e}")
+        finally:
+            with self._lock:
+                if self._reconciles.get(key) is threading.current_thread():
+                    del self._reconciles[key]
+
+
+# 전역 TreeCache 인스턴스
+tree_cache = TreeCache(scan_workers=settings.TREE_SCAN_WORKERS, snapshot_store=tree_snapshots)
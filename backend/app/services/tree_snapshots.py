@@ -0,0 +1,158 @@
+"""
+폴더 트리 스냅샷 저장소
+
+TreeCache의 트리 인덱스를 DB(folder_tree_snapshots)에 저장하고 재시작 후 첫 트리 조회 시 복원
+
+- 상대 경로 탐색 결과를 zlib 압축 JSON으로 저장 (저장 시점과 폴더 경로가 다르면 복원하지 않음)
+- 변경된 인덱스는 (폴더, md_only)별 debounce 후 스케줄러 스레드에서 저장 (연속 변경은 1회 저장)
+- 변경이 계속되어도 첫 변경 후 max_delay가 지나면 저장 (debounce가 무한히 밀리지 않도록)
+- 종료 시 대기 중인 저장을 flush
+"""
+
+import json
+import threading
+import time
+import zlib
+from collections.abc import Callable
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from app.db import database
+from app.repositories.tree_snapshot_repository import TreeSnapshotRepository
+from app.utils.debounce_scheduler import DebounceScheduler
+from app.utils.json_codec import dumps
+from app.utils.tree_index import TreeIndex
+
+
+SessionFactory = Callable[[], Session]
+
+# 저장 형식 버전 (형식이 바뀌면 이전 스냅샷은 무시하고 새로 탐색)
+SNAPSHOT_VERSION = 1
+
+
+class TreeSnapshotStore:
+    """폴더 트리 스냅샷 저장소 (Thread-safe)"""
+
+    def __init__(
+        self,
+        save_delay: float = 10.0,
+        max_delay: float = 60.0,
+        scheduler: DebounceScheduler | None = None,
+    ) -> None:
+        """
+        Args:
+            save_delay: 변경 후 저장까지 대기 시간 (초)
+            max_delay: 첫 변경 후 저장까지 최대 대기 시간 (초, 변경이 계속되어도 이 시간 내 저장)
+            scheduler: debounce 스케줄러 (None이면 저장소 전용 스케줄러 생성)
+        """
+        self.save_delay = save_delay
+        self.max_delay = max_delay
+        self.scheduler = scheduler if scheduler is not None else DebounceScheduler(name="tree-snapshot-debounce")
+        # (folder_id, md_only) -> (폴더 경로, 인덱스, 세션 팩토리)
+        self._pending: dict[tuple[int, bool], tuple[str, TreeIndex, SessionFactory]] = {}
+        # (folder_id, md_only) -> 저장 기한 (첫 변경 시각 + max_delay, monotonic)
+        self._deadlines: dict[tuple[int, bool], float] = {}
+        self._lock = threading.Lock()
+
+    def load(self, folder_id: int, root: str, md_only: bool) -> TreeIndex | None:
+        """
+        저장된 트리 인덱스 복원
+
+        Args:
+            folder_id: 폴더 ID
+            root: 현재 폴더 경로
+            md_only: True면 .md 파일만 포함한 인덱스
+
+        Returns:
+            TreeIndex, 스냅샷이 없거나 경로가 다르거나 손상되었으면 None
+        """
+        try:
+            db = database.get_session_factory()()
+            try:
+                snapshot = TreeSnapshotRepository(db).find(folder_id, md_only)
+                if snapshot is None or snapshot.root != root:
+                    return None
+                data = snapshot.data
+            finally:
+                db.close()
+            payload = json.loads(zlib.decompress(data))
+            if payload.get("version") != SNAPSHOT_VERSION:
+                return None
+            return TreeIndex.from_scans(root, md_only, payload["scans"])
+        except Exception as e:
+            logger.warning(f"트리 스냅샷 복원 실패: {folder_id} - {e}")
+            return None
+
+    def schedule_save(
+        self, folder_id: int, root: str, md_only: bool, index: TreeIndex, delay: float | None = None
+    ) -> None:
+        """
+        인덱스 저장 예약 (같은 폴더의 대기 저장은 마지막 인덱스로 교체)
+
+        Args:
+            folder_id: 폴더 ID
+            root: 폴더 경로
+            md_only: 인덱스 md_only 여부
+            index: 저장할 인덱스 (저장 시점 상태로 직렬화)
+            delay: 대기 시간 (None이면 save_delay)
+        """
+        key = (folder_id, md_only)
+        delay = self.save_delay if delay is None else delay
+        now = time.monotonic()
+        with self._lock:
+            self._pending[key] = (root, index, database.get_session_factory())
+            deadline = self._deadlines.setdefault(key, now + self.max_delay)
+        self.scheduler.schedule(self._on_due, key, key, max(0.0, min(delay, deadline - now)))
+
+    def cancel(self, folder_id: int) -> None:
+        """폴더의 대기 중인 저장 취소"""
+        with self._lock:
+            for key in ((folder_id, True), (folder_id, False)):
+                self._pending.pop(key, None)
+                self._deadlines.pop(key, None)
+
+    def flush(self) -> None:
+        """대기 중인 저장을 호출 스레드에서 즉시 수행 (종료 시)"""
+        self.scheduler.cancel_all(self._on_due)
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._deadlines.clear()
+        for key, item in pending.items():
+            self._write(key, *item)
+
+    @property
+    def pending_count(self) -> int:
+        """대기 중인 저장 수"""
+        with self._lock:
+            return len(self._pending)
+
+    def _on_due(self, keys: list[tuple[int, bool]]) -> None:
+        """debounce 기한이 지난 저장 (스케줄러 스레드에서 호출)"""
+        for key in keys:
+            with self._lock:
+                item = self._pending.pop(key, None)
+                self._deadlines.pop(key, None)
+            if item is not None:
+                self._write(key, *item)
+
+    def _write(
+        self, key: tuple[int, bool], root: str, index: TreeIndex, session_factory: SessionFactory
+    ) -> None:
+        folder_id, md_only = key
+        try:
+            data = zlib.compress(
+                dumps({"version": SNAPSHOT_VERSION, "scans": index.to_scans()}).encode("utf-8"), 1
+            )
+            db = session_factory()
+            try:
+                TreeSnapshotRepository(db).save(folder_id, md_only, root, data)
+            finally:
+                db.close()
+            logger.debug(f"트리 스냅샷 저장: {folder_id} (md_only={md_only}) - {len(data)} bytes")
+        except Exception as e:
+            logger.exception(f"트리 스냅샷 저장 실패: {folder_id} - {e}")
+
+
+# 전역 TreeSnapshotStore 인스턴스
+tree_snapshots = TreeSnapshotStore()
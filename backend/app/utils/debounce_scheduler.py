@@ -0,0 +1,150 @@
+"""
+Debounce 스케줄러
+
+Spec: spec/api/file-watch-websocket.md - 섹션 5
+단일 스레드 + deadline 힙으로 키별 debounce를 처리한다.
+
+- 같은 키가 다시 예약되면 deadline만 갱신 (마지막 항목 유지)
+- 기한이 지난 항목을 콜백별로 묶어 한 번에 전달 (배치)
+- 가장 이른 기한 후 batch_window 동안 기다려 비슷한 시점의 항목을 함께 전달
+- 예약 수와 무관하게 스레드는 1개 (이벤트 폭주 시에도 스레드 수 일정)
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Hashable
+from typing import Any, Callable
+
+from loguru import logger
+
+
+BatchCallback = Callable[[list[Any]], None]
+
+
+class DebounceScheduler:
+    """키별 debounce 스케줄러 (Thread-safe)"""
+
+    # 힙에 남은 무효 항목이 이 배수를 넘으면 재구성
+    _COMPACT_RATIO = 4
+
+    def __init__(self, name: str = "debounce-scheduler", batch_window: float = 0.05) -> None:
+        """
+        Args:
+            name: 스케줄러 스레드 이름
+            batch_window: 배치로 묶을 deadline 간격 (초, 전달이 최대 이만큼 늦어짐)
+        """
+        self.name = name
+        self.batch_window = batch_window
+        self._heap: list[tuple[float, int, tuple[BatchCallback, Hashable]]] = []  # (deadline, seq, (callback, key))
+        self._entries: dict[tuple[BatchCallback, Hashable], tuple[float, int, Any]] = {}  # (callback, key) -> (deadline, seq, 항목)
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+    def schedule(self, callback: BatchCallback, key: Hashable, item: Any, delay: float) -> None:
+        """
+        항목 예약 (같은 callback, key가 대기 중이면 항목과 deadline 갱신)
+
+        Args:
+            callback: 기한이 지난 항목 목록을 받을 콜백 (스케줄러 스레드에서 호출)
+            key: debounce 단위 키 (예: 파일 경로)
+            item: 콜백에 전달할 항목
+            delay: 대기 시간 (초)
+        """
+        deadline = time.monotonic() + delay
+        entry_key = (callback, key)
+        with self._cond:
+            seq = next(self._seq)
+            self._entries[entry_key] = (deadline, seq, item)
+            heapq.heappush(self._heap, (deadline, seq, entry_key))
+            self._compact()
+            self._ensure_thread()
+            self._cond.notify()
+
+    def cancel_all(self, callback: BatchCallback) -> int:
+        """
+        콜백의 대기 중인 항목 모두 취소
+
+        Returns:
+            취소된 항목 수
+        """
+        with self._cond:
+            keys = [entry_key for entry_key in self._entries if entry_key[0] == callback]
+            for entry_key in keys:
+                del self._entries[entry_key]
+            self._compact()
+            return len(keys)
+
+    def pending_count(self, callback: BatchCallback | None = None) -> int:
+        """대기 중인 항목 수 (callback 지정 시 해당 콜백만)"""
+        with self._cond:
+            if callback is None:
+                return len(self._entries)
+            return sum(1 for entry_key in self._entries if entry_key[0] == callback)
+
+    def stop(self) -> None:
+        """대기 항목을 버리고 스레드 종료 (이후 schedule 시 다시 시작)"""
+        with self._cond:
+            thread = self._thread
+            self._thread = None
+            self._stop_event.set()
+            self._entries.clear()
+            self._heap.clear()
+            self._cond.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+
+    def _ensure_thread(self) -> None:
+        # _cond 보유 상태에서 호출
+        if self._thread is not None:
+            return
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(self._stop_event,), name=self.name, daemon=True
+        )
+        self._thread.start()
+
+    def _compact(self) -> None:
+        # _cond 보유 상태에서 호출: 갱신/취소로 무효가 된 힙 항목 정리
+        if len(self._heap) > self._COMPACT_RATIO * (len(self._entries) + 16):
+            self._heap = [
+                (deadline, seq, entry_key)
+                for entry_key, (deadline, seq, _) in self._entries.items()
+            ]
+            heapq.heapify(self._heap)
+
+    def _pop_due(self, now: float) -> dict[BatchCallback, list[Any]]:
+        # _cond 보유 상태에서 호출
+        batches: dict[BatchCallback, list[Any]] = {}
+        while self._heap and self._heap[0][0] <= now:
+            _, seq, entry_key = heapq.heappop(self._heap)
+            entry = self._entries.get(entry_key)
+            if entry is None or entry[1] != seq:
+                continue  # 갱신 또는 취소된 항목
+            del self._entries[entry_key]
+            batches.setdefault(entry_key[0], []).append(entry[2])
+        return batches
+
+    def _run(self, stop_event: threading.Event) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if stop_event.is_set():
+                        return
+                    now = time.monotonic()
+                    if self._heap and self._heap[0][0] + self.batch_window <= now:
+                        batches = self._pop_due(now)
+                        if batches:
+                            break
+                        continue  # 무효 항목만 있었음
+                    timeout = self._heap[0][0] + self.batch_window - now if self._heap else None
+                    self._cond.wait(timeout)
+
+            for callback, items in batches.items():
+                try:
+                    callback(items)
+                except Exception as e:
+                    logger.exception(f"debounce 콜백 실행 오류: {e}")
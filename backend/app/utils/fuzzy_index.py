@@ -0,0 +1,414 @@
+"""
+퍼지 경로 인덱스
+
+등록 폴더의 마크다운 상대 경로를 메모리에 유지하고 부분 수열(subsequence) 일치로 검색 (Ctrl+P)
+
+- 문자별 비트셋(Python int, 비트 i = 경로 i에 문자 포함)의 AND로 후보를 C 속도로 좁힘
+- 후보가 많으면 (짧은 검색어) 파일 이름 단어 시작 일치 → 파일 이름 포함 → 전체 순으로
+  최대 SCORE_BUDGET개만 정밀 점수 계산 (같은 단계에서는 짧은 경로 우선)
+- 점수: 파일 이름 시작 / 단어 경계(/-_. 공백, camelCase) / 연속 일치 / 파일 이름 내 일치 가산,
+  일치 사이 간격 감점 (앞/뒤 양방향 탐욕 정렬 중 높은 점수)
+- 경로 추가/삭제는 O(경로 길이), 삭제된 id는 비트만 끄고 많이 쌓이면 compact()로 재구성
+"""
+
+import heapq
+import threading
+from collections.abc import Iterable
+
+
+# 정밀 점수 계산 대상 최대 후보 수 (검색 시간 상한)
+SCORE_BUDGET = 400
+
+# 단어 경계 문자
+SEPARATORS = frozenset("/-_. ")
+
+BONUS_BASENAME_START = 12
+BONUS_BOUNDARY = 8
+BONUS_CONSECUTIVE = 6
+BONUS_BASENAME = 2
+# 일치 사이 건너뛴 문자 1개당 감점 (간격당 최대)
+MAX_GAP_PENALTY = 3
+
+# 삭제된 id가 이 수와 살아있는 경로 수를 모두 넘으면 재구성 필요
+COMPACT_MIN_DEAD = 4096
+
+
+class _Entry:
+    """인덱스 경로 항목"""
+
+    __slots__ = ("folder_id", "path", "lower", "base_start")
+
+    def __init__(self, folder_id: int, path: str) -> None:
+        self.folder_id = folder_id
+        self.path = path
+        lower = path.lower()
+        if len(lower) != len(path):
+            # 소문자 변환으로 길이가 바뀌는 문자는 그대로 두어 위치를 원래 경로와 맞춤
+            lower = "".join(char if len(char.lower()) != 1 else char.lower() for char in path)
+        self.lower = lower
+        self.base_start = path.rfind("/") + 1  # 파일 이름 시작 위치
+
+
+def _is_boundary(entry: _Entry, position: int) -> bool:
+    """단어 시작 위치 여부"""
+    if position == 0 or entry.lower[position - 1] in SEPARATORS:
+        return True
+    return entry.path[position - 1].islower() and entry.path[position].isupper()
+
+
+def _to_bits(ids: list[int], size: int) -> int:
+    """id 목록 → 비트셋"""
+    bits = bytearray((size + 7) // 8)
+    for i in ids:
+        bits[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bits, "little")
+
+
+def _iter_bits(bits: int, limit: int) -> list[int]:
+    """비트셋의 앞쪽(작은 id) limit개"""
+    digits = bin(bits)[:1:-1]  # 최하위 비트부터
+    ids: list[int] = []
+    i = digits.find("1")
+    while i >= 0 and len(ids) < limit:
+        ids.append(i)
+        i = digits.find("1", i + 1)
+    return ids
+
+
+def _build_bits(entries: list[_Entry]) -> tuple[dict[str, int], dict[str, int], dict[str, int]]:
+    """
+    항목 목록의 문자별 비트셋 (id = 목록 내 위치)
+
+    Returns:
+        (경로 문자, 파일 이름 문자, 파일 이름 단어 시작 문자) -> 비트셋
+    """
+    chars: dict[str, list[int]] = {}
+    base_chars: dict[str, list[int]] = {}
+    base_starts: dict[str, list[int]] = {}
+    for i, entry in enumerate(entries):
+        lower = entry.lower
+        for char in set(lower):
+            chars.setdefault(char, []).append(i)
+        base_start = entry.base_start
+        for char in set(lower[base_start:]):
+            base_chars.setdefault(char, []).append(i)
+        starts = {
+            lower[position] for position in range(base_start, len(lower))
+            if _is_boundary(entry, position)
+        }
+        for char in starts:
+            base_starts.setdefault(char, []).append(i)
+
+    size = len(entries)
+    return tuple(
+        {char: _to_bits(ids, size) for char, ids in table.items()}
+        for table in (chars, base_chars, base_starts)
+    )
+
+
+def normalize_query(query: str) -> str:
+    """검색어 정규화 (소문자, 공백 제거)"""
+    return "".join(query.lower().split())
+
+
+def _align_backward(query: str, lower: str) -> list[int] | None:
+    """뒤에서부터 가장 오른쪽 위치에 맞춤 (가능한 한 파일 이름 안에서 일치)"""
+    positions: list[int] = []
+    end = len(lower)
+    for char in reversed(query):
+        end = lower.rfind(char, 0, end)
+        if end < 0:
+            return None
+        positions.append(end)
+    positions.reverse()
+    return positions
+
+
+def _align_forward(query: str, lower: str) -> list[int]:
+    """앞에서부터 가장 왼쪽 위치에 맞춤 (폴더 이름 접두어 일치, 일치 여부는 확인된 상태)"""
+    positions: list[int] = []
+    start = 0
+    for char in query:
+        start = lower.find(char, start)
+        positions.append(start)
+        start += 1
+    return positions
+
+
+def _score_positions(entry: _Entry, positions: list[int]) -> int:
+    """일치 위치 점수 (연속 일치는 연속 구간 첫 문자의 경계 가산점을 이어받음)"""
+    score = 0
+    previous = -2
+    run_bonus = 0
+    for position in positions:
+        if position == entry.base_start:
+            bonus = BONUS_BASENAME_START
+        elif _is_boundary(entry, position):
+            bonus = BONUS_BOUNDARY
+        else:
+            bonus = 0
+        if position == previous + 1:
+            bonus = max(bonus, run_bonus, BONUS_CONSECUTIVE)
+        else:
+            if previous >= 0:
+                score -= min(position - previous - 1, MAX_GAP_PENALTY)
+            run_bonus = bonus
+        score += bonus
+        if position >= entry.base_start:
+            score += BONUS_BASENAME
+        previous = position
+    return score
+
+
+def score_path(query: str, entry: _Entry) -> tuple[int, list[int]] | None:
+    """
+    부분 수열 일치 점수
+
+    앞/뒤 양방향 탐욕 정렬 중 점수가 높은 쪽을 사용한다.
+
+    Args:
+        query: normalize_query로 정규화된 검색어
+        entry: 경로 항목
+
+    Returns:
+        (점수, 일치 위치 목록), 일치하지 않으면 None
+    """
+    backward = _align_backward(query, entry.lower)
+    if backward is None:
+        return None
+    forward = _align_forward(query, entry.lower)
+    backward_score = _score_positions(entry, backward)
+    if forward == backward:
+        return backward_score, backward
+    forward_score = _score_positions(entry, forward)
+    if forward_score > backward_score:
+        return forward_score, forward
+    return backward_score, backward
+
+
+class FuzzyPathIndex:
+    """퍼지 경로 인덱스 (Thread-safe)"""
+
+    def __init__(self) -> None:
+        self._entries: list[_Entry | None] = []  # id -> 항목 (삭제되면 None)
+        self._ids: dict[int, dict[str, int]] = {}  # folder_id -> 상대 경로 -> id
+        self._chars: dict[str, int] = {}
+        self._base_chars: dict[str, int] = {}
+        self._base_starts: dict[str, int] = {}
+        self._alive = 0  # 살아있는 id 비트셋
+        self._folders: dict[int, int] = {}  # folder_id -> id 비트셋
+        self._dead = 0
+        self._version = 0  # 변경 카운터 (compact 중 변경 감지)
+        self._reserving = 0  # 비트 계산 중인 add_many 수 (예약된 id 기준으로 비트를 합치므로 compact 불가)
+        self._lock = threading.Lock()
+
+    def add_many(self, folder_id: int, paths: Iterable[str]) -> int:
+        """
+        경로 일괄 추가 (비트셋 계산은 잠금 밖에서 수행, 짧은 경로가 앞 id)
+
+        Args:
+            folder_id: 폴더 ID
+            paths: 폴더 기준 상대 경로 ("/" 구분)
+
+        Returns:
+            추가된 경로 수
+        """
+        with self._lock:
+            known = self._ids.setdefault(folder_id, {})
+            new_paths = sorted({path for path in paths if path not in known}, key=lambda p: (len(p), p))
+            if not new_paths:
+                return 0
+            # id 예약 (비트가 켜지기 전까지는 검색되지 않음)
+            start = len(self._entries)
+            entries = [_Entry(folder_id, path) for path in new_paths]
+            self._entries.extend(entries)
+            for offset, path in enumerate(new_paths):
+                known[path] = start + offset
+            self._version += 1
+            self._reserving += 1
+
+        try:
+            chars, base_chars, base_starts = _build_bits(entries)
+        except BaseException:
+            with self._lock:
+                self._reserving -= 1
+            raise
+
+        with self._lock:
+            self._reserving -= 1
+            for table, chunk in (
+                (self._chars, chars), (self._base_chars, base_chars), (self._base_starts, base_starts)
+            ):
+                for char, bits in chunk.items():
+                    table[char] = table.get(char, 0) | (bits << start)
+            # 계산 도중 삭제된 항목은 제외
+            live = [
+                offset for offset, entry in enumerate(entries)
+                if self._entries[start + offset] is entry
+            ]
+            live_bits = _to_bits(live, len(entries)) << start
+            self._alive |= live_bits
+            if folder_id in self._ids:
+                self._folders[folder_id] = self._folders.get(folder_id, 0) | live_bits
+            self._version += 1
+        return len(live)
+
+    def add(self, folder_id: int, path: str) -> bool:
+        """경로 1개 추가 (이미 있으면 False)"""
+        with self._lock:
+            known = self._ids.setdefault(folder_id, {})
+            if path in known:
+                return False
+            entry_id = len(self._entries)
+            entry = _Entry(folder_id, path)
+            self._entries.append(entry)
+            known[path] = entry_id
+            bit = 1 << entry_id
+            lower = entry.lower
+            for char in set(lower):
+                self._chars[char] = self._chars.get(char, 0) | bit
+            for char in set(lower[entry.base_start:]):
+                self._base_chars[char] = self._base_chars.get(char, 0) | bit
+            for position in range(entry.base_start, len(lower)):
+                if _is_boundary(entry, position):
+                    self._base_starts[lower[position]] = self._base_starts.get(lower[position], 0) | bit
+            self._alive |= bit
+            self._folders[folder_id] = self._folders.get(folder_id, 0) | bit
+            self._version += 1
+            return True
+
+    def remove(self, folder_id: int, path: str) -> bool:
+        """경로 1개 삭제 (없으면 False)"""
+        with self._lock:
+            entry_id = self._ids.get(folder_id, {}).pop(path, None)
+            if entry_id is None:
+                return False
+            self._kill(folder_id, [entry_id])
+            return True
+
+    def remove_prefix(self, folder_id: int, directory: str) -> int:
+        """디렉토리 하위 경로 삭제 (삭제 수 반환, O(폴더 경로 수))"""
+        prefix = directory.rstrip("/") + "/"
+        with self._lock:
+            known = self._ids.get(folder_id, {})
+            paths = [path for path in known if path.startswith(prefix)]
+            self._kill(folder_id, [known.pop(path) for path in paths])
+            return len(paths)
+
+    def remove_folder(self, folder_id: int) -> int:
+        """폴더의 모든 경로 삭제 (삭제 수 반환)"""
+        with self._lock:
+            known = self._ids.pop(folder_id, {})
+            self._kill(folder_id, list(known.values()))
+            self._folders.pop(folder_id, None)
+            return len(known)
+
+    def _kill(self, folder_id: int, entry_ids: list[int]) -> None:
+        """id 삭제 표시 (lock 보유 상태에서 호출)"""
+        if not entry_ids:
+            return
+        for entry_id in entry_ids:
+            self._entries[entry_id] = None
+        bits = _to_bits(entry_ids, len(self._entries))
+        self._alive &= ~bits
+        if folder_id in self._folders:
+            self._folders[folder_id] &= ~bits
+        self._dead += len(entry_ids)
+        self._version += 1
+
+    def search(self, query: str, limit: int = 20, folder_id: int | None = None) -> list[tuple[int, str, int, list[int]]]:
+        """
+        퍼지 검색
+
+        Args:
+            query: 검색어 (대소문자 무시, 공백 무시)
+            limit: 최대 결과 수
+            folder_id: 지정 시 해당 폴더만 검색
+
+        Returns:
+            (folder_id, 상대 경로, 점수, 일치 위치 목록) 목록 (점수 높은 순, 같으면 짧은 경로 우선)
+        """
+        query = normalize_query(query)
+        if not query:
+            return []
+        unique_chars = set(query)
+
+        with self._lock:
+            candidates = self._alive if folder_id is None else self._folders.get(folder_id, 0)
+            for char in unique_chars:
+                candidates &= self._chars.get(char, 0)
+                if not candidates:
+                    return []
+
+            if candidates.bit_count() <= SCORE_BUDGET:
+                ids = _iter_bits(candidates, SCORE_BUDGET)
+            else:
+                # 후보가 많으면 일치 가능성이 높은 단계부터 예산만큼 선택
+                in_basename = candidates
+                for char in unique_chars:
+                    in_basename &= self._base_chars.get(char, 0)
+                starts_word = in_basename & self._base_starts.get(query[0], 0)
+                ids = []
+                for tier in (starts_word, in_basename & ~starts_word, candidates & ~in_basename):
+                    ids.extend(_iter_bits(tier, SCORE_BUDGET - len(ids)))
+                    if len(ids) >= SCORE_BUDGET:
+                        break
+            entries = [self._entries[entry_id] for entry_id in ids]
+
+        scored = []
+        for entry in entries:
+            result = score_path(query, entry)
+            if result is not None:
+                scored.append((result[0], -len(entry.path), entry, result[1]))
+        top = heapq.nlargest(limit, scored, key=lambda item: (item[0], item[1]))
+        return [(entry.folder_id, entry.path, score, positions) for score, _, entry, positions in top]
+
+    @property
+    def needs_compaction(self) -> bool:
+        """삭제된 id가 많아 재구성이 필요한지 여부"""
+        with self._lock:
+            return self._dead > max(COMPACT_MIN_DEAD, len(self._entries) - self._dead)
+
+    def compact(self) -> bool:
+        """
+        삭제된 id 제거 후 재구성 (계산은 잠금 밖에서 수행)
+
+        Returns:
+            재구성 여부 (add_many 비트 계산 중이거나 계산 도중 변경이 있으면 적용하지 않고 False)
+        """
+        with self._lock:
+            if self._reserving:
+                # 예약된 id가 재구성으로 바뀌면 add_many가 비트를 엉뚱한 id에 합치게 됨
+                return False
+            version = self._version
+            entries = sorted(
+                (entry for entry in self._entries if entry is not None),
+                key=lambda entry: (len(entry.path), entry.path),
+            )
+
+        chars, base_chars, base_starts = _build_bits(entries)
+        ids: dict[int, dict[str, int]] = {}
+        folder_ids: dict[int, list[int]] = {}
+        for entry_id, entry in enumerate(entries):
+            ids.setdefault(entry.folder_id, {})[entry.path] = entry_id
+            folder_ids.setdefault(entry.folder_id, []).append(entry_id)
+        folders = {folder_id: _to_bits(members, len(entries)) for folder_id, members in folder_ids.items()}
+
+        with self._lock:
+            if self._version != version:
+                return False
+            for folder_id in self._ids:
+                ids.setdefault(folder_id, {})
+            self._entries = list(entries)
+            self._ids = ids
+            self._chars, self._base_chars, self._base_starts = chars, base_chars, base_starts
+            self._alive = (1 << len(entries)) - 1
+            self._folders = folders
+            self._dead = 0
+            self._version += 1
+            return True
+
+    def __len__(self) -> int:
+        """살아있는 경로 수"""
+        with self._lock:
+            return len(self._entries) - self._dead
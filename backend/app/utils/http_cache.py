@@ -0,0 +1,70 @@
+"""
+HTTP 캐시 검증 유틸리티
+
+ETag / If-None-Match 처리
+"""
+
+import os
+
+from fastapi import Request, Response, status
+
+
+# 브라우저가 매 요청마다 If-None-Match로 재검증하도록 지정
+CACHE_CONTROL = "no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    """
+    강한 ETag 생성
+
+    Args:
+        parts: 리소스 버전을 식별하는 값들
+
+    Returns:
+        따옴표로 감싼 ETag 문자열 (예: "3-1f-a0")
+    """
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def file_etag(stat_result: os.stat_result) -> str:
+    """파일 stat 정보 (inode, mtime_ns, size) 기반 ETag 생성"""
+    return make_etag(
+        f"{stat_result.st_ino:x}",
+        f"{stat_result.st_mtime_ns:x}",
+        f"{stat_result.st_size:x}",
+    )
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    If-None-Match 헤더가 ETag와 일치하는지 확인
+
+    Args:
+        request: 요청 객체
+        etag: 현재 리소스 ETag
+
+    Returns:
+        일치하면 True (304 응답 대상)
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match는 약한 비교 (W/ 접두사 무시)
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+def not_modified_response(etag: str) -> Response:
+    """304 Not Modified 응답 생성 (본문 없음)"""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
+
+
+def set_etag_headers(response: Response, etag: str) -> None:
+    """응답에 ETag 및 Cache-Control 헤더 설정"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
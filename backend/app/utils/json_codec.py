@@ -0,0 +1,29 @@
+"""
+JSON 직렬화 유틸리티
+
+WebSocket broadcast 메시지를 한 번만 직렬화하여 모든 클라이언트에 같은 텍스트 프레임으로 전송
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈 사용 (선택 의존성)
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """
+    객체를 compact JSON 문자열로 직렬화 (Starlette send_json과 같은 형식)
+
+    Args:
+        obj: 직렬화할 객체 (문자열 키 dict / list / 기본 타입)
+
+    Returns:
+        JSON 문자열
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
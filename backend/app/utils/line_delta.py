@@ -0,0 +1,92 @@
+"""
+줄 단위 내용 변경분 (delta)
+
+Spec: spec/api/file-watch-websocket.md
+열람 중인 파일이 수정되면 전체 내용 대신 변경된 줄만 WebSocket으로 전송
+
+- 공통 앞/뒤 줄을 먼저 잘라내므로 끝에 줄을 추가하는 편집은 O(n) 비교로 끝남
+- 남은 구간만 difflib로 비교 (비교량이 너무 크면 구간 전체를 1건으로 교체)
+- op 형식: [시작 줄, 끝 줄(제외), 새 텍스트] - 이전 내용의 줄 번호 기준
+"""
+
+import hashlib
+from difflib import SequenceMatcher
+
+
+# difflib 비교를 생략하고 구간 전체를 교체하는 기준 (이전 줄 수 x 새 줄 수)
+MAX_MATCH_WORK = 4_000_000
+
+
+def content_hash(text: str) -> str:
+    """내용 해시 (UTF-8 SHA-256 hex, 클라이언트가 같은 방식으로 검증)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def split_lines(text: str) -> list[str]:
+    """줄 끝 문자를 유지한 줄 분할 (클라이언트와 같도록 \\n 기준, \\r\\n은 줄 끝에 포함)"""
+    lines = text.split("\n")
+    result = [line + "\n" for line in lines[:-1]]
+    if lines[-1]:
+        result.append(lines[-1])
+    return result
+
+
+def line_delta(old: str, new: str) -> list[list]:
+    """
+    이전 내용 → 새 내용 변경분
+
+    Args:
+        old: 이전 내용
+        new: 새 내용
+
+    Returns:
+        [시작 줄, 끝 줄, 새 텍스트] 목록 (줄 번호 오름차순, 같으면 빈 목록)
+    """
+    old_lines = split_lines(old)
+    new_lines = split_lines(new)
+
+    # 공통 앞/뒤 줄 제외
+    limit = min(len(old_lines), len(new_lines))
+    start = 0
+    while start < limit and old_lines[start] == new_lines[start]:
+        start += 1
+    end = 0
+    while end < limit - start and old_lines[-1 - end] == new_lines[-1 - end]:
+        end += 1
+    old_mid = old_lines[start:len(old_lines) - end]
+    new_mid = new_lines[start:len(new_lines) - end]
+
+    if not old_mid and not new_mid:
+        return []
+    if not old_mid or not new_mid or len(old_mid) * len(new_mid) > MAX_MATCH_WORK:
+        return [[start, start + len(old_mid), "".join(new_mid)]]
+
+    matcher = SequenceMatcher(None, old_mid, new_mid, autojunk=False)
+    return [
+        [start + i1, start + i2, "".join(new_mid[j1:j2])]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def apply_line_delta(old: str, ops: list[list]) -> str:
+    """
+    변경분 적용 (클라이언트 적용 방식과 동일)
+
+    Args:
+        old: 이전 내용
+        ops: line_delta 결과
+
+    Returns:
+        새 내용
+    """
+    lines = split_lines(old)
+    # 뒤에서부터 적용하여 앞쪽 줄 번호 유지
+    for start, end, text in reversed(ops):
+        lines[start:end] = [text] if text else []
+    return "".join(lines)
+
+
+def delta_size(ops: list[list]) -> int:
+    """변경분 텍스트 길이 합 (전체 내용 전송과 비교용)"""
+    return sum(len(text) for _, _, text in ops)
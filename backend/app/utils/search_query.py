@@ -0,0 +1,77 @@
+"""
+검색어 / 검색 결과 텍스트 유틸리티
+
+- 사용자 검색어 → FTS5 MATCH 식 (연산자 해석 없이 단어별 접두어 일치)
+- 마크다운 제목 추출
+- 하이라이트 구분자가 포함된 텍스트 → 구간 목록 (클라이언트가 HTML 없이 렌더링)
+"""
+
+import os
+
+
+# 검색 결과 하이라이트 구분자 (본문에 나오지 않는 제어 문자, API에서 구간 목록으로 변환)
+MATCH_START = "\x02"
+MATCH_END = "\x03"
+
+# 제목(# heading)을 찾는 최대 줄 수
+TITLE_SCAN_LINES = 50
+
+
+def build_match_query(query: str) -> str | None:
+    """
+    검색어 → FTS5 MATCH 식
+
+    단어마다 큰따옴표로 감싸 FTS5 연산자(AND, NEAR, *, : 등)로 해석되지 않게 하고,
+    입력 중인 단어도 찾을 수 있도록 접두어 일치(*)로 검색한다. 단어 사이는 AND.
+
+    Args:
+        query: 사용자 검색어
+
+    Returns:
+        MATCH 식, 검색할 단어가 없으면 None
+    """
+    terms = [term for term in query.split() if any(ch.isalnum() for ch in term)]
+    if not terms:
+        return None
+    return " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+
+
+def extract_title(content: str, path: str) -> str:
+    """
+    문서 제목 (첫 번째 # 제목, 없으면 파일 이름)
+
+    Args:
+        content: 마크다운 내용
+        path: 파일 경로
+
+    Returns:
+        제목
+    """
+    for line in content.splitlines()[:TITLE_SCAN_LINES]:
+        stripped = line.strip()
+        if stripped.startswith("# "):
+            return stripped[2:].strip()
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def split_highlight(text: str) -> list[dict[str, str | bool]]:
+    """
+    하이라이트 구분자 → 구간 목록
+
+    Args:
+        text: MATCH_START/MATCH_END로 일치 구간이 표시된 텍스트
+
+    Returns:
+        {"text", "match"} 목록 (빈 구간 제외)
+    """
+    segments: list[dict[str, str | bool]] = []
+    for index, part in enumerate(text.split(MATCH_START)):
+        if index == 0:
+            matched, rest = "", part
+        else:
+            matched, _, rest = part.partition(MATCH_END)
+        if matched:
+            segments.append({"text": matched, "match": True})
+        if rest:
+            segments.append({"text": rest, "match": False})
+    return segments
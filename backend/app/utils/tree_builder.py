@@ -6,85 +6,253 @@ Spec: spec/api/folder-tree.md
 """
 
 import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
+from app.core.config import settings
 from app.schemas.folder import TreeNode
 
 
-COMMON_IGNORED_DIRS = {
-    'node_modules', '__pycache__', 'venv', '.venv', 'env', '.env', 
-    'dist', 'build', 'coverage', '.git', '.vscode', '.idea', '.next',
-    'target', 'out'
-}
+# 트리, 검색 대조, 빠른 열기, 파일 감시가 공통으로 제외하는 폴더 이름
+COMMON_IGNORED_DIRS = settings.IGNORED_DIRS
 
+# depth 경계 폴더의 마크다운 존재 확인 시 최대 탐색 폴더 수
+# (초과하면 has_children을 비워 두고 펼칠 때 확인 - 마크다운 없는 큰 src/assets 트리 전체 탐색 방지)
+MARKDOWN_PROBE_LIMIT = 16
 
-def build_tree(path: str, md_only: bool = True) -> TreeNode:
+
+def is_excluded_dir(name: str) -> bool:
+    """하위 탐색에서 제외되는 폴더 이름인지 확인 (숨김 폴더, COMMON_IGNORED_DIRS)"""
+    return name.startswith(".") or name in COMMON_IGNORED_DIRS
+
+
+def is_excluded_path(rel_path: str) -> bool:
+    """
+    트리에서 제외되는 상대 경로인지 확인
+
+    build_tree와 동일한 규칙 (숨김 파일/폴더, COMMON_IGNORED_DIRS 하위)
+
+    Args:
+        rel_path: 감시 폴더 기준 상대 경로
+
+    Returns:
+        트리에 나타나지 않는 경로면 True
+    """
+    parts = rel_path.split(os.sep)
+    for part in parts[:-1]:
+        if is_excluded_dir(part):
+            return True
+    return parts[-1].startswith(".")
+
+
+def normalize_subpath(subpath: str) -> str | None:
+    """
+    트리 조회 하위 경로 정규화
+
+    Args:
+        subpath: 폴더 기준 상대 경로 ("" 또는 "/"는 폴더 루트)
+
+    Returns:
+        정규화된 상대 경로 (루트는 ""), 폴더 밖이거나 트리에서 제외되는 경로면 None
+    """
+    rel_path = os.path.normpath(subpath.strip("/"))
+    if rel_path == os.curdir:
+        return ""
+    if os.path.isabs(rel_path) or rel_path == os.pardir or rel_path.startswith(os.pardir + os.sep):
+        return None
+    if is_excluded_path(rel_path) or os.path.basename(rel_path) in COMMON_IGNORED_DIRS:
+        return None
+    return rel_path
+
+
+def scan_directory(path: str, md_only: bool = True) -> tuple[list[str], list[str]]:
+    """
+    디렉토리 한 단계 탐색 (정렬 및 필터 적용)
+
+    os.scandir의 DirEntry 타입 캐시를 사용하므로 항목별 stat 호출이 없다.
+
+    Args:
+        path: 디렉토리 절대 경로
+        md_only: True면 .md 파일만 포함
+
+    Returns:
+        (하위 폴더 이름 목록, 파일 이름 목록) - 각각 대소문자 무시 알파벳순
+
+    Raises:
+        OSError: 디렉토리 읽기 실패 (권한 없음, 탐색 중 삭제 등)
+    """
+    dirs = []
+    files = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = entry.name
+
+            # 숨김 파일/폴더 제외
+            if name.startswith("."):
+                continue
+
+            # follow_symlinks=False → 심볼릭 링크는 폴더/파일 어느 쪽에도 포함되지 않음
+            if entry.is_dir(follow_symlinks=False):
+                # 무시할 폴더 제외 (node_modules 등)
+                if name not in COMMON_IGNORED_DIRS:
+                    dirs.append(name)
+            elif entry.is_file(follow_symlinks=False):
+                # md_only 필터 (강력 적용)
+                if not md_only or name.lower().endswith(".md"):
+                    files.append(name)
+
+    dirs.sort(key=str.lower)
+    files.sort(key=str.lower)
+    return dirs, files
+
+
+def scan_tree(
+    path: str, md_only: bool = True, max_workers: int = 4
+) -> dict[str, tuple[list[str], list[str]]]:
+    """
+    하위 폴더 탐색을 스레드 풀로 병렬 수행
+
+    네트워크/바인드 마운트처럼 readdir 지연이 큰 환경에서 I/O 대기를 겹치게 한다.
+    워커는 한 단계씩만 탐색하고, 하위 폴더 제출은 호출 스레드가 담당하므로
+    풀 크기와 무관하게 교착 상태가 발생하지 않는다.
+
+    Args:
+        path: 폴더 절대 경로
+        md_only: True면 .md 파일만 포함
+        max_workers: 동시 탐색 스레드 수
+
+    Returns:
+        폴더 경로 -> (하위 폴더 이름 목록, 파일 이름 목록)
+    """
+    scans: dict[str, tuple[list[str], list[str]]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tree-scan") as executor:
+        pending = {executor.submit(_scan_or_empty, path, md_only): path}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                dir_path = pending.pop(future)
+                scans[dir_path] = future.result()
+                for dir_name in scans[dir_path][0]:
+                    child_path = os.path.join(dir_path, dir_name)
+                    pending[executor.submit(_scan_or_empty, child_path, md_only)] = child_path
+    return scans
+
+
+def _scan_or_empty(path: str, md_only: bool) -> tuple[list[str], list[str]]:
+    try:
+        return scan_directory(path, md_only)
+    except OSError:
+        # 권한 없는 폴더 → 빈 폴더로 처리
+        return [], []
+
+
+def build_tree(
+    path: str, md_only: bool = True, max_workers: int = 1, depth: int | None = None
+) -> TreeNode:
     """
     폴더 경로의 트리 구조 생성
 
     Args:
         path: 폴더 절대 경로
-        md_only: True면 .md 파일만 포함 (기본값 True)
+        md_only: True면 .md 파일만 포함하고, .md가 없는 폴더는 제외 (기본값 True)
+        max_workers: 2 이상이면 스레드 풀로 병렬 탐색 (기본값 1, 순차 탐색)
+        depth: 포함할 단계 수 (None이면 전체). 경계의 폴더는 children 대신 has_children만 표시
 
     Returns:
         TreeNode: 트리 구조
     """
-    folder_path = Path(path)
-    name = folder_path.name
+    # 경로 정규화는 루트에서 한 번만 수행하고, 재귀는 문자열 경로로 처리
+    root = str(Path(path))
+    if max_workers > 1 and depth is None:
+        return _assemble_tree(root, scan_tree(root, md_only, max_workers), md_only)
+    return _build_tree(root, md_only, depth)
 
-    children = []
+
+def _build_tree(path: str, md_only: bool, depth: int | None = None) -> TreeNode:
+    name = os.path.basename(path)
 
     try:
-        items = sorted(folder_path.iterdir(), key=lambda x: x.name.lower())
-    except PermissionError:
+        dir_names, file_names = scan_directory(path, md_only)
+    except OSError:
         # 권한 없는 폴더 → 빈 children 반환
+        if depth == 0:
+            return TreeNode(name=name, type="directory", has_children=False)
         return TreeNode(name=name, type="directory", children=[])
 
-    # 폴더 먼저, 파일 나중으로 분리
-    dirs = [item for item in items if item.is_dir() and not item.is_symlink()]
-    files = [item for item in items if item.is_file() and not item.is_symlink()]
+    # depth 경계 → 하위 트리 대신 존재 여부만 표시
+    if depth == 0:
+        if md_only:
+            # 감시 중인 폴더는 TreeIndex의 file_count로 응답하므로 이 탐색은 캐시 없는 조회에서만 수행
+            # 탐색 한도를 넘으면 None (알 수 없음, 클라이언트가 펼칠 때 조회)
+            has_children = True if file_names else _has_markdown(path, dir_names)
+        else:
+            has_children = bool(dir_names or file_names)
+        return TreeNode(name=name, type="directory", has_children=has_children)
 
-    # 디렉토리 처리
-    for item in dirs:
-        # 숨김 폴더 제외
-        if item.name.startswith("."):
-            continue
-            
-        # 무시할 폴더 제외 (node_modules 등)
-        if item.name in COMMON_IGNORED_DIRS:
-            continue
+    child_depth = None if depth is None else depth - 1
 
-        child = build_tree(str(item), md_only)
-        
-        # md_only 모드일 때, 자식이 없는 빈 폴더는 트리에 포함하지 않음 (선택 사항이지만 깔끔하게 보이기 위해 추천)
-        # 하지만 빈 폴더도 구조 확인용으로 필요할 수 있으니 일단은 포함하되, 
-        # 사용자가 "md제외 모두 무시"라고 했으므로, 파일이 하나도 없는 깡통 폴더들이 주룩주룩 뜨는걸 방지하려면
-        # 자식(md파일)이 있는 경우에만 추가하는 로직이 더 적절할 수 있음.
-        # 여기서는 일단 폴더 무시 로직만 강화하고, 재귀 호출 결과는 그대로 둡니다.
-        
+    # 폴더 먼저, 파일 나중
+    children = []
+    for dir_name in dir_names:
+        child = _build_tree(os.path.join(path, dir_name), md_only, child_depth)
+        # md_only 모드에서는 마크다운이 없는 폴더 제외 (하위 결과로 판단, 추가 탐색 없음)
+        # 경계 폴더는 없다고 확인된 경우만 제외 (has_children=None은 알 수 없음)
+        if md_only and (child.has_children is False if child.children is None else not child.children):
+            continue
         children.append(child)
+    children.extend(
+        TreeNode(name=file_name, type="file", path=os.path.join(path, file_name))
+        for file_name in file_names
+    )
 
-    # 파일 처리
-    for item in files:
-        # 숨김 파일 제외
-        if item.name.startswith("."):
-            continue
+    return TreeNode(name=name, type="directory", children=children)
+
+
+def _has_markdown(path: str, dir_names: list[str], limit: int = MARKDOWN_PROBE_LIMIT) -> bool | None:
+    """
+    하위 폴더 어딘가에 .md 파일이 있는지 확인 (너비 우선, 첫 발견 시 중단)
+
+    Args:
+        path: 폴더 경로
+        dir_names: 이미 나열한 하위 폴더 이름 목록
+        limit: 최대 탐색 폴더 수
 
-        # md_only 필터 (강력 적용)
-        if md_only and not item.name.lower().endswith(".md"):
+    Returns:
+        있으면 True, 없으면 False, limit개 폴더를 탐색해도 판단하지 못하면 None
+    """
+    pending = deque(os.path.join(path, dir_name) for dir_name in dir_names)
+    while pending:
+        if limit <= 0:
+            return None
+        limit -= 1
+        dir_path = pending.popleft()
+        try:
+            child_dirs, file_names = scan_directory(dir_path, md_only=True)
+        except OSError:
             continue
+        if file_names:
+            return True
+        pending.extend(os.path.join(dir_path, dir_name) for dir_name in child_dirs)
+    return False
 
-        children.append(
-            TreeNode(
-                name=item.name,
-                type="file",
-                path=str(item),
-            )
-        )
-    
-    # MD Only 모드일 때, 자식이 하나도 없으면 (즉, MD 파일도 없고 하위 폴더에도 MD가 없으면)
-    # 이 폴더 자체를 트리에 표시하지 않는 것이 '모두 무시'의 의도에 더 부합합니다.
-    # 단, 최상위 루트 폴더는 항상 표시되어야 하므로 재귀 함수 내부에서 이를 판단하기는 까다롭습니다.
-    # 일단 요구사항인 "파일 필터링"과 "폴더 무시"에 집중합니다.
 
-    return TreeNode(name=name, type="directory", children=children)
+def _assemble_tree(
+    path: str, scans: dict[str, tuple[list[str], list[str]]], md_only: bool
+) -> TreeNode:
+    """scan_tree 결과로 TreeNode 조립 (I/O 없음)"""
+    dir_names, file_names = scans[path]
+
+    children = []
+    for dir_name in dir_names:
+        child = _assemble_tree(os.path.join(path, dir_name), scans, md_only)
+        # md_only 모드에서는 마크다운이 없는 폴더 제외
+        if md_only and not child.children:
+            continue
+        children.append(child)
+    children.extend(
+        TreeNode(name=file_name, type="file", path=os.path.join(path, file_name))
+        for file_name in file_names
+    )
+
+    return TreeNode(name=os.path.basename(path), type="directory", children=children)
@@ -0,0 +1,305 @@
+"""
+트리 인덱스 유틸리티
+
+폴더 트리를 상대 경로 기반의 가변 인덱스로 유지
+Spec: spec/api/folder-tree.md
+
+- 파일 1개 변경 시 전체 재탐색 없이 O(depth)로 노드 추가/삭제
+- 디렉토리별 TreeNode 직렬화 결과를 캐싱하고, 변경 경로의 조상만 무효화
+- 폴더별 하위 파일 수를 유지하여 md_only 모드에서 .md가 없는 폴더를 추가 탐색 없이 제외
+"""
+
+import os
+import stat
+import threading
+from pathlib import Path
+
+from app.schemas.folder import TreeNode
+from app.utils.tree_builder import COMMON_IGNORED_DIRS, is_excluded_path, scan_directory, scan_tree
+
+
+class _DirNode:
+    """인덱스 내부 디렉토리 노드"""
+
+    __slots__ = ("name", "dirs", "files", "file_count", "tree")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.dirs: dict[str, "_DirNode"] = {}  # 폴더 이름 -> 노드
+        self.files: set[str] = set()  # 파일 이름
+        self.file_count = 0  # 하위 트리 전체 파일 수 (md_only면 .md 파일 수)
+        self.tree: TreeNode | None = None  # 직렬화 캐시
+
+
+class TreeIndex:
+    """
+    폴더 트리 인덱스 (Thread-safe)
+
+    build_tree와 동일한 필터/정렬 규칙으로 TreeNode를 생성한다.
+    """
+
+    def __init__(self, root: str, md_only: bool = True) -> None:
+        """
+        Args:
+            root: 폴더 절대 경로
+            md_only: True면 .md 파일만 포함
+        """
+        self.root = str(Path(root))
+        self.md_only = md_only
+        self._root_node = _DirNode(os.path.basename(self.root))
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(cls, root: str, md_only: bool = True, max_workers: int = 1) -> "TreeIndex":
+        """
+        파일 시스템을 탐색하여 인덱스 생성
+
+        Args:
+            root: 폴더 절대 경로
+            md_only: True면 .md 파일만 포함
+            max_workers: 2 이상이면 스레드 풀로 병렬 탐색
+        """
+        index = cls(root, md_only)
+        name = index._root_node.name
+        if max_workers > 1:
+            scans = scan_tree(index.root, md_only, max_workers)
+            index._root_node = index._assemble(index.root, name, scans)
+        else:
+            index._root_node = index._scan(index.root, name)
+        return index
+
+    @classmethod
+    def from_scans(
+        cls, root: str, md_only: bool, scans: dict[str, tuple[list[str], list[str]]]
+    ) -> "TreeIndex":
+        """
+        상대 경로 탐색 결과로 인덱스 생성 (I/O 없음, 저장된 스냅샷 복원용)
+
+        Args:
+            root: 폴더 절대 경로
+            md_only: True면 .md 파일만 포함
+            scans: 루트 기준 상대 폴더 경로("" = 루트) -> (하위 폴더 이름 목록, 파일 이름 목록)
+
+        Raises:
+            KeyError: 하위 폴더의 탐색 결과가 없는 경우 (손상된 스냅샷)
+        """
+        index = cls(root, md_only)
+        absolute = {
+            os.path.join(index.root, rel_dir) if rel_dir else index.root: entry
+            for rel_dir, entry in scans.items()
+        }
+        index._root_node = index._assemble(index.root, index._root_node.name, absolute)
+        return index
+
+    def to_scans(self) -> dict[str, tuple[list[str], list[str]]]:
+        """인덱스 → 상대 경로 탐색 결과 (from_scans의 역변환)"""
+        scans: dict[str, tuple[list[str], list[str]]] = {}
+        with self._lock:
+            stack = [("", self._root_node)]
+            while stack:
+                rel_dir, node = stack.pop()
+                scans[rel_dir] = (list(node.dirs), list(node.files))
+                for name, child in node.dirs.items():
+                    stack.append((os.path.join(rel_dir, name) if rel_dir else name, child))
+        return scans
+
+    def to_tree(self, subpath: str = "", depth: int | None = None) -> TreeNode | None:
+        """
+        인덱스를 TreeNode로 직렬화 (변경 없는 하위 트리는 캐시 재사용)
+
+        Args:
+            subpath: 루트 기준 하위 폴더 상대 경로 ("" = 루트)
+            depth: 포함할 단계 수 (None이면 전체)
+
+        Returns:
+            TreeNode, subpath 폴더가 인덱스에 없으면 None
+        """
+        with self._lock:
+            node, path = self._root_node, self.root
+            for part in subpath.split(os.sep) if subpath else ():
+                node = node.dirs.get(part)
+                if node is None:
+                    return None
+                path = os.path.join(path, part)
+
+            if depth is None:
+                return self._serialize(node, path)
+            return self._serialize_depth(node, path, depth)
+
+    def sync_path(self, path: str) -> bool:
+        """
+        단일 경로를 디스크 상태와 동기화
+
+        이벤트 종류(created/deleted/moved)와 무관하게 현재 디스크 상태를 기준으로
+        노드를 추가/삭제하므로 debounce로 합쳐진 이벤트도 안전하게 반영된다.
+
+        Args:
+            path: 변경된 파일/폴더 절대 경로
+
+        Returns:
+            인덱스가 변경되었으면 True
+        """
+        rel_path = os.path.relpath(path, self.root)
+        if rel_path == os.curdir or rel_path.startswith(os.pardir) or is_excluded_path(rel_path):
+            return False
+
+        parts = rel_path.split(os.sep)
+        try:
+            mode = os.lstat(path).st_mode
+        except OSError:
+            mode = None
+
+        with self._lock:
+            if mode is not None and stat.S_ISDIR(mode) and parts[-1] not in COMMON_IGNORED_DIRS:
+                return self._insert_dir(parts)
+            if mode is not None and stat.S_ISREG(mode) and self._accepts_file(parts[-1]):
+                return self._insert_file(parts)
+            # 삭제됨, 심볼릭 링크, 필터 대상 → 인덱스에서 제거
+            return self._remove(parts)
+
+    # -------------------------------------------------------------------------
+    # 내부 구현
+    # -------------------------------------------------------------------------
+
+    def _accepts_file(self, name: str) -> bool:
+        return not self.md_only or name.lower().endswith(".md")
+
+    def _scan(self, path: str, name: str) -> _DirNode:
+        """디렉토리 하위 트리 전체 탐색"""
+        node = _DirNode(name)
+        try:
+            dir_names, file_names = scan_directory(path, self.md_only)
+        except OSError:
+            # 권한 없음 또는 탐색 도중 삭제됨 → 빈 폴더로 처리
+            return node
+        for dir_name in dir_names:
+            node.dirs[dir_name] = self._scan(os.path.join(path, dir_name), dir_name)
+        node.files.update(file_names)
+        node.file_count = len(node.files) + sum(child.file_count for child in node.dirs.values())
+        return node
+
+    def _assemble(
+        self, path: str, name: str, scans: dict[str, tuple[list[str], list[str]]]
+    ) -> _DirNode:
+        """scan_tree 결과로 노드 조립 (I/O 없음)"""
+        node = _DirNode(name)
+        dir_names, file_names = scans[path]
+        for dir_name in dir_names:
+            node.dirs[dir_name] = self._assemble(os.path.join(path, dir_name), dir_name, scans)
+        node.files.update(file_names)
+        node.file_count = len(node.files) + sum(child.file_count for child in node.dirs.values())
+        return node
+
+    def _walk(self, parts: list[str]) -> list[_DirNode] | None:
+        """루트부터 parts 부모까지의 노드 경로 반환 (중간 폴더가 없으면 None)"""
+        nodes = [self._root_node]
+        for part in parts[:-1]:
+            child = nodes[-1].dirs.get(part)
+            if child is None:
+                return None
+            nodes.append(child)
+        return nodes
+
+    @staticmethod
+    def _touch(nodes: list[_DirNode], file_delta: int) -> None:
+        """변경 경로 조상들의 하위 파일 수 갱신 및 직렬화 캐시 무효화 (O(depth))"""
+        for node in nodes:
+            node.file_count += file_delta
+            node.tree = None
+
+    def _is_visible(self, node: _DirNode) -> bool:
+        """md_only 모드에서는 .md가 하나도 없는 폴더 제외"""
+        return not self.md_only or node.file_count > 0
+
+    def _has_children(self, node: _DirNode) -> bool:
+        if self.md_only:
+            return node.file_count > 0
+        return bool(node.dirs or node.files)
+
+    def _insert_missing_ancestor(self, parts: list[str]) -> bool:
+        """인덱스에 없는 가장 가까운 조상 폴더를 통째로 탐색하여 추가"""
+        nodes = [self._root_node]
+        for depth, part in enumerate(parts[:-1]):
+            child = nodes[-1].dirs.get(part)
+            if child is None:
+                return self._insert_dir(parts[: depth + 1])
+            nodes.append(child)
+        return False
+
+    def _insert_dir(self, parts: list[str]) -> bool:
+        nodes = self._walk(parts)
+        if nodes is None:
+            return self._insert_missing_ancestor(parts)
+        parent, name = nodes[-1], parts[-1]
+        if name in parent.dirs:
+            return False
+        file_delta = -1 if name in parent.files else 0
+        parent.files.discard(name)
+        dir_path = os.path.join(self.root, *parts)
+        child = parent.dirs[name] = self._scan(dir_path, name)
+        self._touch(nodes, file_delta + child.file_count)
+        return True
+
+    def _insert_file(self, parts: list[str]) -> bool:
+        nodes = self._walk(parts)
+        if nodes is None:
+            return self._insert_missing_ancestor(parts)
+        parent, name = nodes[-1], parts[-1]
+        if name in parent.files:
+            return False
+        replaced = parent.dirs.pop(name, None)
+        parent.files.add(name)
+        self._touch(nodes, 1 - (replaced.file_count if replaced else 0))
+        return True
+
+    def _remove(self, parts: list[str]) -> bool:
+        nodes = self._walk(parts)
+        if nodes is None:
+            return False
+        parent, name = nodes[-1], parts[-1]
+        removed = parent.dirs.pop(name, None)
+        if removed is not None:
+            file_delta = -removed.file_count
+        elif name in parent.files:
+            parent.files.discard(name)
+            file_delta = -1
+        else:
+            return False
+        self._touch(nodes, file_delta)
+        return True
+
+    def _serialize(self, node: _DirNode, path: str) -> TreeNode:
+        if node.tree is not None:
+            return node.tree
+
+        # 폴더 먼저, 파일 나중 (각각 대소문자 무시 알파벳순)
+        children = [
+            self._serialize(node.dirs[dir_name], os.path.join(path, dir_name))
+            for dir_name in sorted(node.dirs, key=str.lower)
+            if self._is_visible(node.dirs[dir_name])
+        ]
+        children.extend(
+            TreeNode(name=file_name, type="file", path=os.path.join(path, file_name))
+            for file_name in sorted(node.files, key=str.lower)
+        )
+
+        node.tree = TreeNode(name=node.name, type="directory", children=children)
+        return node.tree
+
+    def _serialize_depth(self, node: _DirNode, path: str, depth: int) -> TreeNode:
+        # depth 경계 → 하위 항목 존재 여부만 표시
+        if depth == 0:
+            return TreeNode(
+                name=node.name, type="directory", has_children=self._has_children(node)
+            )
+
+        children = [
+            self._serialize_depth(node.dirs[dir_name], os.path.join(path, dir_name), depth - 1)
+            for dir_name in sorted(node.dirs, key=str.lower)
+            if self._is_visible(node.dirs[dir_name])
+        ]
+        children.extend(
+            TreeNode(name=file_name, type="file", path=os.path.join(path, file_name))
+            for file_name in sorted(node.files, key=str.lower)
+        )
+        return TreeNode(name=node.name, type="directory", children=children)
@@ -18,7 +18,17 @@ from loguru import logger
 from app.api.folders import router as folders_router
 from app.db.database import init_db, get_db
 from app.services.connection_manager import manager
+from app.services.content_delta import content_deltas
 from app.services.file_watcher import file_watcher
+from app.services.search_indexer import search_indexer
+from app.services.tree_cache import tree_cache
+from app.services.tree_snapshots import tree_snapshots
+
+
+async def broadcast_file_change(message: dict) -> None:
+    """파일 변경 알림 broadcast 후 열람 중인 클라이언트에 변경분 전송"""
+    await manager.broadcast(message)
+    await content_deltas.publish(message)
 
 
 @asynccontextmanager
@@ -30,19 +40,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # FileWatcher 초기화
     loop = asyncio.get_running_loop()
     file_watcher.set_event_loop(loop)
-    file_watcher.set_broadcast_callback(manager.broadcast)
+    file_watcher.set_broadcast_callback(broadcast_file_change)
+    # 트리 스냅샷 대조에서 찾은 차이는 감시 이벤트처럼 클라이언트에 전달
+    tree_cache.set_drift_callback(file_watcher.notify_changes)
     
     # 기존 등록된 폴더들 watcher 추가
     try:
         from app.repositories.folder_repository import FolderRepository
         from app.services.folder_service import FolderService
+        from app.services.allowed_roots import allowed_roots
         from app.core.config import settings
 
         db_gen = get_db()
         db = next(db_gen)
         try:
             repo = FolderRepository(db)
-            service = FolderService(repo, file_watcher, settings)
+            service = FolderService(repo, file_watcher, settings, allowed_roots, search_indexer)
             service.initialize_watchers()
         finally:
             try:
@@ -54,8 +67,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     yield
     
-    # 종료 시: 모든 watcher 중지
+    # 종료 시: 대기 중인 트리 스냅샷 저장 후 모든 watcher 및 검색 색인 중지
+    # (watcher 중지 시 폴더 캐시 제거로 대기 저장이 취소되므로 먼저 저장)
+    tree_snapshots.flush()
     file_watcher.stop_all()
+    search_indexer.stop()
     logger.info("DocBridge 서버 종료")
 
 
@@ -93,6 +109,12 @@ app.include_router(folders_router, prefix="/api/folders", tags=["folders"])
 from app.api.files import router as files_router
 app.include_router(files_router, prefix="/api/files", tags=["files"])
 
+from app.api.search import router as search_router
+app.include_router(search_router, prefix="/api/search", tags=["search"])
+
+from app.api.quick_open import router as quick_open_router
+app.include_router(quick_open_router, prefix="/api/quickopen", tags=["quickopen"])
+
 # WebSocket 라우터 등록
 from app.api.websocket import router as websocket_router
 app.include_router(websocket_router, tags=["websocket"])
@@ -0,0 +1,96 @@
+"""
+허용 폴더 루트 인덱스 테스트
+
+Spec: spec/api/file-content.md - 보안
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app.services.allowed_roots import AllowedRootIndex
+
+
+class TestAllowedRootIndex:
+    """Unit Tests - AllowedRootIndex"""
+
+    def test_allows_root_and_descendants(self, tmp_path: Path) -> None:
+        index = AllowedRootIndex()
+        index.add(str(tmp_path / "docs"))
+        root = os.path.realpath(tmp_path / "docs")
+
+        assert index.is_allowed(root) is True
+        assert index.is_allowed(os.path.join(root, "api", "auth.md")) is True
+        assert index.is_allowed(os.path.dirname(root)) is False
+
+    def test_prefix_sibling_not_allowed(self, tmp_path: Path) -> None:
+        """/tmp/foo 등록 시 /tmp/foobar 는 허용되지 않음"""
+        index = AllowedRootIndex()
+        index.add(str(tmp_path / "foo"))
+
+        assert index.is_allowed(os.path.realpath(tmp_path / "foobar" / "a.md")) is False
+
+    def test_remove_keeps_other_registrations_of_same_root(self, tmp_path: Path) -> None:
+        """심볼릭 링크 등으로 같은 실제 경로가 두 번 등록된 경우 하나만 제거"""
+        (tmp_path / "real").mkdir()
+        index = AllowedRootIndex()
+        index.add(str(tmp_path / "real"))
+        index.add(str(tmp_path / "real"))
+
+        index.remove(str(tmp_path / "real"))
+        assert index.is_allowed(os.path.realpath(tmp_path / "real" / "a.md")) is True
+
+        index.remove(str(tmp_path / "real"))
+        assert index.is_allowed(os.path.realpath(tmp_path / "real" / "a.md")) is False
+
+    def test_nested_roots(self, tmp_path: Path) -> None:
+        index = AllowedRootIndex()
+        index.add(str(tmp_path / "a"))
+        index.add(str(tmp_path / "a" / "b"))
+
+        index.remove(str(tmp_path / "a"))
+
+        assert index.is_allowed(os.path.realpath(tmp_path / "a" / "x.md")) is False
+        assert index.is_allowed(os.path.realpath(tmp_path / "a" / "b" / "x.md")) is True
+
+    def test_replace_marks_loaded(self, tmp_path: Path) -> None:
+        index = AllowedRootIndex()
+        assert index.loaded is False
+
+        index.replace([str(tmp_path)])
+
+        assert index.loaded is True
+        assert index.is_allowed(os.path.realpath(tmp_path / "a.md")) is True
+
+
+class TestAllowedRootsAPI:
+    """Integration Tests - 파일 접근 검사"""
+
+    def test_file_access_does_not_query_folders(self, client: TestClient, temp_dir: Path) -> None:
+        """접근 검사는 DB 목록 조회 없이 수행"""
+        md_file = temp_dir / "doc.md"
+        md_file.write_text("# Doc")
+        client.post("/api/folders", json={"name": "Docs", "path": str(temp_dir)})
+
+        with patch(
+            "app.repositories.folder_repository.FolderRepository.find_all",
+            side_effect=AssertionError("find_all called"),
+        ):
+            response = client.get(f"/api/files?path={md_file}")
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_deleted_folder_access_revoked(self, client: TestClient, temp_dir: Path) -> None:
+        md_file = temp_dir / "doc.md"
+        md_file.write_text("# Doc")
+        folder_id = client.post(
+            "/api/folders", json={"name": "Docs", "path": str(temp_dir)}
+        ).json()["id"]
+
+        client.delete(f"/api/folders/{folder_id}")
+        response = client.get(f"/api/files?path={md_file}")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
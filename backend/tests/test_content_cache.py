@@ -0,0 +1,126 @@
+"""
+파일 내용 캐시 테스트
+
+Spec: spec/api/file-content.md
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.content_cache import ContentCache
+from app.services.file_watcher import MarkdownEventHandler
+
+
+def _write(path: Path, content: str) -> os.stat_result:
+    path.write_text(content)
+    return path.stat()
+
+
+class TestContentCache:
+    """Unit Tests - ContentCache"""
+
+    def test_get_after_put(self, tmp_path: Path) -> None:
+        md_file = tmp_path / "a.md"
+        stat_result = _write(md_file, "# A")
+        cache = ContentCache(max_bytes=1024)
+
+        cache.put(str(md_file), stat_result, "# A")
+
+        assert cache.get(str(md_file), stat_result) == "# A"
+
+    def test_stale_stat_misses(self, tmp_path: Path) -> None:
+        """mtime/size가 달라지면 캐시 무시 및 제거"""
+        md_file = tmp_path / "a.md"
+        old_stat = _write(md_file, "# A")
+        cache = ContentCache(max_bytes=1024)
+        cache.put(str(md_file), old_stat, "# A")
+
+        new_stat = _write(md_file, "# A changed")
+
+        assert cache.get(str(md_file), new_stat) is None
+        assert len(cache) == 0
+
+    def test_lru_eviction_by_bytes(self, tmp_path: Path) -> None:
+        """바이트 예산 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        cache = ContentCache(max_bytes=10)
+        stats = {name: _write(tmp_path / name, "x" * 4) for name in ("a.md", "b.md", "c.md")}
+
+        cache.put("a.md", stats["a.md"], "xxxx")
+        cache.put("b.md", stats["b.md"], "xxxx")
+        cache.get("a.md", stats["a.md"])  # a 최근 사용
+        cache.put("c.md", stats["c.md"], "xxxx")
+
+        assert cache.get("b.md", stats["b.md"]) is None
+        assert cache.get("a.md", stats["a.md"]) == "xxxx"
+        assert cache.total_bytes == 8
+
+    def test_file_larger_than_budget_not_cached(self, tmp_path: Path) -> None:
+        stat_result = _write(tmp_path / "big.md", "x" * 32)
+        cache = ContentCache(max_bytes=16)
+
+        cache.put("big.md", stat_result, "x" * 32)
+
+        assert len(cache) == 0
+
+    def test_evict_uses_real_path(self, tmp_path: Path) -> None:
+        md_file = tmp_path / "a.md"
+        stat_result = _write(md_file, "# A")
+        cache = ContentCache(max_bytes=1024)
+        cache.put(os.path.realpath(md_file), stat_result, "# A")
+
+        cache.evict(str(tmp_path / "." / "a.md"))
+
+        assert len(cache) == 0
+
+    @pytest.mark.parametrize(
+        "event_type, src_path, dest_path",
+        [
+            ("modified", "doc.md", ""),
+            ("deleted", "doc.md", ""),
+            ("moved", ".doc.md.swp", "doc.md"),  # 에디터 원자적 저장
+        ],
+    )
+    def test_handler_evicts_on_change(
+        self, tmp_path: Path, event_type: str, src_path: str, dest_path: str
+    ) -> None:
+        cache = MagicMock(spec=ContentCache)
+        handler = MarkdownEventHandler(folder_id=1, callback=MagicMock(), content_cache=cache)
+        event = MagicMock()
+        event.event_type = event_type
+        event.src_path = str(tmp_path / src_path)
+        event.dest_path = str(tmp_path / dest_path) if dest_path else ""
+        event.is_directory = False
+
+        with patch.object(handler, "_schedule_callback"):
+            handler.on_any_event(event)
+
+        cache.evict.assert_called_once_with(str(tmp_path / "doc.md"))
+
+
+class TestContentCacheAPI:
+    """Integration Tests - 캐시된 파일 내용 API"""
+
+    def test_second_read_served_from_cache(self, client: TestClient, temp_dir: Path) -> None:
+        md_file = temp_dir / "doc.md"
+        md_file.write_text("# Doc")
+        client.post("/api/folders", json={"name": "Cached", "path": str(temp_dir)})
+
+        assert client.get(f"/api/files?path={md_file}").json()["content"] == "# Doc"
+        with patch("builtins.open", side_effect=AssertionError("file re-read")):
+            response = client.get(f"/api/files?path={md_file}")
+
+        assert response.json()["content"] == "# Doc"
+
+    def test_changed_file_is_reread(self, client: TestClient, temp_dir: Path) -> None:
+        md_file = temp_dir / "doc.md"
+        md_file.write_text("# Doc")
+        client.post("/api/folders", json={"name": "Cached", "path": str(temp_dir)})
+        client.get(f"/api/files?path={md_file}")
+
+        md_file.write_text("# Doc changed")
+
+        assert client.get(f"/api/files?path={md_file}").json()["content"] == "# Doc changed"
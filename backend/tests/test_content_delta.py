@@ -0,0 +1,235 @@
+"""
+열람 파일 변경분 전송 테스트
+
+Spec: spec/api/file-watch-websocket.md
+"""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services.allowed_roots import AllowedRootIndex
+from app.services.content_delta import ContentDeltaService
+from app.utils.line_delta import apply_line_delta, content_hash, line_delta, split_lines
+
+
+class TestLineDelta:
+    """줄 단위 변경분 계산/적용"""
+
+    @pytest.mark.parametrize(
+        ("old", "new"),
+        [
+            ("a\nb\n", "a\nb\n"),
+            ("a\nb\n", "a\nb\nc\n"),  # 끝에 줄 추가
+            ("a\nb", "a\nb\nc"),  # 마지막 줄 개행 없음
+            ("a\nb\nc\n", "a\nc\n"),  # 중간 줄 삭제
+            ("a\nb\nc\nd\n", "x\nb\ny\nd\nz\n"),  # 여러 곳 수정
+            ("", "# New\n"),
+            ("# Old\n", ""),
+            ("한글\n문서\n", "한글\n수정된 문서\n"),
+            ("a\r\nb\r\n", "a\r\nc\r\n"),  # CRLF
+            ("a\u2028b\n", "a\u2028c\n"),  # \n 외 줄 구분 문자는 줄 내용으로 취급
+        ],
+    )
+    def test_roundtrip(self, old: str, new: str) -> None:
+        """변경분을 적용하면 새 내용과 같음"""
+        assert apply_line_delta(old, line_delta(old, new)) == new
+
+    def test_append_is_compact(self) -> None:
+        """큰 파일 끝에 줄 추가 → 추가된 줄만 전송"""
+        old = "".join(f"line {i}\n" for i in range(100_000))
+        ops = line_delta(old, old + "appended\n")
+        assert ops == [[100_000, 100_000, "appended\n"]]
+
+    def test_split_matches_client(self) -> None:
+        """\\n 기준 분할 (클라이언트 정규식 /[^\\n]*\\n|[^\\n]+$/g 와 동일)"""
+        assert split_lines("a\r\nb\u2028c\nd") == ["a\r\n", "b\u2028c\n", "d"]
+        assert split_lines("") == []
+
+    def test_content_hash(self) -> None:
+        """UTF-8 SHA-256 hex"""
+        assert content_hash("") == "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+
+
+@pytest.fixture
+def docs(tmp_path: Path) -> Path:
+    (tmp_path / "spec.md").write_text("# Spec\n\nintro\n", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def service(docs: Path) -> ContentDeltaService:
+    roots = AllowedRootIndex()
+    roots.replace([str(docs)])
+    manager = AsyncMock()
+    return ContentDeltaService(manager, max_bytes=1024 * 1024, roots=roots)
+
+
+def _modified(path: Path) -> dict:
+    return {"type": "file_change", "event": "modified", "path": str(path), "folder_id": 1}
+
+
+class TestContentDeltaService:
+    """ContentDeltaService 열람 등록 및 변경분 전송"""
+
+    @pytest.mark.asyncio
+    async def test_view_returns_hash(self, service: ContentDeltaService, docs: Path) -> None:
+        """열람 등록 → 현재 내용 hash"""
+        digest = await service.view(AsyncMock(), str(docs / "spec.md"))
+        assert digest == content_hash("# Spec\n\nintro\n")
+
+    @pytest.mark.asyncio
+    async def test_view_rejects_disallowed_paths(
+        self, service: ContentDeltaService, docs: Path, tmp_path_factory: pytest.TempPathFactory
+    ) -> None:
+        """허용 폴더 밖 / 비 마크다운 / 없는 파일 / 크기 초과 → None"""
+        outside = tmp_path_factory.mktemp("outside") / "secret.md"
+        outside.write_text("secret")
+        (docs / "notes.txt").write_text("text")
+        (docs / "big.md").write_text("x" * (service.max_bytes + 1))
+        websocket = AsyncMock()
+
+        assert await service.view(websocket, str(outside)) is None
+        assert await service.view(websocket, str(docs / "notes.txt")) is None
+        assert await service.view(websocket, str(docs / "missing.md")) is None
+        assert await service.view(websocket, str(docs / "big.md")) is None
+        assert service.viewed_count == 0
+
+    @pytest.mark.asyncio
+    async def test_modified_pushes_delta(self, service: ContentDeltaService, docs: Path) -> None:
+        """수정 → 추가된 줄만 담은 file_delta, 적용 결과 hash 일치"""
+        path = docs / "spec.md"
+        websocket = AsyncMock()
+        base_hash = await service.view(websocket, str(path))
+
+        path.write_text("# Spec\n\nintro\nappended\n", encoding="utf-8")
+        await service.publish(_modified(path))
+
+        service.manager.send.assert_awaited_once()
+        target, delta = service.manager.send.call_args.args
+        assert target is websocket
+        assert delta["type"] == "file_delta"
+        assert delta["path"] == str(path)
+        assert delta["base_hash"] == base_hash
+        assert delta["ops"] == [[3, 3, "appended\n"]]
+        assert content_hash(apply_line_delta("# Spec\n\nintro\n", delta["ops"])) == delta["hash"]
+
+    @pytest.mark.asyncio
+    async def test_delta_computed_once_per_base_version(
+        self, service: ContentDeltaService, docs: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """같은 기준 버전의 클라이언트 여러 개 → 변경분 계산 1회"""
+        import app.services.content_delta as module
+
+        path = docs / "spec.md"
+        clients = [AsyncMock() for _ in range(5)]
+        for websocket in clients:
+            await service.view(websocket, str(path))
+
+        calls = []
+
+        def counting_delta(old: str, new: str) -> list[list]:
+            calls.append(1)
+            return line_delta(old, new)
+
+        monkeypatch.setattr(module, "line_delta", counting_delta)
+        path.write_text("# Spec\n\nchanged\n", encoding="utf-8")
+        await service.publish(_modified(path))
+
+        assert len(calls) == 1
+        assert service.manager.send.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_consecutive_deltas_chain(self, service: ContentDeltaService, docs: Path) -> None:
+        """두 번째 변경분의 base_hash는 첫 번째 변경분의 hash"""
+        path = docs / "spec.md"
+        await service.view(AsyncMock(), str(path))
+
+        path.write_text("# Spec\n\nintro\none\n", encoding="utf-8")
+        await service.publish(_modified(path))
+        path.write_text("# Spec\n\nintro\none\ntwo\n", encoding="utf-8")
+        await service.publish(_modified(path))
+
+        first, second = (call.args[1] for call in service.manager.send.call_args_list)
+        assert second["base_hash"] == first["hash"]
+
+    @pytest.mark.asyncio
+    async def test_full_content_when_delta_is_larger(self, service: ContentDeltaService, docs: Path) -> None:
+        """전체 재작성 → ops 대신 content"""
+        path = docs / "spec.md"
+        await service.view(AsyncMock(), str(path))
+
+        path.write_text("completely\ndifferent\n", encoding="utf-8")
+        await service.publish(_modified(path))
+
+        delta = service.manager.send.call_args.args[1]
+        assert "ops" not in delta
+        assert delta["content"] == "completely\ndifferent\n"
+
+    @pytest.mark.asyncio
+    async def test_unviewed_and_unrelated_files_are_skipped(
+        self, service: ContentDeltaService, docs: Path
+    ) -> None:
+        """열람 해제 / 다른 파일 변경 → 전송 없음"""
+        path = docs / "spec.md"
+        (docs / "other.md").write_text("# Other\n")
+        websocket = AsyncMock()
+        await service.view(websocket, str(path))
+
+        await service.publish(_modified(docs / "other.md"))
+        await service.unview(websocket, str(path))
+        path.write_text("# Spec\nchanged\n", encoding="utf-8")
+        await service.publish(_modified(path))
+
+        service.manager.send.assert_not_awaited()
+        assert service.viewed_count == 0
+
+    @pytest.mark.asyncio
+    async def test_deleted_and_forget_release_views(
+        self, service: ContentDeltaService, docs: Path
+    ) -> None:
+        """삭제 이벤트 / 연결 해제 → 열람 정보 제거"""
+        path = docs / "spec.md"
+        (docs / "other.md").write_text("# Other\n")
+        websocket = AsyncMock()
+        await service.view(websocket, str(path))
+        await service.view(websocket, str(docs / "other.md"))
+
+        await service.publish({
+            "type": "file_changes",
+            "folder_id": 1,
+            "changes": [{"event": "deleted", "path": str(path)}],
+        })
+        assert service.viewed_count == 1
+
+        await service.forget(websocket)
+        assert service.viewed_count == 0
+
+    @pytest.mark.asyncio
+    async def test_deleted_tolerates_stale_client_index(
+        self, service: ContentDeltaService, docs: Path
+    ) -> None:
+        """클라이언트 색인에 없는 열람 정보가 남아 있어도 삭제 이벤트 처리"""
+        path = docs / "spec.md"
+        websocket = AsyncMock()
+        await service.view(websocket, str(path))
+        service._clients[websocket].clear()
+
+        await service.publish({"type": "file_change", "event": "deleted", "path": str(path), "folder_id": 1})
+
+        assert service.viewed_count == 0
+
+    @pytest.mark.asyncio
+    async def test_view_limit_per_client(self, docs: Path) -> None:
+        """클라이언트별 열람 파일 수 초과 → 오래된 파일부터 해제"""
+        roots = AllowedRootIndex()
+        roots.replace([str(docs)])
+        service = ContentDeltaService(AsyncMock(), max_bytes=1024, max_files_per_client=2, roots=roots)
+        websocket = AsyncMock()
+        for name in ("a.md", "b.md", "c.md"):
+            (docs / name).write_text(name)
+            await service.view(websocket, str(docs / name))
+
+        assert set(service._views) == {str((docs / "b.md").resolve()), str((docs / "c.md").resolve())}
@@ -0,0 +1,169 @@
+"""
+DebounceScheduler 테스트
+
+Spec: spec/api/file-watch-websocket.md - 섹션 5
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from app.services.file_watcher import FileWatcherService, MarkdownEventHandler
+from app.utils.debounce_scheduler import DebounceScheduler
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestDebounceScheduler:
+    """단일 스레드 debounce 스케줄러"""
+
+    def test_same_key_keeps_last_item(self) -> None:
+        """같은 키 재예약 → 마지막 항목만 1회 전달"""
+        scheduler = DebounceScheduler()
+        batches: list[list[str]] = []
+        try:
+            scheduler.schedule(batches.append, "a.md", "first", 0.05)
+            scheduler.schedule(batches.append, "a.md", "second", 0.05)
+
+            assert _wait_for(lambda: batches)
+            time.sleep(0.1)
+            assert batches == [["second"]]
+        finally:
+            scheduler.stop()
+
+    def test_deadline_is_extended(self) -> None:
+        """재예약 시 deadline이 뒤로 밀림"""
+        scheduler = DebounceScheduler()
+        batches: list[list[str]] = []
+        try:
+            scheduler.schedule(batches.append, "a.md", "x", 0.2)
+            time.sleep(0.1)
+            scheduler.schedule(batches.append, "a.md", "y", 0.2)
+            time.sleep(0.15)
+            assert batches == []  # 최초 deadline은 지났지만 갱신됨
+
+            assert _wait_for(lambda: batches)
+            assert batches == [["y"]]
+        finally:
+            scheduler.stop()
+
+    def test_due_items_dispatched_as_batch(self) -> None:
+        """같은 시점에 기한이 지난 항목은 콜백별로 한 번에 전달"""
+        scheduler = DebounceScheduler()
+        first: list[list[int]] = []
+        second: list[list[int]] = []
+        try:
+            for i in range(100):
+                scheduler.schedule(first.append, i, i, 0.05)
+            scheduler.schedule(second.append, "k", -1, 0.05)
+
+            assert _wait_for(lambda: first and second)
+            assert sorted(first[0]) == list(range(100))
+            assert second == [[-1]]
+        finally:
+            scheduler.stop()
+
+    def test_cancel_all(self) -> None:
+        """cancel_all → 해당 콜백 항목만 취소"""
+        scheduler = DebounceScheduler()
+        cancelled = MagicMock()
+        kept: list[list[str]] = []
+        try:
+            scheduler.schedule(cancelled, "a", "a", 0.05)
+            scheduler.schedule(cancelled, "b", "b", 0.05)
+            scheduler.schedule(kept.append, "c", "c", 0.05)
+
+            assert scheduler.cancel_all(cancelled) == 2
+            assert scheduler.pending_count(cancelled) == 0
+            assert scheduler.pending_count() == 1
+
+            assert _wait_for(lambda: kept)
+            cancelled.assert_not_called()
+        finally:
+            scheduler.stop()
+
+    def test_callback_error_does_not_stop_thread(self) -> None:
+        """콜백 예외 후에도 다음 항목 처리"""
+        scheduler = DebounceScheduler()
+        batches: list[list[str]] = []
+        try:
+            scheduler.schedule(MagicMock(side_effect=RuntimeError("boom")), "a", "a", 0.01)
+            time.sleep(0.05)
+            scheduler.schedule(batches.append, "b", "b", 0.01)
+
+            assert _wait_for(lambda: batches)
+        finally:
+            scheduler.stop()
+
+    def test_restart_after_stop(self) -> None:
+        """stop 후 schedule → 스레드 재시작"""
+        scheduler = DebounceScheduler()
+        batches: list[list[str]] = []
+        scheduler.schedule(batches.append, "a", "dropped", 10)
+        scheduler.stop()
+        assert scheduler.pending_count() == 0
+
+        try:
+            scheduler.schedule(batches.append, "a", "a", 0.01)
+            assert _wait_for(lambda: batches)
+            assert batches == [["a"]]
+        finally:
+            scheduler.stop()
+
+
+class TestHandlerThreadCount:
+    """이벤트 폭주 시 스레드 수 일정"""
+
+    def test_event_storm_uses_single_thread(self) -> None:
+        """2,000개 파일 이벤트 → 추가 스레드 1개, 모든 파일이 1회씩 배치로 전달"""
+        messages: list[dict] = []
+
+        async def callback(message: dict) -> None:
+            messages.append(message)
+
+        def delivered_paths() -> list[str]:
+            paths = []
+            for message in messages:
+                if message["type"] == "file_changes":
+                    paths.extend(change["path"] for change in message["changes"])
+                else:
+                    paths.append(message["path"])
+            return paths
+
+        scheduler = DebounceScheduler()
+        handler = MarkdownEventHandler(folder_id=1, callback=callback, scheduler=scheduler)
+        before = threading.active_count()
+        try:
+            for i in range(2000):
+                event = MagicMock()
+                event.src_path = f"/test/file{i}.md"
+                event.event_type = "modified"
+                event.is_directory = False
+                handler.on_any_event(event)
+
+            assert threading.active_count() <= before + 1
+            assert _wait_for(lambda: len(delivered_paths()) == 2000, timeout=5.0)
+            assert len(set(delivered_paths())) == 2000
+            assert len(messages) < 2000
+        finally:
+            scheduler.stop()
+
+    def test_service_shares_scheduler(self, temp_dir) -> None:
+        """여러 폴더 핸들러가 하나의 스케줄러 공유"""
+        service = FileWatcherService(use_polling=True)
+        (temp_dir / "a").mkdir()
+        (temp_dir / "b").mkdir()
+        try:
+            service.add_folder(1, str(temp_dir / "a"))
+            service.add_folder(2, str(temp_dir / "b"))
+
+            assert service._handlers[1].scheduler is service._handlers[2].scheduler
+        finally:
+            service.stop_all()
@@ -0,0 +1,104 @@
+"""
+ETag / If-None-Match 테스트
+
+Spec: spec/api/folder-tree.md, spec/api/file-content.md
+"""
+
+import os
+import time
+from pathlib import Path
+
+from fastapi import status
+from fastapi.testclient import TestClient
+
+
+def _register(client: TestClient, path: Path) -> int:
+    response = client.post("/api/folders", json={"name": "Etag", "path": str(path)})
+    return response.json()["id"]
+
+
+class TestFileContentETag:
+    """파일 내용 API ETag"""
+
+    def test_etag_returned(self, client: TestClient, temp_dir: Path) -> None:
+        md_file = temp_dir / "doc.md"
+        md_file.write_text("# Doc")
+        _register(client, temp_dir)
+
+        response = client.get(f"/api/files?path={md_file}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_if_none_match_returns_304(self, client: TestClient, temp_dir: Path) -> None:
+        """변경 없는 파일 재조회 → 304, 본문 없음"""
+        md_file = temp_dir / "doc.md"
+        md_file.write_text("# Doc")
+        _register(client, temp_dir)
+        etag = client.get(f"/api/files?path={md_file}").headers["etag"]
+
+        response = client.get(f"/api/files?path={md_file}", headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+    def test_modified_file_returns_new_content(self, client: TestClient, temp_dir: Path) -> None:
+        """파일 수정 후에는 이전 ETag로 200 + 새 내용"""
+        md_file = temp_dir / "doc.md"
+        md_file.write_text("# Doc")
+        _register(client, temp_dir)
+        etag = client.get(f"/api/files?path={md_file}").headers["etag"]
+
+        md_file.write_text("# Doc v2")
+        stat_result = md_file.stat()
+        os.utime(md_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+
+        response = client.get(f"/api/files?path={md_file}", headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["content"] == "# Doc v2"
+        assert response.headers["etag"] != etag
+
+    def test_forbidden_path_not_revealed_by_etag(self, client: TestClient, temp_dir: Path) -> None:
+        """접근 권한 검사가 ETag 비교보다 먼저 수행됨"""
+        outside = temp_dir / "outside.md"
+        outside.write_text("secret")
+
+        response = client.get(f"/api/files?path={outside}", headers={"If-None-Match": "*"})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestFolderTreeETag:
+    """폴더 트리 API ETag"""
+
+    def test_if_none_match_returns_304(self, client: TestClient, temp_dir: Path) -> None:
+        (temp_dir / "a.md").write_text("# A")
+        folder_id = _register(client, temp_dir)
+        etag = client.get(f"/api/folders/{folder_id}/tree").headers["etag"]
+
+        response = client.get(f"/api/folders/{folder_id}/tree", headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_etag_changes_after_watcher_event(self, client: TestClient, temp_dir: Path) -> None:
+        """파일 생성 이벤트 후 ETag 변경 → 새 트리 반환"""
+        folder_id = _register(client, temp_dir)
+        etag = client.get(f"/api/folders/{folder_id}/tree").headers["etag"]
+
+        (temp_dir / "new.md").write_text("# New")
+
+        response = None
+        deadline = time.time() + 3.0
+        while time.time() < deadline:
+            response = client.get(
+                f"/api/folders/{folder_id}/tree", headers={"If-None-Match": etag}
+            )
+            if response.status_code == status.HTTP_200_OK:
+                break
+            time.sleep(0.1)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [c["name"] for c in response.json()["tree"]["children"]] == ["new.md"]
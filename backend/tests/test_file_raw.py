@@ -0,0 +1,103 @@
+"""
+파일 원본 스트리밍 API 테스트
+
+Spec: spec/api/file-content.md
+GET /api/files/raw - Content-Length / Range / ETag
+"""
+
+from pathlib import Path
+
+from fastapi import status
+from fastapi.testclient import TestClient
+
+
+CONTENT = "# 제목\n" + "본문 줄\n" * 1000
+
+
+def _register(client: TestClient, path: Path) -> None:
+    client.post("/api/folders", json={"name": "Raw", "path": str(path)})
+
+
+class TestFileRaw:
+    """GET /api/files/raw"""
+
+    def test_full_content(self, client: TestClient, temp_dir: Path) -> None:
+        """전체 요청 → 200, 원본 바이트와 Content-Length"""
+        md_file = temp_dir / "big.md"
+        md_file.write_text(CONTENT, encoding="utf-8")
+        _register(client, temp_dir)
+
+        response = client.get("/api/files/raw", params={"path": str(md_file)})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == CONTENT.encode("utf-8")
+        assert int(response.headers["content-length"]) == md_file.stat().st_size
+        assert response.headers["content-type"].startswith("text/markdown")
+        assert response.headers["accept-ranges"] == "bytes"
+
+    def test_etag_matches_json_endpoint(self, client: TestClient, temp_dir: Path) -> None:
+        """JSON 조회와 동일한 ETag 사용, If-None-Match 일치 시 304"""
+        md_file = temp_dir / "doc.md"
+        md_file.write_text("# Doc")
+        _register(client, temp_dir)
+
+        etag = client.get("/api/files", params={"path": str(md_file)}).headers["etag"]
+        raw = client.get("/api/files/raw", params={"path": str(md_file)})
+        assert raw.headers["etag"] == etag
+
+        response = client.get(
+            "/api/files/raw", params={"path": str(md_file)}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+
+    def test_range_request(self, client: TestClient, temp_dir: Path) -> None:
+        """Range 요청 → 206, 요청 범위만 반환"""
+        md_file = temp_dir / "big.md"
+        md_file.write_text(CONTENT, encoding="utf-8")
+        _register(client, temp_dir)
+        data = CONTENT.encode("utf-8")
+
+        response = client.get(
+            "/api/files/raw", params={"path": str(md_file)}, headers={"Range": "bytes=100-199"}
+        )
+
+        assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+        assert response.content == data[100:200]
+        assert response.headers["content-range"] == f"bytes 100-199/{len(data)}"
+
+    def test_unsatisfiable_range(self, client: TestClient, temp_dir: Path) -> None:
+        """파일 크기를 넘는 Range → 416"""
+        md_file = temp_dir / "doc.md"
+        md_file.write_text("# Doc")
+        _register(client, temp_dir)
+
+        response = client.get(
+            "/api/files/raw", params={"path": str(md_file)}, headers={"Range": "bytes=1000-2000"}
+        )
+
+        assert response.status_code == 416
+
+    def test_forbidden_path(self, client: TestClient, temp_dir: Path) -> None:
+        """등록되지 않은 경로 → 403"""
+        registered = temp_dir / "docs"
+        registered.mkdir()
+        outside = temp_dir / "secret.md"
+        outside.write_text("secret")
+        _register(client, registered)
+
+        response = client.get("/api/files/raw", params={"path": str(outside)})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.json()["code"] == "FORBIDDEN"
+
+    def test_non_markdown_rejected(self, client: TestClient, temp_dir: Path) -> None:
+        """마크다운이 아닌 파일 → 400"""
+        txt_file = temp_dir / "note.txt"
+        txt_file.write_text("text")
+        _register(client, temp_dir)
+
+        response = client.get("/api/files/raw", params={"path": str(txt_file)})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["error"] == "only markdown files allowed"
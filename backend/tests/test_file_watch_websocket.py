@@ -6,6 +6,7 @@ Integration Tests + Edge Case Tests
 """
 
 import asyncio
+import json
 import os
 import tempfile
 import time
@@ -59,6 +60,12 @@ class TestWebSocketConnect:
             assert websocket is not None
             # 이벤트 없이 연결만 유지됨
 
+    def test_websocket_connect_with_folder_ids(self, client: TestClient) -> None:
+        """?folder_ids= 로 연결하면 해당 폴더를 구독한 상태로 시작"""
+        with client.websocket_connect("/ws/watch?folder_ids=2,1") as websocket:
+            websocket.send_text(json.dumps({"type": "subscribe", "folder_ids": []}))
+            assert websocket.receive_json() == {"type": "subscriptions", "folder_ids": [1, 2]}
+
 
 class TestWebSocketEvents:
     """WebSocket 이벤트 수신 테스트 (Audit Fix: Issue #5 - 예외 처리 범위 좁히기)"""
@@ -261,6 +268,28 @@ class TestWebSocketMultiClient:
                 pytest.skip("Event not received within timeout")
 
 
+class TestWebSocketSubscription:
+    """폴더 구독 메시지 테스트"""
+
+    def test_subscribe_and_unsubscribe(self, client: TestClient) -> None:
+        """subscribe/unsubscribe → 현재 구독 목록 응답"""
+        with client.websocket_connect("/ws/watch") as websocket:
+            websocket.send_json({"type": "subscribe", "folder_ids": [3, 1]})
+            assert websocket.receive_json() == {"type": "subscriptions", "folder_ids": [1, 3]}
+
+            websocket.send_json({"type": "unsubscribe", "folder_ids": [3]})
+            assert websocket.receive_json() == {"type": "subscriptions", "folder_ids": [1]}
+
+    def test_invalid_subscription(self, client: TestClient) -> None:
+        """folder_ids가 정수 목록이 아니면 에러 응답, keep-alive 텍스트는 무시"""
+        with client.websocket_connect("/ws/watch") as websocket:
+            websocket.send_text("ping")
+            websocket.send_json({"type": "subscribe", "folder_ids": "1"})
+            data = websocket.receive_json()
+            assert data["type"] == "error"
+            assert data["code"] == "INVALID_SUBSCRIPTION"
+
+
 class TestWebSocketEdgeCases:
     """WebSocket 엣지 케이스 테스트"""
 
@@ -314,3 +343,25 @@ class TestWebSocketEdgeCases:
                 assert len(events) >= 1
             except Exception:
                 pytest.skip("Event not received within timeout")
+
+    @pytest.mark.asyncio
+    async def test_writer_closed_socket_logged_without_traceback(self) -> None:
+        """송신 task가 닫은 소켓의 수신 오류는 traceback 없이 debug 로그"""
+        from starlette.websockets import WebSocketState
+
+        from app.api import websocket as websocket_api
+        from app.services.connection_manager import ConnectionManager
+
+        websocket = AsyncMock()
+        websocket.application_state = WebSocketState.DISCONNECTED
+        websocket.receive_text.side_effect = RuntimeError('WebSocket is not connected. Need to call "accept" first.')
+
+        manager = ConnectionManager()
+        with patch.object(websocket_api, "manager", manager), \
+                patch.object(websocket_api, "file_watcher", MagicMock()), \
+                patch.object(websocket_api, "logger") as logger:
+            await websocket_api.websocket_endpoint(websocket)
+
+        logger.exception.assert_not_called()
+        logger.debug.assert_called_once()
+        assert manager.connection_count == 0
@@ -6,16 +6,18 @@ TDD Red 단계 - 실패하는 테스트 먼저 작성
 """
 
 import asyncio
+import json
 import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from watchdog.events import FileModifiedEvent, FileMovedEvent
 from app.services.file_watcher import (
     is_markdown_file, is_hidden_file, is_ignored_path,
-    MarkdownEventHandler, FileWatcherService
+    MarkdownEventHandler, FileWatcherService, FolderEventRouter
 )
-from app.services.connection_manager import ConnectionManager
+from app.services.connection_manager import ClientChannel, ConnectionManager
 
 
 class TestIsMarkdownFile:
@@ -142,6 +144,32 @@ class TestDebounce:
         # 이벤트는 2회 발생해야 함
         assert callback.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_simultaneous_events_batched(self) -> None:
+        """같은 시점 여러 파일 이벤트 → file_changes 메시지 1회"""
+
+        callback = AsyncMock()
+        handler = MarkdownEventHandler(folder_id=1, callback=callback)
+
+        for name, event_type in [("a.md", "created"), ("b.md", "modified"), ("c.md", "deleted")]:
+            mock_event = MagicMock()
+            mock_event.src_path = f"/test/{name}"
+            mock_event.event_type = event_type
+            mock_event.is_directory = False
+            handler.on_any_event(mock_event)
+
+        await asyncio.sleep(0.5)
+
+        assert callback.call_count == 1
+        message = callback.call_args[0][0]
+        assert message["type"] == "file_changes"
+        assert message["folder_id"] == 1
+        assert message["changes"] == [
+            {"event": "created", "path": "/test/a.md"},
+            {"event": "modified", "path": "/test/b.md"},
+            {"event": "deleted", "path": "/test/c.md"},
+        ]
+
 
 class TestConnectionManager:
     """ConnectionManager 테스트"""
@@ -183,9 +211,13 @@ class TestConnectionManager:
         
         message = {"type": "file_change", "event": "created", "path": "/test.md", "folder_id": 1}
         await manager.broadcast(message)
+        await asyncio.sleep(0.05)  # 클라이언트별 writer task 전송 대기
         
-        mock_ws1.send_json.assert_called_once_with(message)
-        mock_ws2.send_json.assert_called_once_with(message)
+        # 한 번 직렬화한 동일한 텍스트 프레임 전송
+        mock_ws1.send_text.assert_called_once()
+        payload = mock_ws1.send_text.call_args[0][0]
+        assert json.loads(payload) == {**message, "seq": manager.last_seq}
+        mock_ws2.send_text.assert_called_once_with(payload)
 
     @pytest.mark.asyncio
     async def test_broadcast_removes_failed_connections(self) -> None:
@@ -194,18 +226,345 @@ class TestConnectionManager:
         manager = ConnectionManager()
         mock_ws1 = AsyncMock()
         mock_ws2 = AsyncMock()
-        mock_ws2.send_json.side_effect = Exception("Connection closed")
+        mock_ws2.send_text.side_effect = Exception("Connection closed")
         
         await manager.connect(mock_ws1)
         await manager.connect(mock_ws2)
         
         message = {"type": "file_change", "event": "created", "path": "/test.md", "folder_id": 1}
         await manager.broadcast(message)
+        await asyncio.sleep(0.05)  # 클라이언트별 writer task 전송 대기
         
         # 실패한 연결은 제거됨
         assert mock_ws1 in manager.active_connections
         assert mock_ws2 not in manager.active_connections
 
+    @pytest.mark.asyncio
+    async def test_broadcast_is_concurrent(self) -> None:
+        """느린 클라이언트가 다른 클라이언트 전송을 지연시키지 않음"""
+        
+        manager = ConnectionManager(send_timeout=5.0)
+        fast = AsyncMock()
+        slow = AsyncMock()
+        fast_done = asyncio.Event()
+        
+        async def slow_send(payload: str) -> None:
+            await asyncio.sleep(0.3)
+        
+        async def fast_send(payload: str) -> None:
+            fast_done.set()
+        
+        slow.send_text.side_effect = slow_send
+        fast.send_text.side_effect = fast_send
+        await manager.connect(slow)
+        await manager.connect(fast)
+        
+        start = time.monotonic()
+        task = asyncio.create_task(manager.broadcast({"type": "file_change"}))
+        await asyncio.wait_for(fast_done.wait(), timeout=0.2)
+        await task
+        
+        # 순차 전송이면 0.3 + α, 동시 전송이면 가장 느린 클라이언트 시간
+        assert time.monotonic() - start < 0.5
+        assert manager.connection_count == 2
+
+    @pytest.mark.asyncio
+    async def test_broadcast_evicts_stalled_client(self) -> None:
+        """전송 제한 시간 초과 클라이언트는 연결 해제"""
+        
+        manager = ConnectionManager(send_timeout=0.1)
+        healthy = AsyncMock()
+        stalled = AsyncMock()
+        
+        async def never_send(payload: str) -> None:
+            await asyncio.sleep(10)
+        
+        stalled.send_text.side_effect = never_send
+        await manager.connect(healthy)
+        await manager.connect(stalled)
+        
+        await asyncio.wait_for(manager.broadcast({"type": "file_change"}), timeout=1.0)
+        await asyncio.sleep(0.3)  # 전송 제한 시간 + 연결 해제 대기
+        
+        assert healthy in manager.active_connections
+        assert stalled not in manager.active_connections
+        stalled.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_encodes_once(self) -> None:
+        """클라이언트 수와 무관하게 메시지는 한 번만 직렬화"""
+        
+        manager = ConnectionManager()
+        for _ in range(5):
+            await manager.connect(AsyncMock())
+        
+        with patch("app.services.connection_manager.dumps", wraps=json.dumps) as dumps:
+            await manager.broadcast({"type": "file_change", "path": "/문서.md"})
+        
+        assert dumps.call_count == 1
+
+
+class TestClientChannel:
+    """클라이언트별 송신 큐 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_overflow_coalesces_same_path(self) -> None:
+        """큐가 가득 찬 상태에서 같은 경로 이벤트 → 대기 항목을 빼고 최신 이벤트를 끝에 추가 (seq 순서 유지)"""
+        
+        channel = ClientChannel(AsyncMock(), max_size=2)
+        channel.offer("a-created", key=(1, "/a.md"))
+        channel.offer("b-created", key=(1, "/b.md"))
+        channel.offer("a-deleted", key=(1, "/a.md"))
+        
+        assert len(channel) == 2
+        assert await channel.next() == "b-created"
+        assert await channel.next() == "a-deleted"
+
+        # 교체된 항목도 이후 같은 경로 이벤트와 다시 합쳐짐
+        channel.offer("c-created", key=(1, "/c.md"))
+        channel.offer("d", key=(1, "/d.md"))
+        channel.offer("c-deleted", key=(1, "/c.md"))
+        channel.offer("c-created-again", key=(1, "/c.md"))
+        assert len(channel) == 2
+        assert [await channel.next(), await channel.next()] == ["d", "c-created-again"]
+
+    @pytest.mark.asyncio
+    async def test_overflow_falls_back_to_resync(self) -> None:
+        """합칠 수 없는 초과 메시지 → 대기 메시지를 버리고 resync 1건으로 대체"""
+        
+        channel = ClientChannel(AsyncMock(), max_size=2)
+        channel.offer("a", key=(1, "/a.md"))
+        channel.offer("b", key=(1, "/b.md"))
+        channel.offer("c", key=(1, "/c.md"))
+        
+        assert len(channel) == 1
+        assert json.loads(await channel.next()) == {"type": "resync"}
+        assert channel.dropped == 3
+        
+        # resync 이후 메시지는 정상적으로 쌓임
+        channel.offer("d", key=(1, "/d.md"))
+        assert await channel.next() == "d"
+
+    @pytest.mark.asyncio
+    async def test_broadcast_does_not_wait_for_stalled_client(self) -> None:
+        """멈춘 클라이언트가 있어도 broadcast는 즉시 반환, 큐 크기는 제한됨"""
+        
+        manager = ConnectionManager(send_timeout=None, queue_size=4)
+        stalled = AsyncMock()
+        healthy = AsyncMock()
+        
+        async def never_send(payload: str) -> None:
+            await asyncio.sleep(10)
+        
+        stalled.send_text.side_effect = never_send
+        await manager.connect(stalled)
+        await manager.connect(healthy)
+        
+        for i in range(100):
+            await asyncio.wait_for(
+                manager.broadcast({"type": "file_change", "folder_id": 1, "path": f"/{i}.md"}),
+                timeout=0.1,
+            )
+        await asyncio.sleep(0.05)
+        
+        assert len(manager._connections[stalled]) <= 4
+        assert healthy.send_text.call_count >= 4
+        await manager.disconnect(stalled)
+        await manager.disconnect(healthy)
+
+
+class TestFolderSubscription:
+    """폴더 구독 기반 broadcast 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_only_to_subscribers(self) -> None:
+        """구독한 폴더 이벤트만 전달, 구독 전 클라이언트는 전체 수신"""
+        
+        manager = ConnectionManager()
+        sub1 = AsyncMock()
+        sub2 = AsyncMock()
+        legacy = AsyncMock()
+        for websocket in (sub1, sub2, legacy):
+            await manager.connect(websocket)
+        
+        assert await manager.subscribe(sub1, [1]) == {1}
+        assert await manager.subscribe(sub2, [2, 3]) == {2, 3}
+        
+        await manager.broadcast({"type": "file_change", "folder_id": 1, "path": "/a.md"})
+        await asyncio.sleep(0.05)
+        
+        assert sub1.send_text.call_count == 1
+        sub2.send_text.assert_not_called()
+        assert legacy.send_text.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_stops_events(self) -> None:
+        """구독 해제 후 이벤트 미수신, 색인에서도 제거"""
+        
+        manager = ConnectionManager()
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+        await manager.subscribe(websocket, [1, 2])
+        
+        assert await manager.unsubscribe(websocket, [1]) == {2}
+        assert 1 not in manager._subscribers
+        
+        await manager.broadcast({"type": "file_change", "folder_id": 1, "path": "/a.md"})
+        await asyncio.sleep(0.05)
+        websocket.send_text.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_empty_subscription_receives_only_global_messages(self) -> None:
+        """빈 구독 → 폴더 이벤트는 미수신, folder_id 없는 메시지(resync 등)는 수신"""
+        
+        manager = ConnectionManager()
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+        await manager.subscribe(websocket, [])
+        
+        await manager.broadcast({"type": "file_change", "folder_id": 1, "path": "/a.md"})
+        await manager.broadcast({"type": "resync"})
+        await asyncio.sleep(0.05)
+        
+        websocket.send_text.assert_called_once()
+        assert json.loads(websocket.send_text.call_args[0][0])["type"] == "resync"
+
+    @pytest.mark.asyncio
+    async def test_active_folder_ids(self) -> None:
+        """구독자가 있는 폴더 (구독 전 클라이언트가 있으면 전체)"""
+        
+        manager = ConnectionManager()
+        assert manager.active_folder_ids == set()
+        sub, legacy = AsyncMock(), AsyncMock()
+        await manager.connect(sub)
+        await manager.connect(legacy)
+        await manager.subscribe(sub, [1, 2])
+        assert manager.active_folder_ids is None
+        
+        await manager.disconnect(legacy)
+        assert manager.active_folder_ids == {1, 2}
+        await manager.unsubscribe(sub, [1])
+        assert manager.active_folder_ids == {2}
+
+    @pytest.mark.asyncio
+    async def test_disconnect_clears_subscriptions(self) -> None:
+        """연결 해제 시 구독 색인 정리"""
+        
+        manager = ConnectionManager()
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+        await manager.subscribe(websocket, [1, 2])
+        await manager.disconnect(websocket)
+        
+        assert manager._subscribers == {}
+        assert await manager.subscribe(websocket, [1]) == set()
+        assert manager._subscribers == {}
+
+
+class TestEventReplay:
+    """이벤트 seq 및 재연결 재전송 테스트"""
+
+    @staticmethod
+    def _sent(websocket: AsyncMock) -> list[dict]:
+        return [json.loads(call.args[0]) for call in websocket.send_text.call_args_list]
+
+    @pytest.mark.asyncio
+    async def test_events_have_increasing_seq(self) -> None:
+        """broadcast 메시지마다 단조 증가 seq"""
+        
+        manager = ConnectionManager()
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+        
+        for i in range(3):
+            await manager.broadcast({"type": "file_change", "folder_id": 1, "path": f"/{i}.md"})
+        await asyncio.sleep(0.05)
+        
+        seqs = [message["seq"] for message in self._sent(websocket)]
+        assert seqs == sorted(seqs) and len(set(seqs)) == 3
+        assert seqs[-1] == manager.last_seq
+
+    @pytest.mark.asyncio
+    async def test_reconnect_replays_only_gap(self) -> None:
+        """since 이후 이벤트만 재전송 (연결이 없던 동안의 이벤트 포함)"""
+        
+        manager = ConnectionManager()
+        await manager.broadcast({"type": "file_change", "folder_id": 1, "path": "/a.md"})
+        since = manager.last_seq
+        await manager.broadcast({"type": "file_change", "folder_id": 1, "path": "/b.md"})
+        await manager.broadcast({"type": "file_change", "folder_id": 2, "path": "/c.md"})
+        
+        websocket = AsyncMock()
+        await manager.connect(websocket, since=since)
+        await manager.broadcast({"type": "file_change", "folder_id": 1, "path": "/d.md"})
+        await asyncio.sleep(0.05)
+        
+        assert [message["path"] for message in self._sent(websocket)] == ["/b.md", "/c.md", "/d.md"]
+
+    @pytest.mark.asyncio
+    async def test_up_to_date_client_gets_nothing(self) -> None:
+        """since가 최신 seq면 재전송 없음"""
+        
+        manager = ConnectionManager()
+        await manager.broadcast({"type": "file_change", "folder_id": 1, "path": "/a.md"})
+        
+        websocket = AsyncMock()
+        await manager.connect(websocket, since=manager.last_seq)
+        await asyncio.sleep(0.05)
+        
+        websocket.send_text.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_evicted_gap_requires_resync(self) -> None:
+        """놓친 구간이 버퍼에서 밀려나면 resync_required"""
+        
+        manager = ConnectionManager(history_size=2)
+        await manager.broadcast({"type": "file_change", "folder_id": 1, "path": "/a.md"})
+        since = manager.last_seq
+        for path in ("/b.md", "/c.md", "/d.md"):
+            await manager.broadcast({"type": "file_change", "folder_id": 1, "path": path})
+        
+        websocket = AsyncMock()
+        await manager.connect(websocket, since=since)
+        await asyncio.sleep(0.05)
+        
+        assert self._sent(websocket) == [{"type": "resync_required", "seq": manager.last_seq}]
+
+    @pytest.mark.asyncio
+    async def test_evicted_gap_checked_per_subscription(self) -> None:
+        """다른 폴더 이벤트만 밀려났으면 구독 폴더 이벤트만 재전송, 구독 폴더 이벤트가 밀려났으면 resync_required"""
+
+        manager = ConnectionManager(history_size=2)
+        await manager.broadcast({"type": "file_change", "folder_id": 1, "path": "/a.md"})
+        since = manager.last_seq
+        for path in ("/b.md", "/c.md", "/d.md"):
+            await manager.broadcast({"type": "file_change", "folder_id": 2, "path": path})
+        await manager.broadcast({"type": "file_change", "folder_id": 1, "path": "/e.md"})
+
+        subscribed = AsyncMock()
+        await manager.connect(subscribed, since=since, folder_ids=[1])
+        other = AsyncMock()
+        await manager.connect(other, since=since, folder_ids=[2])
+        await manager.broadcast({"type": "file_change", "folder_id": 2, "path": "/f.md"})
+        await asyncio.sleep(0.05)
+
+        assert [message["path"] for message in self._sent(subscribed)] == ["/e.md"]
+        assert [message["type"] for message in self._sent(other)] == ["resync_required", "file_change"]
+        assert manager.active_folder_ids == {1, 2}
+
+    @pytest.mark.asyncio
+    async def test_seq_from_previous_server_requires_resync(self) -> None:
+        """서버 재시작 전 seq(현재 프로세스 시작 이전) 또는 미래 seq → resync_required"""
+        
+        manager = ConnectionManager()
+        await manager.broadcast({"type": "file_change", "folder_id": 1, "path": "/a.md"})
+        
+        for since in (manager.last_seq - 10, manager.last_seq + 1):
+            websocket = AsyncMock()
+            await manager.connect(websocket, since=since)
+            await asyncio.sleep(0.05)
+            assert [message["type"] for message in self._sent(websocket)] == ["resync_required"]
+
 
 class TestFileWatcherService:
     """FileWatcherService 테스트 (Audit Fix: Issue #4)"""
@@ -248,6 +607,21 @@ class TestFileWatcherService:
         assert result is False
         assert service.watching_count == 0
 
+    def test_notify_changes_uses_handler_debounce(self, temp_dir: Path) -> None:
+        """감시 밖 변경은 해당 폴더 핸들러의 debounce로 전달, 없는 폴더는 무시"""
+
+        service = FileWatcherService(use_polling=True)
+        service.add_folder(folder_id=1, path=str(temp_dir))
+        handler = service._handlers[1]
+
+        with patch.object(handler, "notify_change") as notify_change:
+            service.notify_changes(1, [(str(temp_dir / "a.md"), "created")])
+            service.notify_changes(2, [(str(temp_dir / "b.md"), "created")])
+
+        notify_change.assert_called_once_with(str(temp_dir / "a.md"), "created")
+
+        service.stop_all()
+
     def test_add_folder_file_path(self, temp_dir: Path) -> None:
         """파일 경로 추가 시 False 반환"""
         
@@ -316,13 +690,130 @@ class TestMarkdownEventHandlerTimerCleanup:
         handler._schedule_callback("/test/file2.md", "modified")
         handler._schedule_callback("/test/file3.md", "modified")
         
-        assert len(handler._debounce_timers) == 3
+        assert handler.pending_count == 3
         
         # 타이머 취소
         handler.cancel_all_timers()
         
-        assert len(handler._debounce_timers) == 0
+        assert handler.pending_count == 0
         
         # 충분히 대기해도 콜백이 호출되지 않음
         await asyncio.sleep(0.5)
         assert callback.call_count == 0
+
+
+class TestFolderEventRouter:
+    """공유 Observer 이벤트 라우팅 테스트"""
+
+    def _handler(self) -> MagicMock:
+        return MagicMock(spec=MarkdownEventHandler)
+
+    def test_routes_to_containing_folder(self) -> None:
+        """이벤트 경로를 포함하는 폴더 핸들러에만 전달"""
+
+        router = FolderEventRouter()
+        docs, other = self._handler(), self._handler()
+        router.add("/p/docs", docs)
+        router.add("/p/other", other)
+
+        event = FileModifiedEvent("/p/docs/a/b.md")
+        router.dispatch(event)
+
+        docs.dispatch.assert_called_once_with(event)
+        other.dispatch.assert_not_called()
+
+    def test_prefix_is_not_parent(self) -> None:
+        """/p/docs 등록 시 /p/docs2 이벤트는 전달하지 않음"""
+
+        router = FolderEventRouter()
+        docs = self._handler()
+        router.add("/p/docs", docs)
+
+        router.dispatch(FileModifiedEvent("/p/docs2/a.md"))
+
+        docs.dispatch.assert_not_called()
+
+    def test_nested_folders(self) -> None:
+        """중첩 폴더: 하위 루트는 감시 대상에서 제외, 이벤트는 양쪽 모두 전달"""
+
+        router = FolderEventRouter()
+        outer, inner = self._handler(), self._handler()
+        router.add("/p", outer)
+        router.add("/p/docs", inner)
+
+        assert router.watch_roots() == {"/p"}
+
+        event = FileModifiedEvent("/p/docs/a.md")
+        router.dispatch(event)
+        outer.dispatch.assert_called_once_with(event)
+        inner.dispatch.assert_called_once_with(event)
+
+        router.remove("/p", outer)
+        assert router.watch_roots() == {"/p/docs"}
+
+    def test_move_across_folders(self) -> None:
+        """폴더 경계를 넘는 이동 → 원본 폴더는 deleted, 대상 폴더는 created"""
+
+        router = FolderEventRouter()
+        src, dest = self._handler(), self._handler()
+        router.add("/p/a", src)
+        router.add("/p/b", dest)
+
+        router.dispatch(FileMovedEvent("/p/a/x.md", "/p/b/x.md"))
+
+        src_event = src.dispatch.call_args[0][0]
+        dest_event = dest.dispatch.call_args[0][0]
+        assert (src_event.event_type, src_event.src_path) == ("deleted", "/p/a/x.md")
+        assert (dest_event.event_type, dest_event.src_path) == ("created", "/p/b/x.md")
+
+    def test_service_uses_single_observer(self, tmp_path: Path) -> None:
+        """여러 폴더 등록 시 Observer 1개 공유, 모두 제거 시 Observer 종료"""
+
+        service = FileWatcherService(use_polling=True)
+        for name in ("a", "b", "c"):
+            (tmp_path / name).mkdir()
+        try:
+            for folder_id, name in enumerate(("a", "b", "c"), start=1):
+                assert service.add_folder(folder_id=folder_id, path=str(tmp_path / name)) is True
+
+            observer = service._observer
+            assert observer is not None and observer.is_alive()
+            assert len(service._watches) == 3
+
+            service.remove_folder(1)
+            assert service._observer is observer
+            assert len(service._watches) == 2
+        finally:
+            service.stop_all()
+
+        assert service._observer is None
+        assert not observer.is_alive()
+
+    @pytest.mark.asyncio
+    async def test_service_delivers_events_per_folder(self, tmp_path: Path) -> None:
+        """공유 Observer에서도 폴더별 folder_id로 이벤트 전달"""
+
+        messages: list[dict] = []
+
+        async def broadcast(message: dict) -> None:
+            messages.append(message)
+
+        service = FileWatcherService(use_polling=True)
+        service.set_broadcast_callback(broadcast)
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        try:
+            service.add_folder(folder_id=1, path=str(tmp_path / "a"))
+            service.add_folder(folder_id=2, path=str(tmp_path / "b"))
+
+            (tmp_path / "b" / "new.md").write_text("# New")
+
+            for _ in range(50):
+                if messages:
+                    break
+                await asyncio.sleep(0.1)
+        finally:
+            service.stop_all()
+
+        assert messages
+        assert all(message["folder_id"] == 2 for message in messages)
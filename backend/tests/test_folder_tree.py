@@ -164,7 +164,9 @@ class TestTreeBuilder:
         (temp_dir / "zebra.md").write_text("# Zebra")
         (temp_dir / "alpha.md").write_text("# Alpha")
         (temp_dir / "beta").mkdir()
+        (temp_dir / "beta" / "b.md").write_text("# B")
         (temp_dir / "gamma").mkdir()
+        (temp_dir / "gamma" / "g.md").write_text("# G")
         register_response = client.post(
             "/api/folders",
             json={"name": "Sorted", "path": str(temp_dir)},
@@ -204,6 +206,31 @@ class TestTreeBuilder:
         assert len(children) == 1
         assert children[0]["name"] == "readme.md"
 
+    def test_build_tree_md_only_prunes_folders_without_markdown(
+        self, client: TestClient, temp_dir: Path
+    ) -> None:
+        """md_only=true 시 .md가 없는 폴더는 제외, md_only=false 시 유지"""
+        # Given
+        (temp_dir / "src" / "utils").mkdir(parents=True)
+        (temp_dir / "src" / "utils" / "main.py").write_text("print()")
+        (temp_dir / "assets").mkdir()
+        (temp_dir / "docs" / "empty").mkdir(parents=True)
+        (temp_dir / "docs" / "guide.md").write_text("# Guide")
+        register_response = client.post(
+            "/api/folders",
+            json={"name": "Pruned", "path": str(temp_dir)},
+        )
+        folder_id = register_response.json()["id"]
+
+        # When
+        md_tree = client.get(f"/api/folders/{folder_id}/tree").json()["tree"]
+        all_tree = client.get(f"/api/folders/{folder_id}/tree?md_only=false").json()["tree"]
+
+        # Then
+        assert [c["name"] for c in md_tree["children"]] == ["docs"]
+        assert [c["name"] for c in md_tree["children"][0]["children"]] == ["guide.md"]
+        assert [c["name"] for c in all_tree["children"]] == ["assets", "docs", "src"]
+
 
 class TestTreeEdgeCases:
     """Edge Case Tests"""
@@ -301,3 +328,202 @@ class TestTreeEdgeCases:
         names = [c["name"] for c in children]
         assert "real.md" in names
         assert "link.md" not in names  # 심볼릭 링크 제외
+
+
+class TestScanDirectory:
+    """Unit Tests - os.scandir 기반 탐색"""
+
+    def test_scan_directory_does_not_stat_entries(self, tmp_path: Path) -> None:
+        """DirEntry 타입 캐시를 사용하여 항목별 stat 호출 없음"""
+        from unittest.mock import patch
+        from app.utils.tree_builder import scan_directory
+
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "b.md").write_text("# B")
+        (tmp_path / "A.md").write_text("# A")
+        (tmp_path / "c.txt").write_text("c")
+
+        with patch("os.stat", side_effect=AssertionError("stat called")), \
+             patch("os.lstat", side_effect=AssertionError("lstat called")):
+            dirs, files = scan_directory(str(tmp_path))
+
+        assert dirs == ["docs"]
+        assert files == ["A.md", "b.md"]
+
+    def test_build_tree_symlink_dir_ignored(self, tmp_path: Path) -> None:
+        """폴더를 가리키는 심볼릭 링크도 제외"""
+        from app.utils.tree_builder import build_tree
+
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real" / "doc.md").write_text("# Doc")
+        try:
+            (tmp_path / "link").symlink_to(tmp_path / "real", target_is_directory=True)
+        except OSError:
+            pytest.skip("Symlink creation not supported")
+
+        tree = build_tree(str(tmp_path))
+
+        assert [c.name for c in tree.children] == ["real"]
+
+
+class TestParallelTreeBuilder:
+    """Unit Tests - 병렬 탐색"""
+
+    def test_parallel_build_matches_sequential(self, tmp_path: Path) -> None:
+        """병렬 탐색도 정렬(폴더 먼저, 대소문자 무시)과 무시 규칙 유지"""
+        from app.utils.tree_builder import build_tree
+
+        for top in ("Beta", "alpha", "node_modules", ".cache"):
+            for sub in ("x", "Y", "z"):
+                (tmp_path / top / sub).mkdir(parents=True)
+                (tmp_path / top / sub / "doc.md").write_text("# Doc")
+            (tmp_path / top / "README.md").write_text("# Readme")
+        (tmp_path / "Notes.md").write_text("# Notes")
+
+        sequential = build_tree(str(tmp_path))
+        parallel = build_tree(str(tmp_path), max_workers=4)
+
+        assert parallel == sequential
+        assert [c.name for c in parallel.children] == ["alpha", "Beta", "Notes.md"]
+
+
+class TestDepthBoundaryProbe:
+    """Unit Tests - depth 경계 폴더의 마크다운 존재 확인"""
+
+    def test_probe_finds_nested_markdown(self, tmp_path: Path) -> None:
+        """경계 아래 깊은 곳의 .md 파일 → has_children=True, 마크다운 없는 폴더는 제외"""
+        from app.utils.tree_builder import build_tree
+
+        (tmp_path / "docs" / "a" / "b").mkdir(parents=True)
+        (tmp_path / "docs" / "a" / "b" / "deep.md").write_text("# Deep")
+        (tmp_path / "src" / "lib").mkdir(parents=True)
+        (tmp_path / "src" / "lib" / "main.py").write_text("x")
+
+        tree = build_tree(str(tmp_path), depth=1)
+
+        assert [(c.name, c.has_children) for c in tree.children] == [("docs", True)]
+
+    def test_probe_bounded_for_large_tree(self, tmp_path: Path) -> None:
+        """마크다운 없는 큰 트리는 MARKDOWN_PROBE_LIMIT개 폴더까지만 탐색, 판단 못하면 has_children 생략"""
+        from unittest.mock import patch
+
+        from app.utils import tree_builder
+
+        for i in range(10):
+            for j in range(10):
+                (tmp_path / "src" / f"pkg{i}" / f"mod{j}").mkdir(parents=True)
+
+        calls = []
+        scan_directory = tree_builder.scan_directory
+
+        def counting(path: str, md_only: bool = True):
+            calls.append(path)
+            return scan_directory(path, md_only)
+
+        with patch.object(tree_builder, "scan_directory", counting):
+            tree = tree_builder.build_tree(str(tmp_path), depth=1)
+
+        assert [(c.name, c.has_children) for c in tree.children] == [("src", None)]
+        assert tree.children[0].children is None
+        assert len(calls) <= 2 + tree_builder.MARKDOWN_PROBE_LIMIT
+
+    def test_probe_reports_empty_small_tree(self, tmp_path: Path) -> None:
+        """한도 안에서 마크다운이 없다고 확인된 폴더는 제외"""
+        from app.utils.tree_builder import build_tree
+
+        (tmp_path / "src" / "lib").mkdir(parents=True)
+        (tmp_path / "src" / "lib" / "main.py").write_text("x")
+        (tmp_path / "README.md").write_text("# Readme")
+
+        tree = build_tree(str(tmp_path), depth=1)
+
+        assert [c.name for c in tree.children] == ["README.md"]
+
+
+class TestLazyTreeAPI:
+    """Integration Tests - depth/subpath 단계별 조회"""
+
+    @pytest.fixture
+    def folder_id(self, client: TestClient, temp_dir: Path) -> int:
+        (temp_dir / "api" / "v2").mkdir(parents=True)
+        (temp_dir / "api" / "v2" / "users.md").write_text("# Users")
+        (temp_dir / "api" / "auth.md").write_text("# Auth")
+        (temp_dir / "empty").mkdir()
+        (temp_dir / "README.md").write_text("# README")
+        response = client.post(
+            "/api/folders",
+            json={"name": "Lazy", "path": str(temp_dir)},
+        )
+        return response.json()["id"]
+
+    def test_depth_one_marks_has_children(self, client: TestClient, folder_id: int) -> None:
+        """depth=1 → 직계 자식만, 폴더는 has_children 표시"""
+        response = client.get(f"/api/folders/{folder_id}/tree?depth=1")
+
+        assert response.status_code == 200
+        children = response.json()["tree"]["children"]
+        assert [c["name"] for c in children] == ["api", "README.md"]
+        assert "children" not in children[0]
+        assert children[0]["has_children"] is True
+
+    def test_full_tree_omits_null_fields(self, client: TestClient, folder_id: int) -> None:
+        """depth 미지정 → has_children 및 null 필드 없이 반환"""
+        response = client.get(f"/api/folders/{folder_id}/tree")
+
+        assert response.status_code == 200
+        api = response.json()["tree"]["children"][0]
+        assert api == {
+            "name": "api",
+            "type": "directory",
+            "children": [
+                {
+                    "name": "v2",
+                    "type": "directory",
+                    "children": [{"name": "users.md", "type": "file", "path": api["children"][0]["children"][0]["path"]}],
+                },
+                {"name": "auth.md", "type": "file", "path": api["children"][1]["path"]},
+            ],
+        }
+
+    def test_depth_one_empty_folder_without_md_only(
+        self, client: TestClient, folder_id: int
+    ) -> None:
+        """md_only=false → 빈 폴더도 표시, has_children=false"""
+        response = client.get(f"/api/folders/{folder_id}/tree?depth=1&md_only=false")
+
+        assert response.status_code == 200
+        children = response.json()["tree"]["children"]
+        assert [c["name"] for c in children] == ["api", "empty", "README.md"]
+        assert children[1]["has_children"] is False
+
+    def test_subpath_returns_subtree(
+        self, client: TestClient, folder_id: int, temp_dir: Path
+    ) -> None:
+        """subpath 지정 시 해당 폴더부터 반환"""
+        response = client.get(f"/api/folders/{folder_id}/tree?subpath=api&depth=1")
+
+        assert response.status_code == 200
+        tree = response.json()["tree"]
+        assert tree["name"] == "api"
+        assert [c["name"] for c in tree["children"]] == ["v2", "auth.md"]
+        assert tree["children"][1]["path"] == str(temp_dir / "api" / "auth.md")
+
+    def test_subpath_traversal_rejected(self, client: TestClient, folder_id: int) -> None:
+        """폴더 밖 경로 → 400"""
+        response = client.get(f"/api/folders/{folder_id}/tree?subpath=../")
+
+        assert response.status_code == 400
+        assert response.json()["error"] == "invalid subpath"
+
+    def test_subpath_not_found(self, client: TestClient, folder_id: int) -> None:
+        """존재하지 않는 하위 폴더 → 404"""
+        response = client.get(f"/api/folders/{folder_id}/tree?subpath=missing")
+
+        assert response.status_code == 404
+        assert response.json()["error"] == "subpath not found"
+
+    def test_invalid_depth(self, client: TestClient, folder_id: int) -> None:
+        """depth < 1 → 400"""
+        response = client.get(f"/api/folders/{folder_id}/tree?depth=0")
+
+        assert response.status_code == 400
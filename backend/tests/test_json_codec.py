@@ -0,0 +1,30 @@
+"""
+JSON 직렬화 유틸리티 테스트
+"""
+
+import json
+from unittest.mock import patch
+
+from app.utils import json_codec
+
+
+MESSAGE = {"type": "file_changes", "folder_id": 1, "changes": [{"event": "modified", "path": "/문서/a.md"}]}
+
+
+class TestDumps:
+    """json_codec.dumps"""
+
+    def test_round_trip(self) -> None:
+        """직렬화 결과는 표준 json으로 복원 가능, 비 ASCII 문자 그대로 유지"""
+        payload = json_codec.dumps(MESSAGE)
+
+        assert isinstance(payload, str)
+        assert json.loads(payload) == MESSAGE
+        assert "문서" in payload
+
+    def test_fallback_without_orjson(self) -> None:
+        """orjson 미설치 시 표준 json 사용 (Starlette send_json과 같은 compact 형식)"""
+        with patch.object(json_codec, "orjson", None):
+            payload = json_codec.dumps(MESSAGE)
+
+        assert payload == json.dumps(MESSAGE, ensure_ascii=False, separators=(",", ":"))
@@ -0,0 +1,249 @@
+"""
+마크다운 전용 폴링 감시 테스트
+
+Spec: spec/api/file-watch-websocket.md - 섹션 5, 8
+"""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from watchdog.events import FileSystemEventHandler
+
+from app.services.file_watcher import FileWatcherService
+from app.services.markdown_polling import MarkdownPollingObserver, MarkdownSnapshot
+
+
+def _summary(events) -> set[tuple]:
+    return {
+        (event.event_type, event.is_directory, event.src_path, getattr(event, "dest_path", ""))
+        for event in events
+    }
+
+
+def _age(path: Path, seconds: float = 60) -> None:
+    """mtime을 과거로 돌려 racy 재나열 대상에서 제외"""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture
+def root(tmp_path: Path) -> Path:
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "a.md").write_text("# A")
+    (tmp_path / "notes.txt").write_text("text")
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "README.md").write_text("# pkg")
+    (tmp_path / ".git").mkdir()
+    for path in (tmp_path / "docs", tmp_path):
+        _age(path)
+    return tmp_path
+
+
+class TestMarkdownSnapshot:
+    """MarkdownSnapshot 증분 poll"""
+
+    def test_initial_scan_has_no_events(self, root: Path) -> None:
+        snapshot = MarkdownSnapshot(str(root))
+        assert snapshot.poll() == []
+        assert snapshot.poll() == []
+
+    def test_created_and_deleted(self, root: Path) -> None:
+        """.md 생성/삭제 → 이벤트, 비 마크다운은 무시"""
+        snapshot = MarkdownSnapshot(str(root))
+        snapshot.scan()
+
+        (root / "docs" / "b.md").write_text("# B")
+        (root / "docs" / "b.txt").write_text("B")
+        (root / "docs" / "a.md").unlink()
+
+        assert _summary(snapshot.poll()) == {
+            ("created", False, str(root / "docs" / "b.md"), ""),
+            ("deleted", False, str(root / "docs" / "a.md"), ""),
+        }
+
+    def test_modified(self, root: Path) -> None:
+        """내용 변경 (폴더 mtime 그대로) → modified"""
+        snapshot = MarkdownSnapshot(str(root))
+        snapshot.scan()
+
+        (root / "docs" / "a.md").write_text("# A changed")
+
+        assert _summary(snapshot.poll()) == {
+            ("modified", False, str(root / "docs" / "a.md"), ""),
+        }
+
+    def test_moved(self, root: Path) -> None:
+        """같은 inode 삭제/생성 → moved"""
+        snapshot = MarkdownSnapshot(str(root))
+        snapshot.scan()
+
+        (root / "docs" / "a.md").rename(root / "a.md")
+
+        assert _summary(snapshot.poll()) == {
+            ("moved", False, str(root / "docs" / "a.md"), str(root / "a.md")),
+        }
+
+    def test_directory_created_and_deleted(self, root: Path) -> None:
+        """새 폴더는 하위 .md와 함께 created, 삭제된 폴더는 하위 .md와 함께 deleted"""
+        snapshot = MarkdownSnapshot(str(root))
+        snapshot.scan()
+
+        (root / "guide").mkdir()
+        (root / "guide" / "intro.md").write_text("# Intro")
+        (root / "docs" / "a.md").unlink()
+        (root / "docs").rmdir()
+
+        assert _summary(snapshot.poll()) == {
+            ("created", True, str(root / "guide"), ""),
+            ("created", False, str(root / "guide" / "intro.md"), ""),
+            ("deleted", True, str(root / "docs"), ""),
+            ("deleted", False, str(root / "docs" / "a.md"), ""),
+        }
+
+    def test_ignored_and_hidden_dirs_not_walked(self, root: Path) -> None:
+        """IGNORED_DIRS / 숨김 폴더는 탐색하지 않음"""
+        snapshot = MarkdownSnapshot(str(root))
+        snapshot.scan()
+
+        (root / "node_modules" / "pkg" / "CHANGELOG.md").write_text("# log")
+        (root / ".git" / "notes.md").write_text("# git")
+        (root / "out").mkdir()
+        (root / "out" / "build.md").write_text("# build")
+
+        assert snapshot.poll() == []
+        scanned = set(snapshot._dirs)
+        assert str(root / "node_modules") not in scanned
+        assert str(root / ".git") not in scanned
+        assert str(root / "out") not in scanned
+
+    def test_unchanged_directory_not_relisted(self, root: Path) -> None:
+        """mtime이 그대로인 폴더는 scandir 하지 않음"""
+        snapshot = MarkdownSnapshot(str(root))
+        snapshot.scan()
+
+        with patch("app.services.markdown_polling.os.scandir") as scandir:
+            assert snapshot.poll() == []
+        scandir.assert_not_called()
+
+    def test_root_removed_raises(self, root: Path) -> None:
+        """감시 폴더 자체 삭제 → OSError"""
+        target = root / "docs"
+        snapshot = MarkdownSnapshot(str(target))
+        snapshot.scan()
+
+        (target / "a.md").unlink()
+        target.rmdir()
+
+        with pytest.raises(OSError):
+            snapshot.poll()
+
+
+class TestMarkdownPollingObserver:
+    """FileWatcherService 폴링 모드"""
+
+    def test_service_uses_markdown_polling(self, root: Path) -> None:
+        service = FileWatcherService(use_polling=True)
+        try:
+            service.add_folder(folder_id=1, path=str(root))
+            assert isinstance(service._observer, MarkdownPollingObserver)
+            assert service.tracks_all_files is False
+        finally:
+            service.stop_all()
+
+
+class TestAdaptiveInterval:
+    """적응형 폴링 주기"""
+
+    def _emitter(self, root: Path, observer: MarkdownPollingObserver):
+        watch = observer.schedule(FileSystemEventHandler(), str(root), recursive=True)
+        return observer._emitter_for_watch[watch]
+
+    def test_backoff_and_reset(self, root: Path) -> None:
+        """변경 없으면 2배씩 증가(최대값 제한), 변경 감지 시 최소 주기로 복귀"""
+        observer = MarkdownPollingObserver(timeout=0.5, max_interval=3.0, active_max_interval=1.0)
+        emitter = self._emitter(root, observer)
+
+        intervals = []
+        for _ in range(4):
+            emitter._adjust_interval(changed=False)
+            intervals.append(emitter.interval)
+        assert intervals == [1.0, 2.0, 3.0, 3.0]
+
+        emitter._adjust_interval(changed=True)
+        assert emitter.interval == 0.5
+
+    def test_active_root_caps_interval(self, root: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        """구독 시작된 감시 루트만 즉시 최소 주기로 복귀, 구독 중에는 active 상한 적용"""
+        other_root = tmp_path_factory.mktemp("other")
+        observer = MarkdownPollingObserver(timeout=0.5, max_interval=8.0, active_max_interval=1.0)
+        emitter = self._emitter(root, observer)
+        other = self._emitter(other_root, observer)
+        for _ in range(5):
+            emitter._adjust_interval(changed=False)
+            other._adjust_interval(changed=False)
+        assert emitter.interval == other.interval == 8.0
+
+        observer.set_active_roots([str(root)])
+        assert emitter.interval == 0.5
+        assert other.interval == 8.0
+        for _ in range(5):
+            emitter._adjust_interval(changed=False)
+        assert emitter.interval == 1.0
+
+        observer.set_active_roots([])
+        emitter._adjust_interval(changed=False)
+        assert emitter.interval == 2.0
+
+    def test_change_detected_after_backoff(self, root: Path) -> None:
+        """긴 주기로 늘어난 상태에서도 wake 후 바로 변경 감지"""
+        events = []
+
+        class Collector(FileSystemEventHandler):
+            def on_any_event(self, event) -> None:
+                events.append(event)
+
+        observer = MarkdownPollingObserver(timeout=0.1, max_interval=60.0)
+        watch = observer.schedule(Collector(), str(root), recursive=True)
+        observer.start()
+        try:
+            emitter = observer._emitter_for_watch[watch]
+            time.sleep(0.3)
+            emitter.interval = 60.0
+
+            (root / "docs" / "new.md").write_text("# New")
+            observer.wake()
+
+            deadline = time.monotonic() + 2.0
+            while not events and time.monotonic() < deadline:
+                time.sleep(0.02)
+            assert any(event.src_path.endswith("new.md") for event in events)
+        finally:
+            observer.stop()
+            observer.join(timeout=1.0)
+
+    def test_service_forwards_active_folders(self, root: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        """FileWatcherService.set_active_folders → 폴더의 감시 루트만 활성 (이후 추가되는 폴더 포함)"""
+        other_root = tmp_path_factory.mktemp("other")
+        service = FileWatcherService(use_polling=True)
+        service.set_active_folders([1])
+        try:
+            service.add_folder(folder_id=1, path=str(root))
+            service.add_folder(folder_id=2, path=str(other_root))
+            # 중첩 폴더는 상위 폴더 감시 루트를 활성화
+            service.add_folder(folder_id=3, path=str(root / "docs"))
+            observer = service._observer
+            assert observer._active_roots == {str(root)}
+
+            service.set_active_folders([3])
+            assert observer._active_roots == {str(root)}
+            service.set_active_folders([2])
+            assert observer._active_roots == {str(other_root)}
+            service.set_active_folders(None)
+            assert observer._active_roots == {str(root), str(other_root)}
+            service.set_active_folders([])
+            assert observer._active_roots == set()
+        finally:
+            service.stop_all()
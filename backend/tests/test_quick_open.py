@@ -0,0 +1,216 @@
+"""
+빠른 열기 테스트
+
+FuzzyPathIndex 점수/갱신, 감시 이벤트 반영, GET /api/quickopen
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services import quick_open
+from app.services.quick_open import QuickOpenIndex, quick_open_index
+from app.services.tree_cache import TreeCache
+from app.services.tree_snapshots import TreeSnapshotStore
+from app.utils import fuzzy_index
+from app.utils.fuzzy_index import FuzzyPathIndex
+
+
+def _paths(index: FuzzyPathIndex, query: str, **kwargs) -> list[str]:
+    return [path for _, path, _, _ in index.search(query, **kwargs)]
+
+
+class TestFuzzyPathIndex:
+    """퍼지 경로 인덱스"""
+
+    def test_subsequence_match_required(self) -> None:
+        """순서대로 모든 문자가 있어야 일치 (대소문자/공백 무시)"""
+        index = FuzzyPathIndex()
+        index.add_many(1, ["docs/readme.md", "design.md", "notes/mr-ed.md"])
+
+        assert set(_paths(index, "RDM")) == {"docs/readme.md", "notes/mr-ed.md"}
+        assert _paths(index, "d m e r") == []
+        assert _paths(index, "zzz") == []
+        assert _paths(index, "   ") == []
+
+    def test_boundary_matches_rank_first(self) -> None:
+        """파일 이름 시작 / 단어 경계 / 연속 일치가 흩어진 일치보다 우선"""
+        index = FuzzyPathIndex()
+        index.add_many(1, [
+            "guide/install.md",
+            "misc/going-up-in-docker.md",
+            "api/getUserInfo.md",
+            "archive/user-info.md",
+        ])
+
+        assert _paths(index, "install")[0] == "guide/install.md"
+        assert _paths(index, "guide")[0] == "guide/install.md"
+        assert _paths(index, "ui")[0] == "archive/user-info.md"
+        assert "api/getUserInfo.md" in _paths(index, "gui")[:2]
+
+    def test_match_positions(self) -> None:
+        """일치 위치는 상대 경로 기준"""
+        index = FuzzyPathIndex()
+        index.add(1, "docs/api.md")
+
+        [(folder_id, path, _, positions)] = index.search("api")
+        assert (folder_id, path, positions) == (1, "docs/api.md", [5, 6, 7])
+
+    def test_folder_filter_and_removal(self) -> None:
+        """폴더 필터, 경로/디렉토리/폴더 단위 삭제"""
+        index = FuzzyPathIndex()
+        index.add_many(1, ["a/spec.md", "a/b/spec-v2.md", "c/spec.md"])
+        index.add(2, "spec.md")
+
+        assert _paths(index, "spec", folder_id=2) == ["spec.md"]
+        assert index.remove(1, "c/spec.md")
+        assert not index.remove(1, "c/spec.md")
+        assert index.remove_prefix(1, "a/b") == 1
+        assert sorted(_paths(index, "spec")) == ["a/spec.md", "spec.md"]
+        assert index.remove_folder(2) == 1
+        assert _paths(index, "spec") == ["a/spec.md"]
+        assert len(index) == 1
+
+    def test_compact_keeps_live_paths(self) -> None:
+        """재구성 후에도 살아있는 경로만 같은 결과"""
+        index = FuzzyPathIndex()
+        index.add_many(1, [f"old/{i}.md" for i in range(50)] + ["keep/readme.md"])
+        index.remove_prefix(1, "old")
+        index.add(2, "other/readme.md")
+
+        assert index.compact()
+        assert sorted(_paths(index, "readme")) == ["keep/readme.md", "other/readme.md"]
+        assert index.add(1, "old/1.md")
+        assert _paths(index, "old1") == ["old/1.md"]
+
+    def test_compact_waits_for_pending_add_many(self) -> None:
+        """add_many 비트 계산 도중의 재구성은 적용하지 않음 (예약 id 유지)"""
+        index = FuzzyPathIndex()
+        index.add_many(1, [f"old/{i}.md" for i in range(50)])
+        index.remove_prefix(1, "old")
+
+        compacted = []
+        build_bits = fuzzy_index._build_bits
+
+        def compact_during_build(entries):
+            if not compacted:
+                compacted.append(index.compact())
+            return build_bits(entries)
+
+        with patch.object(fuzzy_index, "_build_bits", compact_during_build):
+            assert index.add_many(1, ["new/readme.md", "new/guide.md"]) == 2
+
+        assert compacted == [False]
+        assert sorted(_paths(index, "new")) == ["new/guide.md", "new/readme.md"]
+        assert index.compact()
+        assert sorted(_paths(index, "new")) == ["new/guide.md", "new/readme.md"]
+
+    def test_case_folding_keeps_positions(self) -> None:
+        """소문자 변환으로 길이가 바뀌는 문자가 있어도 위치가 경로와 일치"""
+        index = FuzzyPathIndex()
+        index.add(1, "İstanbul/notes.md")
+
+        [(_, path, _, positions)] = index.search("notes")
+        assert [path[i] for i in positions] == list("notes")
+
+    def test_scoring_bounded_for_common_queries(self) -> None:
+        """후보가 많으면 SCORE_BUDGET개만 점수 계산, 파일 이름 시작 일치는 유지"""
+        index = FuzzyPathIndex()
+        index.add_many(1, [f"dir{i}/a-note-{i}.md" for i in range(3000)] + ["deep/x/readme.md"])
+
+        calls = []
+        score_path = fuzzy_index.score_path
+
+        def counting(query, entry):
+            calls.append(entry)
+            return score_path(query, entry)
+
+        with patch.object(fuzzy_index, "score_path", counting):
+            results = _paths(index, "r", limit=5)
+
+        assert len(calls) <= fuzzy_index.SCORE_BUDGET
+        assert results[0] == "deep/x/readme.md"
+
+
+class TestQuickOpenIndex:
+    """폴더 탐색 / 변경 반영"""
+
+    def test_build_and_apply_changes(self, temp_dir: Path) -> None:
+        """폴더 추가 시 탐색, 생성/삭제/디렉토리 이동 반영 (숨김/node_modules 제외)"""
+        (temp_dir / "guide").mkdir()
+        (temp_dir / "guide" / "install.md").write_text("# install")
+        (temp_dir / "notes.txt").write_text("x")
+        (temp_dir / ".hidden").mkdir()
+        (temp_dir / ".hidden" / "secret.md").write_text("x")
+        (temp_dir / "node_modules").mkdir()
+        (temp_dir / "node_modules" / "pkg.md").write_text("x")
+
+        service = QuickOpenIndex()
+        service.add_folder(1, str(temp_dir))
+        assert service.wait_idle(timeout=5.0)
+        assert [r["relative_path"] for r in service.search("md")] == ["guide/install.md"]
+        assert service.search("install")[0]["path"] == str(temp_dir / "guide" / "install.md")
+
+        new_file = temp_dir / "api.md"
+        new_file.write_text("# api")
+        service.apply_change(1, str(new_file))
+        (temp_dir / "guide").rename(temp_dir / "manual")
+        service.apply_change(1, str(temp_dir / "guide"), is_directory=True)
+        service.apply_change(1, str(temp_dir / "manual"), is_directory=True)
+        service.apply_change(1, str(temp_dir / ".hidden" / "other.md"))
+
+        assert sorted(r["relative_path"] for r in service.search("md")) == ["api.md", "manual/install.md"]
+
+        service.remove_folder(1)
+        assert service.search("md") == []
+        service.apply_change(1, str(new_file))
+        assert service.path_count == 0
+
+
+    def test_build_reuses_tree_index(self, client: TestClient, temp_dir: Path) -> None:
+        """트리 캐시가 있으면 직접 탐색하지 않고 스냅샷 대조가 끝난 트리 인덱스 사용"""
+        (temp_dir / "docs").mkdir()
+        (temp_dir / "docs" / "old.md").write_text("# old")
+        store = TreeSnapshotStore(save_delay=60.0)
+        TreeCache(snapshot_store=store).get_tree(1, str(temp_dir))
+        store.flush()
+        # 스냅샷 저장 이후 변경 (대조로 반영되어야 함)
+        (temp_dir / "docs" / "new.md").write_text("# new")
+
+        cache = TreeCache(snapshot_store=store)
+        service = QuickOpenIndex(tree_cache=cache)
+        with patch.object(quick_open, "scan_tree", side_effect=AssertionError("scan_tree called")):
+            service.add_folder(1, str(temp_dir))
+            assert service.wait_idle(timeout=5.0)
+
+        assert sorted(r["relative_path"] for r in service.search("md")) == ["docs/new.md", "docs/old.md"]
+
+
+class TestQuickOpenApi:
+    """GET /api/quickopen"""
+
+    def test_watched_folder_paths(self, client: TestClient, temp_dir: Path) -> None:
+        """등록 폴더 경로 검색, 삭제 후 제외"""
+        (temp_dir / "docs").mkdir()
+        (temp_dir / "docs" / "readme.md").write_text("# readme")
+        response = client.post("/api/folders", json={"name": "Docs", "path": str(temp_dir)})
+        folder_id = response.json()["id"]
+        assert quick_open_index.wait_idle(timeout=5.0)
+
+        response = client.get("/api/quickopen", params={"q": "rdme"})
+        assert response.status_code == 200
+        [result] = response.json()["results"]
+        assert result["folder_id"] == folder_id
+        assert result["relative_path"] == "docs/readme.md"
+        assert result["path"] == str(temp_dir / "docs" / "readme.md")
+        assert [result["relative_path"][i] for i in result["matches"]] == list("rdme")
+
+        client.delete(f"/api/folders/{folder_id}")
+        assert client.get("/api/quickopen", params={"q": "rdme"}).json()["results"] == []
+
+    @pytest.mark.parametrize("params", [{}, {"q": "  "}])
+    def test_empty_query_rejected(self, client: TestClient, params: dict) -> None:
+        """검색어 없음 → 400"""
+        assert client.get("/api/quickopen", params=params).status_code == 400
@@ -0,0 +1,328 @@
+"""
+전문 검색 API 테스트
+
+등록 폴더 마크다운 FTS5 색인 및 GET /api/search
+"""
+
+import os
+import time
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import MagicMock, call
+
+import pytest
+from fastapi.testclient import TestClient
+from watchdog.events import (
+    DirModifiedEvent, DirMovedEvent, FileModifiedEvent, FileMovedEvent,
+)
+
+from app.db import database
+from app.repositories.search_repository import SearchRepository
+from app.services.file_watcher import MarkdownEventHandler
+from app.services.search_indexer import SearchIndexer, search_indexer
+from app.utils.search_query import build_match_query, extract_title, split_highlight
+
+
+@pytest.fixture
+def docs_dir(temp_dir: Path) -> Path:
+    """검색 대상 마크다운 폴더"""
+    (temp_dir / "guide").mkdir()
+    (temp_dir / "guide" / "install.md").write_text(
+        "# Installation Guide\n\nRun docker compose to start the server.\n", encoding="utf-8"
+    )
+    (temp_dir / "api.md").write_text(
+        "# API 명세\n\n폴더 등록 API는 경로를 검증합니다.\n", encoding="utf-8"
+    )
+    (temp_dir / "notes.txt").write_text("docker docker docker", encoding="utf-8")
+    (temp_dir / "node_modules").mkdir()
+    (temp_dir / "node_modules" / "docker.md").write_text("# docker", encoding="utf-8")
+    return temp_dir
+
+
+def _register(client: TestClient, path: Path) -> int:
+    response = client.post("/api/folders", json={"name": "Docs", "path": str(path)})
+    assert response.status_code == 201
+    assert search_indexer.wait_idle(timeout=5.0)
+    return response.json()["id"]
+
+
+def _indexed_stats(folder_id: int) -> dict[str, tuple[int, int]]:
+    db = database.SessionLocal()
+    try:
+        return SearchRepository(db).stats_by_folder(folder_id)
+    finally:
+        db.close()
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return predicate()
+
+
+def _text(segments: list[dict]) -> str:
+    return "".join(segment["text"] for segment in segments)
+
+
+class TestSearchQuery:
+    """검색어 / 결과 텍스트 유틸리티"""
+
+    def test_build_match_query_quotes_terms(self) -> None:
+        """단어별 따옴표 + 접두어 일치, FTS5 연산자는 일반 단어로 취급"""
+        assert build_match_query("docker compose") == '"docker"* "compose"*'
+        assert build_match_query('NEAR(a "b') == '"NEAR(a"* """b"*'
+        assert build_match_query("  - * ") is None
+
+    def test_extract_title(self) -> None:
+        """첫 번째 # 제목, 없으면 파일 이름"""
+        assert extract_title("intro\n# Title\n## Sub", "/docs/a.md") == "Title"
+        assert extract_title("## Sub only", "/docs/readme.md") == "readme"
+
+    def test_split_highlight(self) -> None:
+        """구분자 → 일치 구간 목록"""
+        assert split_highlight("run \x02docker\x03 now") == [
+            {"text": "run ", "match": False},
+            {"text": "docker", "match": True},
+            {"text": " now", "match": False},
+        ]
+
+
+class TestSearchApi:
+    """GET /api/search"""
+
+    def test_search_ranked_with_snippet(self, client: TestClient, docs_dir: Path) -> None:
+        """본문 일치 → 발췌 하이라이트, .md 외 파일과 무시 폴더는 제외"""
+        folder_id = _register(client, docs_dir)
+
+        response = client.get("/api/search", params={"q": "docker"})
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [result["path"] for result in results] == [str(docs_dir / "guide" / "install.md")]
+        result = results[0]
+        assert result["folder_id"] == folder_id
+        assert _text(result["title"]) == "Installation Guide"
+        assert {"text": "docker", "match": True} in result["snippet"]
+
+    def test_title_match_ranks_first(self, client: TestClient, docs_dir: Path) -> None:
+        """제목 일치 문서가 본문만 일치하는 문서보다 앞"""
+        (docs_dir / "other.md").write_text("# Misc\n\nsee the installation notes\n", encoding="utf-8")
+        _register(client, docs_dir)
+
+        results = client.get("/api/search", params={"q": "installation"}).json()["results"]
+
+        assert [Path(result["path"]).name for result in results] == ["install.md", "other.md"]
+        assert results[0]["score"] > results[1]["score"]
+
+    def test_korean_prefix_match(self, client: TestClient, docs_dir: Path) -> None:
+        """한글 단어 접두어 일치 (검증 → 검증합니다)"""
+        _register(client, docs_dir)
+
+        results = client.get("/api/search", params={"q": "경로를 검증"}).json()["results"]
+
+        assert [Path(result["path"]).name for result in results] == ["api.md"]
+
+    def test_folder_filter_and_delete(self, client: TestClient, docs_dir: Path) -> None:
+        """folder_id 필터, 폴더 삭제 시 문서 제거"""
+        folder_id = _register(client, docs_dir)
+
+        assert client.get("/api/search", params={"q": "docker", "folder_id": folder_id + 1}).json()["results"] == []
+
+        assert client.delete(f"/api/folders/{folder_id}").status_code == 200
+        assert search_indexer.wait_idle(timeout=5.0)
+        assert client.get("/api/search", params={"q": "docker"}).json()["results"] == []
+
+    def test_nested_folders_indexed_separately(self, client: TestClient, docs_dir: Path) -> None:
+        """중첩 등록 폴더: 하위 폴더 삭제 후에도 상위 폴더 문서 유지, 폴더 미지정 검색은 중복 없음"""
+        parent_id = _register(client, docs_dir)
+        child_id = _register(client, docs_dir / "guide")
+        install = str(docs_dir / "guide" / "install.md")
+
+        assert [r["path"] for r in client.get("/api/search", params={"q": "docker"}).json()["results"]] == [install]
+        for folder_id in (parent_id, child_id):
+            results = client.get("/api/search", params={"q": "docker", "folder_id": folder_id}).json()["results"]
+            assert [(r["folder_id"], r["path"]) for r in results] == [(folder_id, install)]
+
+        assert client.delete(f"/api/folders/{child_id}").status_code == 200
+        assert search_indexer.wait_idle(timeout=5.0)
+
+        results = client.get("/api/search", params={"q": "docker"}).json()["results"]
+        assert [(r["folder_id"], r["path"]) for r in results] == [(parent_id, install)]
+        assert install in _indexed_stats(parent_id)
+
+    def test_reindex_removes_missing_files(self, client: TestClient, docs_dir: Path) -> None:
+        """재색인 시 없어진 파일 문서 삭제"""
+        folder_id = _register(client, docs_dir)
+        (docs_dir / "guide" / "install.md").unlink()
+
+        search_indexer.enqueue_folder(folder_id, str(docs_dir))
+        assert search_indexer.wait_idle(timeout=5.0)
+
+        assert client.get("/api/search", params={"q": "docker"}).json()["results"] == []
+
+    def test_empty_query_rejected(self, client: TestClient) -> None:
+        """검색어 없음 → 400"""
+        assert client.get("/api/search", params={"q": " "}).status_code == 400
+        assert client.get("/api/search").status_code == 400
+
+
+@pytest.fixture
+def indexer(client: TestClient) -> Generator[SearchIndexer, None, None]:
+    """짧은 debounce의 독립 인덱서 (파일 읽기 경로 기록)"""
+    instance = SearchIndexer(max_file_bytes=1 << 20, debounce_seconds=0.05)
+    instance.reads = []
+    read_document = instance._read_document
+
+    def recording_read(path: str):
+        instance.reads.append(path)
+        return read_document(path)
+
+    instance._read_document = recording_read
+    yield instance
+    instance.stop()
+    instance.scheduler.stop()
+
+
+class TestIncrementalIndexing:
+    """감시 이벤트 기반 경로 재색인 / 시작 시 동기화"""
+
+    def test_reconcile_reads_only_changed_files(self, indexer: SearchIndexer, docs_dir: Path) -> None:
+        """폴더 동기화 시 mtime/size가 바뀐 파일만 다시 읽음"""
+        indexer.enqueue_folder(1, str(docs_dir))
+        assert indexer.wait_idle(timeout=5.0)
+        assert len(indexer.reads) == 2
+
+        api_path = docs_dir / "api.md"
+        api_path.write_text("# API 명세\n\n재색인 확인용 문장\n", encoding="utf-8")
+        (docs_dir / "guide" / "install.md").unlink()
+        indexer.reads.clear()
+
+        indexer.enqueue_folder(1, str(docs_dir))
+        assert indexer.wait_idle(timeout=5.0)
+
+        assert indexer.reads == [str(api_path)]
+        stats = _indexed_stats(1)
+        assert set(stats) == {str(api_path)}
+        assert stats[str(api_path)][1] == api_path.stat().st_size
+
+    def test_schedule_path_debounced(self, indexer: SearchIndexer, docs_dir: Path) -> None:
+        """같은 경로의 연속 변경은 1회만 재색인, 삭제된 파일은 문서 제거"""
+        note = docs_dir / "note.md"
+        for i in range(5):
+            note.write_text(f"# Note {i}\n", encoding="utf-8")
+            indexer.schedule_path(1, str(note))
+        assert _wait_until(lambda: str(note) in _indexed_stats(1))
+        assert indexer.wait_idle(timeout=5.0)
+        assert indexer.reads == [str(note)]
+
+        note.unlink()
+        indexer.schedule_path(1, str(note))
+        assert _wait_until(lambda: str(note) not in _indexed_stats(1))
+
+    def test_directory_move_resyncs_subtree(self, indexer: SearchIndexer, docs_dir: Path) -> None:
+        """디렉토리 이동 시 이전 경로 문서 삭제, 새 경로 하위 색인"""
+        indexer.enqueue_folder(1, str(docs_dir))
+        assert indexer.wait_idle(timeout=5.0)
+        old_dir, new_dir = docs_dir / "guide", docs_dir / "manual"
+        os.rename(old_dir, new_dir)
+
+        indexer.schedule_path(1, str(old_dir), is_directory=True)
+        indexer.schedule_path(1, str(new_dir), is_directory=True)
+
+        expected = {str(docs_dir / "api.md"), str(new_dir / "install.md")}
+        assert _wait_until(lambda: set(_indexed_stats(1)) == expected)
+
+    def test_nested_folder_reconcile_and_events(self, indexer: SearchIndexer, docs_dir: Path) -> None:
+        """중첩 폴더: 각 폴더 동기화는 변경 없으면 다시 읽지 않고, 같은 경로 이벤트는 폴더별로 반영"""
+        guide = docs_dir / "guide"
+        indexer.enqueue_folder(1, str(docs_dir))
+        indexer.enqueue_folder(2, str(guide))
+        assert indexer.wait_idle(timeout=5.0)
+        indexer.reads.clear()
+
+        indexer.enqueue_folder(1, str(docs_dir))
+        indexer.enqueue_folder(2, str(guide))
+        assert indexer.wait_idle(timeout=5.0)
+        assert indexer.reads == []
+
+        install = guide / "install.md"
+        install.write_text("# Install\n\nupdated\n", encoding="utf-8")
+        indexer.schedule_path(1, str(install))
+        indexer.schedule_path(2, str(install))
+        size = install.stat().st_size
+        assert _wait_until(
+            lambda: _indexed_stats(1)[str(install)][1] == size and _indexed_stats(2)[str(install)][1] == size
+        )
+
+        indexer.remove_folder(2)
+        assert indexer.wait_idle(timeout=5.0)
+        assert _indexed_stats(2) == {}
+        assert str(install) in _indexed_stats(1)
+
+    def test_removed_folder_ignores_late_events(self, indexer: SearchIndexer, docs_dir: Path) -> None:
+        """폴더 삭제 후 도착한 경로 재색인은 무시"""
+        indexer.remove_folder(1)
+        indexer.enqueue_paths([(1, str(docs_dir / "api.md"), False)])
+        assert indexer.wait_idle(timeout=5.0)
+        assert _indexed_stats(1) == {}
+
+    def test_handler_schedules_index(self, docs_dir: Path) -> None:
+        """핸들러: .md 파일과 이동 양쪽 경로, 구조 변경 디렉토리만 예약"""
+        search = MagicMock()
+        handler = MarkdownEventHandler(folder_id=7, callback=MagicMock(), search_indexer=search)
+        handler._schedule_callback = MagicMock()
+        src, dest = str(docs_dir / "api.md.tmp"), str(docs_dir / "api.md")
+
+        handler.on_any_event(FileMovedEvent(src, dest))
+        handler.on_any_event(FileModifiedEvent(str(docs_dir / "notes.txt")))
+        handler.on_any_event(FileModifiedEvent(str(docs_dir / ".hidden.md")))
+        handler.on_any_event(DirModifiedEvent(str(docs_dir / "guide")))
+        handler.on_any_event(DirMovedEvent(str(docs_dir / "guide"), str(docs_dir / "manual")))
+
+        assert search.schedule_path.call_args_list == [
+            call(7, dest),
+            call(7, str(docs_dir / "guide"), is_directory=True),
+            call(7, str(docs_dir / "manual"), is_directory=True),
+        ]
+
+    def test_ignored_dirs_match_reconcile(self, indexer: SearchIndexer, docs_dir: Path) -> None:
+        """out/ 하위 .md: 폴더 동기화와 감시 이벤트 모두 제외, out/ 자체를 등록한 폴더는 색인"""
+        (docs_dir / "out").mkdir()
+        built = docs_dir / "out" / "build.md"
+        built.write_text("# build", encoding="utf-8")
+
+        indexer.enqueue_folder(1, str(docs_dir))
+        assert indexer.wait_idle(timeout=5.0)
+        assert str(built) not in _indexed_stats(1)
+
+        search = MagicMock()
+        handler = MarkdownEventHandler(
+            folder_id=1, callback=MagicMock(), search_indexer=search, root=str(docs_dir)
+        )
+        handler._schedule_callback = MagicMock()
+        handler.on_any_event(FileModifiedEvent(str(built)))
+        search.schedule_path.assert_not_called()
+        handler._schedule_callback.assert_not_called()
+
+        indexer.enqueue_folder(2, str(docs_dir / "out"))
+        assert indexer.wait_idle(timeout=5.0)
+        assert str(built) in _indexed_stats(2)
+
+        handler = MarkdownEventHandler(
+            folder_id=2, callback=MagicMock(), search_indexer=search, root=str(docs_dir / "out")
+        )
+        handler._schedule_callback = MagicMock()
+        handler.on_any_event(FileModifiedEvent(str(built)))
+        search.schedule_path.assert_called_once_with(2, str(built))
+
+    def test_watcher_reindexes_modified_file(self, client: TestClient, docs_dir: Path) -> None:
+        """등록 폴더의 파일 수정 → 감시 이벤트로 해당 파일 재색인"""
+        _register(client, docs_dir)
+        (docs_dir / "api.md").write_text("# API\n\nwatchertoken 포함\n", encoding="utf-8")
+
+        assert _wait_until(
+            lambda: client.get("/api/search", params={"q": "watchertoken"}).json()["results"] != []
+        )
@@ -0,0 +1,181 @@
+"""
+폴더 트리 캐시 테스트
+
+Spec: spec/api/folder-tree.md
+"""
+
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.file_watcher import MarkdownEventHandler
+from app.services.tree_cache import TreeCache
+
+
+def _make_event(event_type: str, src_path: str, is_directory: bool = False) -> MagicMock:
+    event = MagicMock()
+    event.event_type = event_type
+    event.src_path = src_path
+    event.dest_path = ""
+    event.is_directory = is_directory
+    return event
+
+
+class TestTreeCache:
+    """Unit Tests - TreeCache"""
+
+    def test_get_tree_returns_cached_tree(self, tmp_path: Path) -> None:
+        """두 번째 조회는 파일 시스템을 다시 탐색하지 않음"""
+        (tmp_path / "a.md").write_text("# A")
+        cache = TreeCache()
+
+        first = cache.get_tree(1, str(tmp_path))
+        with patch("app.utils.tree_index.scan_directory") as mock_scan:
+            second = cache.get_tree(1, str(tmp_path))
+
+        assert second is first
+        mock_scan.assert_not_called()
+
+    def test_md_only_cached_separately(self, tmp_path: Path) -> None:
+        """md_only 값별로 별도 캐싱"""
+        (tmp_path / "a.md").write_text("# A")
+        (tmp_path / "b.txt").write_text("b")
+        cache = TreeCache()
+
+        md_tree = cache.get_tree(1, str(tmp_path), md_only=True)
+        all_tree = cache.get_tree(1, str(tmp_path), md_only=False)
+
+        assert [c.name for c in md_tree.children] == ["a.md"]
+        assert [c.name for c in all_tree.children] == ["a.md", "b.txt"]
+
+    def test_invalidate_rebuilds_tree(self, tmp_path: Path) -> None:
+        """무효화 후 조회 시 새 트리 반환"""
+        cache = TreeCache()
+        cache.get_tree(1, str(tmp_path))
+
+        (tmp_path / "new.md").write_text("# New")
+        cache.invalidate(1)
+
+        tree = cache.get_tree(1, str(tmp_path))
+        assert [c.name for c in tree.children] == ["new.md"]
+
+    def test_apply_change_patches_tree(self, tmp_path: Path) -> None:
+        """변경 경로만 반영하여 새 트리 반환"""
+        cache = TreeCache()
+        cache.get_tree(1, str(tmp_path))
+
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "a.md").write_text("# A")
+        cache.apply_change(1, str(tmp_path / "docs" / "a.md"))
+
+        tree = cache.get_tree(1, str(tmp_path))
+        assert tree.children[0].name == "docs"
+        assert tree.children[0].children[0].path == str(tmp_path / "docs" / "a.md")
+
+    def test_apply_change_ignores_excluded_paths(self, tmp_path: Path) -> None:
+        """숨김/무시 폴더 하위 변경은 캐시를 유지"""
+        cache = TreeCache()
+        first = cache.get_tree(1, str(tmp_path))
+
+        cache.apply_change(1, str(tmp_path / "node_modules" / "pkg" / "README.md"))
+        cache.apply_change(1, str(tmp_path / ".git" / "HEAD"))
+        cache.apply_change(1, str(tmp_path / ".hidden.md"))
+
+        assert cache.get_tree(1, str(tmp_path)) is first
+
+    def test_change_during_build_is_replayed(self, tmp_path: Path) -> None:
+        """빌드 도중 변경된 경로는 빌드 결과에 반영한 뒤 캐시 (다시 탐색하지 않음)"""
+        cache = TreeCache()
+
+        from app.utils.tree_index import TreeIndex
+        real_build = TreeIndex.build
+
+        def build_and_change(path: str, md_only: bool = True, max_workers: int = 1) -> TreeIndex:
+            index = real_build(path, md_only, max_workers)
+            (tmp_path / "new.md").write_text("# new")
+            cache.apply_change(1, str(tmp_path / "new.md"))
+            cache.apply_change(1, str(tmp_path / "build.log"))
+            return index
+
+        with patch("app.services.tree_cache.TreeIndex.build", side_effect=build_and_change) as build:
+            first = cache.get_tree(1, str(tmp_path))
+            second = cache.get_tree(1, str(tmp_path))
+
+        assert build.call_count == 1
+        assert [child.name for child in first.children] == ["new.md"]
+        assert second == first
+
+    def test_invalidate_during_build_is_not_cached(self, tmp_path: Path) -> None:
+        """빌드 도중 무효화된 결과는 저장하지 않음"""
+        cache = TreeCache()
+
+        from app.utils.tree_index import TreeIndex
+        real_build = TreeIndex.build
+
+        def build_and_invalidate(path: str, md_only: bool = True, max_workers: int = 1) -> TreeIndex:
+            index = real_build(path, md_only, max_workers)
+            cache.invalidate(1)
+            return index
+
+        with patch("app.services.tree_cache.TreeIndex.build", side_effect=build_and_invalidate) as build:
+            cache.get_tree(1, str(tmp_path))
+            cache.get_tree(1, str(tmp_path))
+
+        assert build.call_count == 2
+
+    def test_generation_bumped_by_apply_change(self, tmp_path: Path) -> None:
+        """트리 변경 시 generation(ETag) 증가, 무시 경로는 유지"""
+        cache = TreeCache()
+        cache.get_tree(1, str(tmp_path))
+        before = cache.generation(1)
+
+        cache.apply_change(1, str(tmp_path / ".git" / "HEAD"))
+        assert cache.generation(1) == before
+
+        cache.apply_change(1, str(tmp_path / "a.md"))
+        assert cache.generation(1) > before
+
+    def test_handler_applies_structural_event(self, tmp_path: Path) -> None:
+        """생성/삭제/이동 이벤트 시 반영, 수정 이벤트는 무시"""
+        cache = MagicMock(spec=TreeCache)
+        handler = MarkdownEventHandler(folder_id=1, callback=MagicMock(), tree_cache=cache)
+
+        with patch.object(handler, "_schedule_callback"):
+            handler.on_any_event(_make_event("modified", str(tmp_path / "a.md")))
+            cache.apply_change.assert_not_called()
+
+            handler.on_any_event(_make_event("created", str(tmp_path / "sub"), is_directory=True))
+            cache.apply_change.assert_called_once_with(1, str(tmp_path / "sub"))
+
+
+class TestTreeCacheAPI:
+    """Integration Tests - 캐시된 트리 API"""
+
+    def test_tree_reflects_new_file_after_event(
+        self, client: TestClient, temp_dir: Path
+    ) -> None:
+        """캐시된 트리도 파일 생성 이벤트 이후 갱신됨"""
+        response = client.post(
+            "/api/folders",
+            json={"name": "Cached", "path": str(temp_dir)},
+        )
+        folder_id = response.json()["id"]
+
+        first = client.get(f"/api/folders/{folder_id}/tree").json()
+        assert first["tree"]["children"] == []
+
+        (temp_dir / "later.md").write_text("# Later")
+
+        names: list[str] = []
+        deadline = time.time() + 3.0
+        while time.time() < deadline:
+            tree = client.get(f"/api/folders/{folder_id}/tree").json()["tree"]
+            names = [c["name"] for c in tree["children"]]
+            if names:
+                break
+            time.sleep(0.1)
+
+        assert names == ["later.md"]
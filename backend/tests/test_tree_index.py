@@ -0,0 +1,153 @@
+"""
+트리 인덱스 테스트
+
+Spec: spec/api/folder-tree.md
+"""
+
+from pathlib import Path
+
+import pytest
+
+from app.utils.tree_builder import build_tree
+from app.utils.tree_index import TreeIndex
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """중첩 구조의 테스트 프로젝트"""
+    (tmp_path / "api").mkdir()
+    (tmp_path / "api" / "auth.md").write_text("# Auth")
+    (tmp_path / "api" / "v2").mkdir()
+    (tmp_path / "api" / "v2" / "users.md").write_text("# Users")
+    (tmp_path / "Zeta.md").write_text("# Zeta")
+    (tmp_path / "alpha.md").write_text("# Alpha")
+    (tmp_path / "script.py").write_text("print()")
+    (tmp_path / "src" / "lib").mkdir(parents=True)
+    (tmp_path / "src" / "lib" / "main.py").write_text("print()")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "README.md").write_text("# pkg")
+    return tmp_path
+
+
+class TestTreeIndexBuild:
+    """Unit Tests - 초기 빌드"""
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    @pytest.mark.parametrize("md_only", [True, False])
+    def test_build_matches_build_tree(self, project: Path, md_only: bool, max_workers: int) -> None:
+        """build_tree와 동일한 TreeNode 생성 (순차/병렬 탐색)"""
+        index = TreeIndex.build(str(project), md_only, max_workers)
+
+        assert index.to_tree() == build_tree(str(project), md_only)
+
+    def test_to_tree_reuses_unchanged_subtrees(self, project: Path) -> None:
+        """변경 없는 하위 트리는 직렬화 결과 재사용"""
+        index = TreeIndex.build(str(project))
+        first = index.to_tree()
+
+        (project / "new.md").write_text("# New")
+        index.sync_path(str(project / "new.md"))
+        second = index.to_tree()
+
+        assert second is not first
+        assert second.children[0] is first.children[0]  # api/ 하위 트리 재사용
+
+
+class TestTreeIndexSubtree:
+    """Unit Tests - depth/subpath 직렬화"""
+
+    @pytest.mark.parametrize("subpath", ["", "api", "api/v2"])
+    @pytest.mark.parametrize("depth", [1, 2])
+    def test_depth_matches_build_tree(self, project: Path, subpath: str, depth: int) -> None:
+        """build_tree(depth=N)와 동일한 결과"""
+        index = TreeIndex.build(str(project))
+
+        expected = build_tree(str(project / subpath) if subpath else str(project), depth=depth)
+        assert index.to_tree(subpath, depth) == expected
+
+    def test_missing_subpath_returns_none(self, project: Path) -> None:
+        index = TreeIndex.build(str(project))
+
+        assert index.to_tree("missing") is None
+        assert index.to_tree("Zeta.md") is None
+
+
+class TestTreeIndexSync:
+    """Unit Tests - 경로 단위 동기화"""
+
+    def _assert_synced(self, index: TreeIndex, project: Path) -> None:
+        assert index.to_tree() == build_tree(str(project), index.md_only)
+
+    def test_sync_created_file(self, project: Path) -> None:
+        index = TreeIndex.build(str(project))
+        (project / "api" / "v2" / "roles.md").write_text("# Roles")
+
+        assert index.sync_path(str(project / "api" / "v2" / "roles.md")) is True
+        self._assert_synced(index, project)
+
+    def test_sync_deleted_file(self, project: Path) -> None:
+        index = TreeIndex.build(str(project))
+        (project / "api" / "auth.md").unlink()
+
+        assert index.sync_path(str(project / "api" / "auth.md")) is True
+        self._assert_synced(index, project)
+
+    def test_sync_created_directory_scans_subtree(self, project: Path) -> None:
+        """이동되어 들어온 폴더는 하위까지 탐색"""
+        (project / "moved").mkdir()
+        (project / "moved" / "inner").mkdir()
+        (project / "moved" / "inner" / "doc.md").write_text("# Doc")
+        index = TreeIndex.build(str(project))
+        (project / "moved").rename(project / "guides")
+
+        index.sync_path(str(project / "moved"))
+        index.sync_path(str(project / "guides"))
+        self._assert_synced(index, project)
+
+    def test_sync_file_with_missing_parent(self, project: Path) -> None:
+        """부모 폴더 이벤트가 누락되어도 조상 폴더부터 반영"""
+        index = TreeIndex.build(str(project))
+        (project / "a" / "b").mkdir(parents=True)
+        (project / "a" / "b" / "c.md").write_text("# C")
+
+        assert index.sync_path(str(project / "a" / "b" / "c.md")) is True
+        self._assert_synced(index, project)
+
+    def test_sync_filtered_paths_is_noop(self, project: Path) -> None:
+        """필터 대상 경로는 인덱스를 변경하지 않음"""
+        index = TreeIndex.build(str(project))
+        (project / "notes.txt").write_text("txt")
+        (project / "dist").mkdir()
+
+        assert index.sync_path(str(project / "notes.txt")) is False
+        assert index.sync_path(str(project / "dist")) is False
+        assert index.sync_path(str(project / "node_modules" / "README.md")) is False
+        assert index.sync_path(str(project / "api" / "missing.md")) is False
+
+    def test_sync_non_markdown_when_not_md_only(self, project: Path) -> None:
+        index = TreeIndex.build(str(project), md_only=False)
+        (project / "notes.txt").write_text("txt")
+
+        assert index.sync_path(str(project / "notes.txt")) is True
+        self._assert_synced(index, project)
+
+    def test_sync_last_markdown_deleted_prunes_ancestors(self, project: Path) -> None:
+        """마지막 .md 삭제 시 조상 폴더도 트리에서 제외 (md_only)"""
+        index = TreeIndex.build(str(project))
+        (project / "api" / "v2" / "users.md").unlink()
+        index.sync_path(str(project / "api" / "v2" / "users.md"))
+        (project / "api" / "auth.md").unlink()
+        index.sync_path(str(project / "api" / "auth.md"))
+
+        self._assert_synced(index, project)
+        assert [c.name for c in index.to_tree().children] == ["alpha.md", "Zeta.md"]
+
+    def test_sync_markdown_in_pruned_folder_restores_it(self, project: Path) -> None:
+        """.md가 없던 폴더에 .md 추가 시 다시 표시"""
+        index = TreeIndex.build(str(project))
+        (project / "src" / "lib" / "NOTES.md").write_text("# Notes")
+
+        index.sync_path(str(project / "src" / "lib" / "NOTES.md"))
+
+        self._assert_synced(index, project)
+        assert index.to_tree().children[1].name == "src"
@@ -0,0 +1,171 @@
+"""
+폴더 트리 스냅샷 테스트
+
+스냅샷 저장/복원, 첫 조회 즉시 응답, 백그라운드 디스크 대조, 폴더 삭제 시 정리
+"""
+
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.folder_tree_snapshot import FolderTreeSnapshot
+from app.services.tree_cache import TreeCache, tree_cache
+from app.services.tree_snapshots import TreeSnapshotStore, tree_snapshots
+from app.utils.tree_index import TreeIndex
+
+
+def _names(node) -> list[str]:
+    return [child.name for child in node.children]
+
+
+def _make_tree(root: Path) -> None:
+    (root / "docs").mkdir()
+    (root / "docs" / "guide.md").write_text("# guide")
+    (root / "readme.md").write_text("# readme")
+    (root / "notes.txt").write_text("x")
+
+
+class TestTreeIndexScans:
+    """Unit Tests - TreeIndex.from_scans / to_scans"""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """상대 경로 탐색 결과로 복원한 인덱스는 탐색 결과와 같은 트리"""
+        _make_tree(tmp_path)
+        for md_only in (True, False):
+            built = TreeIndex.build(str(tmp_path), md_only)
+            restored = TreeIndex.from_scans(str(tmp_path), md_only, built.to_scans())
+
+            assert restored.to_tree() == built.to_tree()
+            assert restored.to_scans() == built.to_scans()
+
+
+class TestTreeSnapshotStore:
+    """Unit Tests - TreeSnapshotStore"""
+
+    def test_save_and_load(self, client: TestClient, tmp_path: Path) -> None:
+        """저장 후 같은 경로로만 복원"""
+        _make_tree(tmp_path)
+        store = TreeSnapshotStore(save_delay=60.0)
+        index = TreeIndex.build(str(tmp_path), md_only=True)
+
+        assert store.load(1, str(tmp_path), True) is None
+        store.schedule_save(1, str(tmp_path), True, index)
+        assert store.pending_count == 1
+        store.flush()
+        assert store.pending_count == 0
+
+        restored = store.load(1, str(tmp_path), True)
+        assert restored is not None
+        assert restored.to_tree() == index.to_tree()
+        assert store.load(1, str(tmp_path), False) is None
+        assert store.load(1, str(tmp_path / "docs"), True) is None
+
+    def test_cancel_drops_pending_save(self, client: TestClient, tmp_path: Path) -> None:
+        """폴더 제거 시 대기 중인 저장 취소"""
+        store = TreeSnapshotStore(save_delay=60.0)
+        store.schedule_save(1, str(tmp_path), True, TreeIndex.build(str(tmp_path), True))
+        store.cancel(1)
+        store.flush()
+
+        assert store.load(1, str(tmp_path), True) is None
+
+    def test_continuous_changes_saved_by_max_delay(self, client: TestClient, tmp_path: Path) -> None:
+        """변경이 debounce 간격보다 자주 이어져도 첫 변경 후 max_delay 안에 저장"""
+        store = TreeSnapshotStore(save_delay=0.3, max_delay=0.5)
+        index = TreeIndex.build(str(tmp_path), md_only=True)
+
+        deadline = time.monotonic() + 5.0
+        while store.load(1, str(tmp_path), True) is None and time.monotonic() < deadline:
+            store.schedule_save(1, str(tmp_path), True, index)
+            time.sleep(0.05)
+
+        assert store.load(1, str(tmp_path), True) is not None
+        assert time.monotonic() < deadline
+        store.scheduler.stop()
+
+
+class TestSnapshotTreeCache:
+    """TreeCache + 스냅샷: 첫 조회 즉시 응답 후 백그라운드 대조"""
+
+    def test_first_request_served_from_snapshot(self, client: TestClient, tmp_path: Path) -> None:
+        """재시작 후 첫 조회는 스냅샷으로 응답, 대조 후 디스크 차이 반영 및 알림"""
+        _make_tree(tmp_path)
+        store = TreeSnapshotStore(save_delay=60.0)
+        TreeCache(snapshot_store=store).get_tree(1, str(tmp_path))
+        store.flush()
+
+        # 재시작 사이의 변경 (감시 이벤트 없음)
+        (tmp_path / "readme.md").unlink()
+        (tmp_path / "docs" / "new.md").write_text("# new")
+        (tmp_path / "extra").mkdir()
+        (tmp_path / "extra" / "more.md").write_text("# more")
+
+        drift = []
+        cache = TreeCache(snapshot_store=store)
+        cache.set_drift_callback(lambda folder_id, changes: drift.append((folder_id, changes)))
+        tree = cache.get_tree(1, str(tmp_path))
+        assert cache.wait_reconciled(timeout=5.0)
+
+        assert _names(tree) == ["docs", "readme.md"]
+        tree = cache.get_tree(1, str(tmp_path))
+        assert _names(tree) == ["docs", "extra"]
+        assert _names(tree.children[0]) == ["guide.md", "new.md"]
+        assert drift == [(1, [
+            (str(tmp_path / "docs" / "new.md"), "created"),
+            (str(tmp_path / "extra" / "more.md"), "created"),
+            (str(tmp_path / "readme.md"), "deleted"),
+        ])]
+
+        # 대조 결과도 저장됨
+        store.flush()
+        restored = store.load(1, str(tmp_path), True)
+        assert restored.to_tree() == tree
+
+    def test_unchanged_disk_no_drift(self, client: TestClient, tmp_path: Path) -> None:
+        """디스크가 그대로면 알림 없음"""
+        _make_tree(tmp_path)
+        store = TreeSnapshotStore(save_delay=60.0)
+        TreeCache(snapshot_store=store).get_tree(1, str(tmp_path))
+        store.flush()
+
+        drift = []
+        cache = TreeCache(snapshot_store=store)
+        cache.set_drift_callback(lambda folder_id, changes: drift.append(changes))
+        cache.get_tree(1, str(tmp_path))
+
+        assert cache.wait_reconciled(timeout=5.0)
+        assert drift == []
+
+    def test_change_schedules_save(self, client: TestClient, tmp_path: Path) -> None:
+        """감시 이벤트로 인덱스가 바뀌면 저장 예약"""
+        store = TreeSnapshotStore(save_delay=60.0)
+        cache = TreeCache(snapshot_store=store)
+        cache.get_tree(1, str(tmp_path))
+        store.flush()
+
+        (tmp_path / "a.md").write_text("# A")
+        cache.apply_change(1, str(tmp_path / "a.md"))
+        assert store.pending_count == 1
+
+        cache.remove_folder(1)
+        assert store.pending_count == 0
+
+
+class TestSnapshotApi:
+    """API - 폴더 삭제 시 스냅샷 정리"""
+
+    def test_folder_delete_removes_snapshots(self, client: TestClient, db: Session, temp_dir: Path) -> None:
+        """트리 조회로 저장된 스냅샷은 폴더 삭제 시 함께 삭제"""
+        (temp_dir / "a.md").write_text("# A")
+        folder_id = client.post("/api/folders", json={"name": "Docs", "path": str(temp_dir)}).json()["id"]
+
+        assert client.get(f"/api/folders/{folder_id}/tree").status_code == 200
+        tree_cache.wait_reconciled(timeout=5.0)
+        tree_snapshots.flush()
+        assert db.query(FolderTreeSnapshot).filter_by(folder_id=folder_id).count() == 1
+
+        assert client.delete(f"/api/folders/{folder_id}").status_code in (200, 204)
+        db.expire_all()
+        assert db.query(FolderTreeSnapshot).filter_by(folder_id=folder_id).count() == 0
@@ -2,6 +2,7 @@ import type { Metadata } from 'next';
 import { Inter, JetBrains_Mono } from 'next/font/google';
 import './globals.css';
 import { AppStateProvider } from '@/lib/appState';
+import { WatchSocketProvider } from '@/lib/watchSocket';
 
 const inter = Inter({
     subsets: ['latin'],
@@ -30,7 +31,9 @@ export default function RootLayout({
             <body
                 className={`${inter.variable} ${jetbrainsMono.variable} font-sans bg-main text-primary antialiased h-screen overflow-hidden`}
             >
-                <AppStateProvider>{children}</AppStateProvider>
+                <AppStateProvider>
+                    <WatchSocketProvider>{children}</WatchSocketProvider>
+                </AppStateProvider>
             </body>
         </html>
     );
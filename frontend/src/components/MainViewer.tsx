@@ -16,7 +16,7 @@ const MarkdownViewer = dynamic(() => import('./MarkdownViewer'), {
 
 export default function MainViewer() {
     const { selectedFile } = useAppState();
-    const { content, loading, error } = useFileContent(selectedFile);
+    const { content, loading, error } = useFileContent(selectedFile, { live: true });
 
     const handleCopy = async () => {
         if (!content) return;
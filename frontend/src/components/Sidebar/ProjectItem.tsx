@@ -28,6 +28,7 @@ interface ProjectItemProps {
     folder: FolderData;
     onDelete: () => void;
     refreshTrigger: number;
+    onExpandedChange?: (expanded: boolean) => void;
 }
 
 
@@ -35,6 +36,7 @@ export default function ProjectItem({
     folder,
     onDelete,
     refreshTrigger,
+    onExpandedChange,
 }: ProjectItemProps) {
     const [isExpanded, setIsExpanded] = useState(false);
     const [isHovered, setIsHovered] = useState(false);
@@ -56,11 +58,18 @@ export default function ProjectItem({
     }, [folder.id]);
 
     // 토글 핸들러
+    // 접힌 동안은 변경 이벤트를 구독하지 않으므로 펼칠 때마다 트리를 다시 조회
     const handleToggle = async () => {
-        if (!isExpanded && !treeData) {
-            await loadTree();
+        const expanded = !isExpanded;
+        onExpandedChange?.(expanded);
+        if (expanded) {
+            if (treeData) {
+                loadTree();
+            } else {
+                await loadTree();
+            }
         }
-        setIsExpanded(!isExpanded);
+        setIsExpanded(expanded);
     };
 
     // refreshTrigger 변경 시 트리 갱신 (이미 펼쳐져 있는 경우만)
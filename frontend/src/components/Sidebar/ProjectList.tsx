@@ -16,6 +16,7 @@ interface ProjectListProps {
     onDeleteFolder: (id: number) => void;
     onRetry: () => void;
     refreshTriggers: Record<number, number>;
+    onExpandedChange?: (folderId: number, expanded: boolean) => void;
 }
 
 // 로딩 스켈레톤
@@ -67,6 +68,7 @@ export default function ProjectList({
     onDeleteFolder,
     onRetry,
     refreshTriggers,
+    onExpandedChange,
 }: ProjectListProps) {
     if (isLoading) {
         return <LoadingSkeleton />;
@@ -88,6 +90,7 @@ export default function ProjectList({
                     folder={folder}
                     onDelete={() => onDeleteFolder(folder.id)}
                     refreshTrigger={refreshTriggers[folder.id] || 0}
+                    onExpandedChange={(expanded) => onExpandedChange?.(folder.id, expanded)}
                 />
             ))}
         </div>
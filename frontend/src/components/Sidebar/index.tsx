@@ -15,7 +15,8 @@ export default function Sidebar() {
         error,
         refreshTriggers,
         loadFolders,
-        deleteFolder
+        deleteFolder,
+        setFolderExpanded
     } = useFolderTree(refreshTrigger);
 
     const [isResizing, setIsResizing] = useState(false);
@@ -55,6 +56,7 @@ export default function Sidebar() {
                     onDeleteFolder={deleteFolder}
                     onRetry={loadFolders}
                     refreshTriggers={refreshTriggers}
+                    onExpandedChange={setFolderExpanded}
                 />
             </div>
 
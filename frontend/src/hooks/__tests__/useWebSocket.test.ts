@@ -8,6 +8,7 @@ describe('useWebSocket', () => {
         send: jest.Mock;
         onopen: () => void;
         onclose: () => void;
+        onmessage?: (event: { data: string }) => void;
     };
 
     let mockWebSocket: MockWebSocket;
@@ -99,6 +100,22 @@ describe('useWebSocket', () => {
         expect((global as any).WebSocket).toHaveBeenCalledTimes(4);
     });
 
+    it('should resume with since and resumeQuery on reconnect', () => {
+        renderHook(() => useWebSocket({
+            url: 'ws://test.com',
+            retryInterval: 1000,
+            resumeQuery: () => 'folder_ids=1,2',
+        }));
+
+        act(() => { mockWebSocket.onopen(); });
+        act(() => { mockWebSocket.onmessage?.({ data: JSON.stringify({ type: 'file_change', seq: 42 }) }); });
+        act(() => { mockWebSocket.onclose(); });
+        act(() => { jest.advanceTimersByTime(1000); });
+
+        // eslint-disable-next-line @typescript-eslint/no-explicit-any
+        expect((global as any).WebSocket).toHaveBeenLastCalledWith('ws://test.com?since=42&folder_ids=1,2');
+    });
+
     it('should stop reconnecting after maxRetryCount', () => {
         renderHook(() => useWebSocket({ url: 'ws://test.com', retryInterval: 1000, maxRetryCount: 2 }));
 
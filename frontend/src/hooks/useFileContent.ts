@@ -1,15 +1,61 @@
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useEffect, useCallback, useRef } from 'react';
 import { fetchClient, ApiError } from '@/lib/api';
+import { sha256 } from '@/lib/sha256';
+import { useWatchSocket } from '@/lib/watchSocket';
 
-export function useFileContent(filePath: string | null) {
+interface FileContentOptions {
+    // 열람 중인 파일이 수정되면 WebSocket으로 변경분을 받아 적용
+    live?: boolean;
+}
+
+// 서버 기준 버전 (view_file 응답)
+type FileVersionMessage = {
+    type: 'file_version';
+    path: string;
+    hash: string;
+};
+
+// 줄 단위 변경분 ([시작 줄, 끝 줄(제외), 새 텍스트]) 또는 전체 내용
+type FileDeltaMessage = {
+    type: 'file_delta';
+    path: string;
+    base_hash: string;
+    hash: string;
+    ops?: [number, number, string][];
+    content?: string;
+};
+
+// 줄 끝 문자를 유지한 줄 분할 (서버 split_lines와 동일하게 \n 기준)
+function splitLines(text: string): string[] {
+    return text.match(/[^\n]*\n|[^\n]+$/g) || [];
+}
+
+// 변경분 적용 (뒤에서부터 적용하여 앞쪽 줄 번호 유지)
+function applyDelta(base: string, ops: [number, number, string][]): string {
+    const lines = splitLines(base);
+    for (let i = ops.length - 1; i >= 0; i--) {
+        const [start, end, text] = ops[i];
+        lines.splice(start, end - start, ...(text ? [text] : []));
+    }
+    return lines.join('');
+}
+
+export function useFileContent(filePath: string | null, { live = false }: FileContentOptions = {}) {
     const [content, setContent] = useState<string>('');
     const [loading, setLoading] = useState<boolean>(false);
     const [error, setError] = useState<string | null>(null);
+    // 현재 표시 중인 내용과 해시 (변경분 적용 기준)
+    const contentRef = useRef<string>('');
+    const hashRef = useRef<string | null>(null);
+    const filePathRef = useRef<string | null>(filePath);
+    filePathRef.current = filePath;
 
     const fetchContent = useCallback(async () => {
         if (!filePath) {
             setContent('');
             setError(null);
+            contentRef.current = '';
+            hashRef.current = null;
             return;
         }
 
@@ -18,6 +64,8 @@ export function useFileContent(filePath: string | null) {
         try {
             const data = await fetchClient<{ content: string }>(`/api/files?path=${encodeURIComponent(filePath)}`);
             setContent(data.content);
+            contentRef.current = data.content;
+            hashRef.current = live ? await sha256(data.content) : null;
         } catch (err) {
             console.error('API Error:', err);
             if (err instanceof ApiError) {
@@ -29,13 +77,85 @@ export function useFileContent(filePath: string | null) {
         } finally {
             setLoading(false);
         }
-    }, [filePath]);
+    }, [filePath, live]);
 
     // filePath 변경 시 자동 로드
     useEffect(() => {
         fetchContent();
     }, [fetchContent]);
 
+    // 변경분 수신 (기준 해시가 다르거나 적용 결과가 다르면 전체 재조회)
+    const handleMessage = useCallback(async (data: unknown) => {
+        const message = data as FileVersionMessage | FileDeltaMessage;
+        if (message.path !== filePathRef.current) {
+            return;
+        }
+        if (message.type === 'file_version') {
+            // 아직 로드 전이면 로드 결과를 사용 (이후 변경분의 base_hash로 검증)
+            if (hashRef.current !== null && message.hash !== hashRef.current) {
+                fetchContent();
+            }
+            return;
+        }
+        if (message.type !== 'file_delta') {
+            return;
+        }
+        if (message.base_hash !== hashRef.current) {
+            fetchContent();
+            return;
+        }
+        const next = message.ops ? applyDelta(contentRef.current, message.ops) : message.content ?? '';
+        if ((await sha256(next)) !== message.hash) {
+            fetchContent();
+            return;
+        }
+        contentRef.current = next;
+        hashRef.current = message.hash;
+        setContent(next);
+    }, [fetchContent]);
+
+    // 사이드바와 같은 WebSocket 연결 사용 (변경분 메시지만 처리)
+    const { send, addMessageListener, addOpenListener } = useWatchSocket();
+    // 현재 연결에 열람 등록한 경로 (같은 경로는 연결당 1회만 등록)
+    const viewedRef = useRef<string | null>(null);
+
+    useEffect(() => {
+        if (!live) {
+            return;
+        }
+        return addMessageListener(handleMessage);
+    }, [live, addMessageListener, handleMessage]);
+
+    // 열람 파일 변경 시 서버에 등록/해제 (연결 전이면 연결 시 등록)
+    useEffect(() => {
+        if (!live || !filePath) {
+            return;
+        }
+        if (viewedRef.current !== filePath && send({ type: 'view_file', path: filePath })) {
+            viewedRef.current = filePath;
+        }
+        return () => {
+            if (viewedRef.current === filePath) {
+                send({ type: 'unview_file', path: filePath });
+                viewedRef.current = null;
+            }
+        };
+    }, [live, filePath, send]);
+
+    // 연결(재연결) 시 서버는 열람 정보를 잃으므로 다시 등록
+    useEffect(() => {
+        if (!live) {
+            return;
+        }
+        return addOpenListener(() => {
+            viewedRef.current = null;
+            const path = filePathRef.current;
+            if (path && send({ type: 'view_file', path })) {
+                viewedRef.current = path;
+            }
+        });
+    }, [live, addOpenListener, send]);
+
     return {
         content,
         loading,
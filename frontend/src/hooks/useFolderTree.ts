@@ -1,6 +1,6 @@
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useEffect, useCallback, useRef } from 'react';
 import { fetchClient, ApiError } from '@/lib/api';
-import { useWebSocket } from './useWebSocket';
+import { useWatchSocket } from '@/lib/watchSocket';
 
 export interface Folder {
     id: number;
@@ -14,6 +14,8 @@ export function useFolderTree(refreshTrigger: number) {
     const [isLoading, setIsLoading] = useState(true);
     const [error, setError] = useState<string | null>(null);
     const [refreshTriggers, setRefreshTriggers] = useState<Record<number, number>>({});
+    // 펼쳐진 프로젝트 (해당 폴더 이벤트만 구독)
+    const expandedRef = useRef<Set<number>>(new Set());
 
     // 폴더 목록 로드
     const loadFolders = useCallback(async () => {
@@ -46,12 +48,36 @@ export function useFolderTree(refreshTrigger: number) {
         folder_id?: number;
     };
 
+    // 같은 debounce 구간의 변경 묶음 (브랜치 전환 등 대량 변경)
+    type FileChangesEvent = {
+        type: 'file_changes';
+        folder_id?: number;
+        changes: { event: string; path: string }[];
+    };
+
+    // 서버 송신 큐 초과로 이벤트가 유실되었거나 재연결 시 놓친 이벤트를 재전송할 수 없는 경우
+    type ResyncEvent = {
+        type: 'resync' | 'resync_required';
+    };
+
     const handleFileChange = useCallback((data: unknown) => {
-        const message = data as FileChangeEvent;
-        if (message.type === 'file_change') {
-            // console.log(`[useFolderTree] 파일 변경 감지: ${data.event} - ${data.path}`);
+        const message = data as FileChangeEvent | FileChangesEvent | ResyncEvent;
+        if (message.type === 'resync' || message.type === 'resync_required') {
+            // 폴더 목록 재조회 + 모든 프로젝트 트리 갱신
+            loadFolders();
+            setRefreshTriggers(prev => {
+                const next: Record<number, number> = { ...prev };
+                folders.forEach(folder => {
+                    next[folder.id] = (prev[folder.id] || 0) + 1;
+                });
+                return next;
+            });
+            return;
+        }
+        if (message.type === 'file_change' || message.type === 'file_changes') {
+            // console.log(`[useFolderTree] 파일 변경 감지: ${message.type} - ${message.folder_id}`);
 
-            // 폴더 ID가 있으면 해당 프로젝트만 트리 갱신 트리거
+            // 폴더 ID가 있으면 해당 프로젝트만 트리 갱신 트리거 (묶음도 1회만 갱신)
             if (message.folder_id) {
                 setRefreshTriggers(prev => ({
                     ...prev,
@@ -63,16 +89,31 @@ export function useFolderTree(refreshTrigger: number) {
                 loadFolders();
             }
         }
-    }, [loadFolders]);
+    }, [loadFolders, folders]);
+
+    // WebSocket 연결은 뷰어(useFileContent)와 공유
+    const { send, addMessageListener, addOpenListener } = useWatchSocket();
+
+    useEffect(() => addMessageListener(handleFileChange), [addMessageListener, handleFileChange]);
 
-    useWebSocket({
-        url: `${process.env.NEXT_PUBLIC_WS_URL || 'ws://127.0.0.1:8000'}/ws/watch`,
-        onMessage: handleFileChange,
-        onOpen: () => {
-            // 연결 시 최신 상태 동기화를 위해 한 번 로드
+    useEffect(() => addOpenListener(({ resumed }) => {
+        // 펼쳐진 프로젝트만 구독 (재연결 시에도 다시 전송)
+        send({ type: 'subscribe', folder_ids: Array.from(expandedRef.current) });
+        // 첫 연결 시에만 전체 로드, 재연결은 서버가 놓친 이벤트(또는 resync_required)를 보내줌
+        if (!resumed) {
             loadFolders();
         }
-    });
+    }), [addOpenListener, send, loadFolders]);
+
+    // 프로젝트 펼침/접힘 시 구독 갱신
+    const setFolderExpanded = useCallback((folderId: number, expanded: boolean) => {
+        if (expanded) {
+            expandedRef.current.add(folderId);
+        } else {
+            expandedRef.current.delete(folderId);
+        }
+        send({ type: expanded ? 'subscribe' : 'unsubscribe', folder_ids: [folderId] });
+    }, [send]);
 
     // 폴더 삭제 핸들러
     const deleteFolder = async (folderId: number): Promise<boolean> => {
@@ -87,6 +128,9 @@ export function useFolderTree(refreshTrigger: number) {
 
             // 목록에서 제거
             setFolders((prev) => prev.filter((f) => f.id !== folderId));
+            if (expandedRef.current.has(folderId)) {
+                setFolderExpanded(folderId, false);
+            }
             return true;
         } catch (err) {
             if (err instanceof ApiError) {
@@ -104,6 +148,7 @@ export function useFolderTree(refreshTrigger: number) {
         error,
         refreshTriggers,
         loadFolders,
-        deleteFolder
+        deleteFolder,
+        setFolderExpanded
     };
 }
@@ -3,8 +3,10 @@ import { useState, useEffect, useCallback, useRef } from 'react';
 interface WebSocketOptions {
     url: string;
     onMessage?: (data: unknown) => void;
-    onOpen?: () => void;
+    onOpen?: (info: { resumed: boolean }) => void;
     onClose?: () => void;
+    // 재연결(?since=) 시 함께 보낼 쿼리 (예: folder_ids=1,2 - 구독 폴더 이벤트만 재전송)
+    resumeQuery?: () => string | null;
     retryInterval?: number;
     maxRetryInterval?: number;
     maxRetryCount?: number;
@@ -15,6 +17,7 @@ export function useWebSocket({
     onMessage,
     onOpen,
     onClose,
+    resumeQuery,
     retryInterval = 1000,
     maxRetryInterval = 30000,
     maxRetryCount = 5
@@ -23,18 +26,22 @@ export function useWebSocket({
     const wsRef = useRef<WebSocket | null>(null);
     const retryCountRef = useRef(0);
     const reconnectTimeoutRef = useRef<NodeJS.Timeout | null>(null);
+    // 마지막으로 받은 이벤트 seq (재연결 시 ?since=로 놓친 이벤트만 수신)
+    const lastSeqRef = useRef<number | null>(null);
 
     // Event handlers refs to prevent reconnection on handler change
     const onMessageRef = useRef(onMessage);
     const onOpenRef = useRef(onOpen);
     const onCloseRef = useRef(onClose);
+    const resumeQueryRef = useRef(resumeQuery);
 
     // Update refs on render
     useEffect(() => {
         onMessageRef.current = onMessage;
         onOpenRef.current = onOpen;
         onCloseRef.current = onClose;
-    }, [onMessage, onOpen, onClose]);
+        resumeQueryRef.current = resumeQuery;
+    }, [onMessage, onOpen, onClose, resumeQuery]);
 
     const connect = useCallback(() => {
         if (!url) return;
@@ -44,7 +51,13 @@ export function useWebSocket({
             wsRef.current.close();
         }
 
-        const ws = new WebSocket(url);
+        const since = lastSeqRef.current;
+        let target = url;
+        if (since !== null) {
+            const extra = resumeQueryRef.current?.();
+            target = `${url}${url.includes('?') ? '&' : '?'}since=${since}${extra ? `&${extra}` : ''}`;
+        }
+        const ws = new WebSocket(target);
         wsRef.current = ws;
 
         ws.onopen = () => {
@@ -55,12 +68,15 @@ export function useWebSocket({
                 clearTimeout(reconnectTimeoutRef.current);
                 reconnectTimeoutRef.current = null;
             }
-            onOpenRef.current?.();
+            onOpenRef.current?.({ resumed: since !== null });
         };
 
         ws.onmessage = (event) => {
             try {
                 const data = JSON.parse(event.data);
+                if (typeof data?.seq === 'number') {
+                    lastSeqRef.current = data.seq;
+                }
                 onMessageRef.current?.(data);
             } catch (error) {
                 console.error('[useWebSocket] Message parse error:', error);
@@ -111,5 +127,15 @@ export function useWebSocket({
         };
     }, [connect]);
 
-    return { isConnected };
+    // JSON 메시지 전송 (연결되지 않은 경우 false)
+    const send = useCallback((data: unknown) => {
+        const ws = wsRef.current;
+        if (!ws || ws.readyState !== WebSocket.OPEN) {
+            return false;
+        }
+        ws.send(JSON.stringify(data));
+        return true;
+    }, []);
+
+    return { isConnected, send };
 }
@@ -0,0 +1,26 @@
+import { sha256, sha256Sync } from '../sha256';
+
+describe('sha256', () => {
+    const encode = (text: string) => new TextEncoder().encode(text);
+
+    it('matches known digests', () => {
+        expect(sha256Sync(encode(''))).toBe('e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855');
+        expect(sha256Sync(encode('abc'))).toBe('ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad');
+    });
+
+    it('handles padding boundaries and multi-byte text', () => {
+        // 55/56바이트: 길이 필드가 같은 블록/다음 블록에 들어가는 경계
+        expect(sha256Sync(encode('a'.repeat(55)))).toBe('9f4390f8d30c2dd92ec9f095b65e2b9ae9b0a925a5258e241c9f1e910f734318');
+        expect(sha256Sync(encode('a'.repeat(56)))).toBe('b35439a4ac6f0948b6d6f9e3c6af0f5f590ce20f1bde7090ef7970686ec6738a');
+    });
+
+    it('falls back to the JS implementation without crypto.subtle', async () => {
+        const original = globalThis.crypto;
+        Object.defineProperty(globalThis, 'crypto', { value: {}, configurable: true });
+        try {
+            expect(await sha256('abc')).toBe('ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad');
+        } finally {
+            Object.defineProperty(globalThis, 'crypto', { value: original, configurable: true });
+        }
+    });
+});
@@ -0,0 +1,80 @@
+'use client';
+
+import { createContext, useCallback, useContext, useMemo, useRef } from 'react';
+import { useWebSocket } from '@/hooks/useWebSocket';
+
+type MessageListener = (data: unknown) => void;
+type OpenListener = (info: { resumed: boolean }) => void;
+
+type WatchSocket = {
+    isConnected: boolean;
+    // JSON 메시지 전송 (연결되지 않은 경우 false)
+    send: (data: unknown) => boolean;
+    // 수신 메시지 리스너 등록 (해제 함수 반환)
+    addMessageListener: (listener: MessageListener) => () => void;
+    // 연결(재연결 포함) 리스너 등록 (해제 함수 반환)
+    addOpenListener: (listener: OpenListener) => () => void;
+};
+
+const WatchSocketContext = createContext<WatchSocket | undefined>(undefined);
+
+// /ws/watch 연결 1개를 사이드바(폴더 이벤트)와 뷰어(열람 파일 변경분)가 공유
+export function WatchSocketProvider({ children }: { children: React.ReactNode }) {
+    const messageListenersRef = useRef<Set<MessageListener>>(new Set());
+    const openListenersRef = useRef<Set<OpenListener>>(new Set());
+    // 서버가 마지막으로 알려준 구독 폴더 (재연결 시 이 폴더 이벤트만 재전송받음, 구독 전이면 null)
+    const subscriptionsRef = useRef<number[] | null>(null);
+
+    const handleMessage = useCallback((data: unknown) => {
+        const message = data as { type?: string; folder_ids?: number[] };
+        if (message?.type === 'subscriptions' && Array.isArray(message.folder_ids)) {
+            subscriptionsRef.current = message.folder_ids;
+        }
+        messageListenersRef.current.forEach((listener) => listener(data));
+    }, []);
+
+    const resumeQuery = useCallback(
+        () => (subscriptionsRef.current === null ? null : `folder_ids=${subscriptionsRef.current.join(',')}`),
+        [],
+    );
+
+    const handleOpen = useCallback((info: { resumed: boolean }) => {
+        openListenersRef.current.forEach((listener) => listener(info));
+    }, []);
+
+    const { isConnected, send } = useWebSocket({
+        url: `${process.env.NEXT_PUBLIC_WS_URL || 'ws://127.0.0.1:8000'}/ws/watch`,
+        onMessage: handleMessage,
+        onOpen: handleOpen,
+        resumeQuery,
+    });
+
+    const addMessageListener = useCallback((listener: MessageListener) => {
+        messageListenersRef.current.add(listener);
+        return () => {
+            messageListenersRef.current.delete(listener);
+        };
+    }, []);
+
+    const addOpenListener = useCallback((listener: OpenListener) => {
+        openListenersRef.current.add(listener);
+        return () => {
+            openListenersRef.current.delete(listener);
+        };
+    }, []);
+
+    const value = useMemo(
+        () => ({ isConnected, send, addMessageListener, addOpenListener }),
+        [isConnected, send, addMessageListener, addOpenListener],
+    );
+
+    return <WatchSocketContext.Provider value={value}>{children}</WatchSocketContext.Provider>;
+}
+
+export function useWatchSocket() {
+    const context = useContext(WatchSocketContext);
+    if (!context) {
+        throw new Error('useWatchSocket must be used within WatchSocketProvider');
+    }
+    return context;
+}
@@ -0,0 +1,135 @@
+"""
+build_tree 벤치마크
+
+Path.iterdir 기반 기존 탐색기와 os.scandir 기반 탐색기를 비교한다.
+- 동일한 TreeNode 출력 여부 검증
+- stat 계열 시스템 콜 횟수 및 소요 시간 측정
+
+사용법:
+    cd backend && python ../scripts/bench_tree_builder.py --entries 100000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from app.schemas.folder import TreeNode  # noqa: E402
+from app.utils.tree_builder import COMMON_IGNORED_DIRS, build_tree  # noqa: E402
+
+
+def legacy_build_tree(path, md_only=True):
+    """기존 Path.iterdir 기반 구현 (비교용)"""
+    folder_path = Path(path)
+    children = []
+    try:
+        items = sorted(folder_path.iterdir(), key=lambda x: x.name.lower())
+    except PermissionError:
+        return TreeNode(name=folder_path.name, type="directory", children=[])
+
+    dirs = [item for item in items if item.is_dir() and not item.is_symlink()]
+    files = [item for item in items if item.is_file() and not item.is_symlink()]
+
+    for item in dirs:
+        if item.name.startswith(".") or item.name in COMMON_IGNORED_DIRS:
+            continue
+        children.append(legacy_build_tree(str(item), md_only))
+
+    for item in files:
+        if item.name.startswith("."):
+            continue
+        if md_only and not item.name.lower().endswith(".md"):
+            continue
+        children.append(TreeNode(name=item.name, type="file", path=str(item)))
+
+    return TreeNode(name=folder_path.name, type="directory", children=children)
+
+
+def make_fixture(root, entries, fanout=50):
+    """entries개 항목(폴더 + 파일)을 가진 테스트 트리 생성"""
+    created = 0
+    level = [root]
+    while created < entries:
+        next_level = []
+        for parent in level:
+            for i in range(fanout):
+                if created >= entries:
+                    break
+                if i % 10 == 0:
+                    child = os.path.join(parent, f"dir_{created}")
+                    os.mkdir(child)
+                    next_level.append(child)
+                else:
+                    ext = ".md" if i % 3 == 0 else ".txt"
+                    with open(os.path.join(parent, f"File_{created}{ext}"), "w") as f:
+                        f.write("x")
+                created += 1
+        level = next_level or level
+
+
+class StatCounter:
+    """os.stat / os.lstat 호출 횟수 측정"""
+
+    def __init__(self):
+        self.count = 0
+        self._stat = os.stat
+        self._lstat = os.lstat
+
+    def __enter__(self):
+        def counted(func):
+            def wrapper(*args, **kwargs):
+                self.count += 1
+                return func(*args, **kwargs)
+            return wrapper
+
+        os.stat = counted(self._stat)
+        os.lstat = counted(self._lstat)
+        return self
+
+    def __exit__(self, *exc):
+        os.stat = self._stat
+        os.lstat = self._lstat
+
+
+def measure(func, root, md_only, repeat):
+    with StatCounter() as counter:
+        result = func(root, md_only)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(root, md_only)
+        timings.append(time.perf_counter() - start)
+    return result, counter.count, min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--all-files", action="store_true", help="md_only=False로 측정")
+    parser.add_argument("--workers", type=int, default=1, help="병렬 탐색 스레드 수")
+    args = parser.parse_args()
+    md_only = not args.all_files
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        print(f"픽스처 생성 중: {args.entries} entries")
+        make_fixture(tmpdir, args.entries)
+
+        legacy_tree, legacy_stats, legacy_time = measure(legacy_build_tree, tmpdir, md_only, args.repeat)
+        tree, stats, elapsed = measure(
+            lambda root, md_only: build_tree(root, md_only, args.workers), tmpdir, md_only, args.repeat
+        )
+
+        assert tree == legacy_tree, "출력 불일치"
+        print(f"{'':<10}{'stat calls':>12}{'time (s)':>12}")
+        print(f"{'legacy':<10}{legacy_stats:>12}{legacy_time:>12.3f}")
+        print(f"{'scandir':<10}{stats:>12}{elapsed:>12.3f}")
+        print(f"speedup: {legacy_time / elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()